@@ -0,0 +1,365 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides the ``MaterialLibrary`` class."""
+
+from collections.abc import Iterator, Mapping, MutableMapping
+from dataclasses import dataclass, field
+import math
+from typing import Any
+
+from ansys.units import Quantity
+import numpy as np
+
+from .models import Material, MaterialModel, TabularQuantity
+
+RangeKey = tuple[type[MaterialModel], str]
+Bound = float | Quantity | None
+
+
+def _to_si(value: float, quantity: Quantity) -> float:
+    """Convert a value in the units of a quantity to SI units."""
+    units = quantity.units
+    return float(value) * units.si_scaling_factor + units.si_offset
+
+
+def _get_scalar_properties(model: MaterialModel) -> Iterator[tuple[str, float]]:
+    """Yield the name and SI value of the dependent parameters of a model with one value."""
+    for name in model._get_dependent_parameter_names():
+        quantity = getattr(model, name, None)
+        if isinstance(quantity, TabularQuantity):
+            quantity = quantity.values
+        if not isinstance(quantity, Quantity):
+            continue
+        values = np.ravel(quantity.value)
+        if values.size != 1 or values.dtype.kind not in "biuf":
+            continue
+        value = _to_si(values[0], quantity)
+        if not math.isnan(value):
+            yield name, value
+
+
+def _bound_to_si(bound: Bound) -> float | None:
+    """Convert a bound of a range query to SI units."""
+    if isinstance(bound, Quantity):
+        return _to_si(np.ravel(bound.value)[0], bound)
+    return bound
+
+
+class _RangeIndex:
+    """Sorted index of the SI values of one scalar property of the materials."""
+
+    def __init__(self) -> None:
+        self._values: dict[str, float] = {}
+        self._sorted: tuple[np.ndarray, np.ndarray] | None = None
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def add(self, name: str, value: float) -> None:
+        self._values[name] = value
+        self._sorted = None
+
+    def remove(self, name: str) -> None:
+        del self._values[name]
+        self._sorted = None
+
+    def copy(self) -> "_RangeIndex":
+        range_index = _RangeIndex()
+        range_index._values = self._values.copy()
+        range_index._sorted = self._sorted
+        return range_index
+
+    def find(self, lower: float | None, upper: float | None) -> set[str]:
+        """Get the names of the materials with a value between the inclusive bounds."""
+        if self._sorted is None:
+            values = np.fromiter(self._values.values(), dtype=float, count=len(self._values))
+            names = np.array(list(self._values), dtype=object)
+            order = np.argsort(values, kind="stable")
+            self._sorted = (values[order], names[order])
+        values, names = self._sorted
+        start = 0 if lower is None else np.searchsorted(values, lower, side="left")
+        stop = len(values) if upper is None else np.searchsorted(values, upper, side="right")
+        return set(names[start:stop].tolist())
+
+
+@dataclass
+class _IndexEntry:
+    """Keys under which a material is indexed."""
+
+    mat_id: Any
+    guid: str | None
+    model_classes: set[type[MaterialModel]] = field(default_factory=set)
+    range_keys: set[RangeKey] = field(default_factory=set)
+
+
+class MaterialLibrary(MutableMapping):
+    """
+    Store the materials of a library by name, with indexes for fast queries.
+
+    The library behaves as a dictionary of materials keyed by name. It also maintains
+    indexes of the materials by ID, GUID and model class, and a sorted index of the
+    scalar properties of the models, for example the density of a material with a
+    constant density. The indexes are updated when a material is added or removed, and
+    when the ID, GUID or models of a stored material change.
+
+    The property values are indexed when the material or its models are updated.
+    After changing the values of a model in place, call :meth:`reindex`.
+
+    A library created with ``observe=False`` does not follow the changes made to its
+    materials in place. Such libraries are used as snapshots shared between threads:
+    each version is copied with :meth:`copy`, modified, then frozen with
+    :meth:`freeze` so that it can be read without locking.
+    """
+
+    def __init__(
+        self, materials: Mapping[str, Material] | None = None, observe: bool = True
+    ) -> None:
+        """
+        Create a material library.
+
+        Parameters
+        ----------
+        materials : Mapping[str, Material] | None
+            Materials to store, keyed by name.
+        observe : bool
+            If True, the indexes are updated when the ID, GUID or models of a stored
+            material change.
+        """
+        self._materials: dict[str, Material] = {}
+        self._entries: dict[str, _IndexEntry] = {}
+        self._by_id: dict[Any, set[str]] = {}
+        self._by_guid: dict[str, set[str]] = {}
+        self._by_model_class: dict[type[MaterialModel], set[str]] = {}
+        self._ranges: dict[RangeKey, _RangeIndex] = {}
+        self._observe = observe
+        self._frozen = False
+        if materials:
+            self.update(materials)
+
+    def __getitem__(self, name: str) -> Material:
+        """Get a material by name."""
+        return self._materials[name]
+
+    def __setitem__(self, name: str, material: Material) -> None:
+        """Store a material under a name, replacing the material stored under it."""
+        self._check_not_frozen()
+        if name in self._materials:
+            del self[name]
+        self._materials[name] = material
+        if self._observe:
+            material._add_observer(self._on_material_changed)
+        self._index(name, material)
+
+    def __delitem__(self, name: str) -> None:
+        """Remove a material by name."""
+        self._check_not_frozen()
+        material = self._materials.pop(name)
+        self._unindex(name)
+        if self._observe and not self._get_names(material):
+            material._remove_observer(self._on_material_changed)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the material names."""
+        return iter(self._materials)
+
+    def __len__(self) -> int:
+        """Get the number of materials."""
+        return len(self._materials)
+
+    def __contains__(self, name: object) -> bool:
+        """Check if a material name is in the library."""
+        return name in self._materials
+
+    def __repr__(self) -> str:
+        """Return the representation of the dictionary of materials."""
+        return f"{self.__class__.__name__}({self._materials!r})"
+
+    @property
+    def frozen(self) -> bool:
+        """Whether the library is read-only."""
+        return self._frozen
+
+    def freeze(self) -> None:
+        """Make the library read-only."""
+        self._frozen = True
+
+    def _check_not_frozen(self) -> None:
+        if self._frozen:
+            raise TypeError("The material library is a read-only snapshot.")
+
+    def copy(self) -> "MaterialLibrary":
+        """
+        Copy the library and its indexes, without copying the materials.
+
+        Returns
+        -------
+        MaterialLibrary
+            A library that is not frozen, holding the same materials.
+        """
+        library = MaterialLibrary(observe=self._observe)
+        library._materials = self._materials.copy()
+        library._entries = self._entries.copy()
+        library._by_id = {key: names.copy() for key, names in self._by_id.items()}
+        library._by_guid = {key: names.copy() for key, names in self._by_guid.items()}
+        library._by_model_class = {key: names.copy() for key, names in self._by_model_class.items()}
+        library._ranges = {key: index.copy() for key, index in self._ranges.items()}
+        if self._observe:
+            for material in library._materials.values():
+                material._add_observer(library._on_material_changed)
+        return library
+
+    def _get_names(self, material: Material) -> list[str]:
+        """Get the names under which a material is stored."""
+        if self._materials.get(material.name, None) is material:
+            return [material.name]
+        return [name for name, stored in self._materials.items() if stored is material]
+
+    def _on_material_changed(self, material: Material) -> None:
+        """Reindex a stored material after its ID, GUID or models changed."""
+        for name in self._get_names(material):
+            self._unindex(name)
+            self._index(name, material)
+
+    def _index(self, name: str, material: Material) -> None:
+        entry = _IndexEntry(mat_id=material.mat_id, guid=material.guid)
+        if entry.mat_id is not None:
+            self._by_id.setdefault(entry.mat_id, set()).add(name)
+        if entry.guid is not None:
+            self._by_guid.setdefault(entry.guid, set()).add(name)
+        for model in material.models:
+            model_class = type(model)
+            entry.model_classes.add(model_class)
+            self._by_model_class.setdefault(model_class, set()).add(name)
+            for attribute, value in _get_scalar_properties(model):
+                key = (model_class, attribute)
+                entry.range_keys.add(key)
+                if key not in self._ranges:
+                    self._ranges[key] = _RangeIndex()
+                self._ranges[key].add(name, value)
+        self._entries[name] = entry
+
+    def _unindex(self, name: str) -> None:
+        entry = self._entries.pop(name)
+        for index, key in ((self._by_id, entry.mat_id), (self._by_guid, entry.guid)):
+            if key is not None:
+                self._discard(index, key, name)
+        for model_class in entry.model_classes:
+            self._discard(self._by_model_class, model_class, name)
+        for key in entry.range_keys:
+            range_index = self._ranges[key]
+            range_index.remove(name)
+            if not range_index:
+                del self._ranges[key]
+
+    @staticmethod
+    def _discard(index: dict, key: Any, name: str) -> None:
+        names = index[key]
+        names.discard(name)
+        if not names:
+            del index[key]
+
+    def reindex(self) -> None:
+        """Rebuild the indexes, for example after changing model values in place."""
+        self._check_not_frozen()
+        for name in list(self._entries):
+            self._unindex(name)
+        for name, material in self._materials.items():
+            self._index(name, material)
+
+    def get_by_guid(self, guid: str) -> Material | None:
+        """
+        Get a material by GUID.
+
+        Parameters
+        ----------
+        guid : str
+            GUID of the material.
+
+        Returns
+        -------
+        Material | None
+            The material with this GUID, or None if there is none.
+        """
+        names = self._by_guid.get(guid, None)
+        return self._materials[next(iter(names))] if names else None
+
+    def query(
+        self,
+        mat_id: Any = None,
+        guid: str | None = None,
+        model: type[MaterialModel] | None = None,
+        ranges: Mapping[RangeKey, tuple[Bound, Bound]] | None = None,
+    ) -> list[Material]:
+        """
+        Find the materials matching all the given criteria.
+
+        Parameters
+        ----------
+        mat_id : Any
+            ID of the materials.
+        guid : str | None
+            GUID of the materials.
+        model : type[MaterialModel] | None
+            Class of a model of the materials. Subclasses match too.
+        ranges : Mapping[tuple[type[MaterialModel], str], tuple[Bound, Bound]] | None
+            Inclusive lower and upper bounds of scalar properties, keyed by model class
+            and attribute name, for example ``{(Density, "density"): (7000, 8000)}``.
+            Bounds given as floats are in SI units, and None leaves a side open.
+            Properties whose model defines several values are not indexed.
+
+        Returns
+        -------
+        list[Material]
+            The matching materials, sorted by name.
+        """
+        candidates = []
+        if mat_id is not None:
+            candidates.append(self._by_id.get(mat_id, set()))
+        if guid is not None:
+            candidates.append(self._by_guid.get(guid, set()))
+        if model is not None:
+            candidates.append(
+                set().union(
+                    *(
+                        names
+                        for model_class, names in self._by_model_class.items()
+                        if issubclass(model_class, model)
+                    )
+                )
+            )
+        for (model_class, attribute), (lower, upper) in (ranges or {}).items():
+            lower, upper = _bound_to_si(lower), _bound_to_si(upper)
+            candidates.append(
+                set().union(
+                    *(
+                        range_index.find(lower, upper)
+                        for (indexed_class, indexed_attribute), range_index in self._ranges.items()
+                        if indexed_attribute == attribute and issubclass(indexed_class, model_class)
+                    )
+                )
+            )
+        if not candidates:
+            names = self._materials.keys()
+        else:
+            names = set.intersection(*sorted(candidates, key=len))
+        return [self._materials[name] for name in sorted(names)]
@@ -41,16 +41,18 @@ maps and do not use ``accept()``.
 from .base_visitor import BaseVisitor
 from .fluent import FluentWriter
 from .lsdyna import LsDynaWriter
-from .mapdl import MapdlWriter, read_mapdl
+from .mapdl import MapdlCommandCache, MapdlWriter, read_mapdl
 from .material_model_writer_visitor import MaterialModelWriterVisitor, UnsupportedMaterialModelError
-from .matml import MatmlReader, MatmlWriter
+from .matml import MatmlCache, MatmlReader, MatmlWriter
 
 __all__ = [
     "BaseVisitor",
     "FluentWriter",
     "LsDynaWriter",
+    "MapdlCommandCache",
     "MapdlWriter",
     "MaterialModelWriterVisitor",
+    "MatmlCache",
     "MatmlReader",
     "MatmlWriter",
     "UnsupportedMaterialModelError",
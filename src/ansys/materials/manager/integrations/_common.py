@@ -22,7 +22,9 @@
 
 from dataclasses import dataclass
 import os
-from typing import Any, Callable, Optional, Union
+from typing import Any, Callable, Optional, Sequence, Union
+
+import numpy as np
 
 from ..models import ModelQualifier
 
@@ -95,3 +97,64 @@ def get_creep_flag(qualifiers: list[ModelQualifier]) -> int:
                 return 0
             else:
                 return 1
+
+
+def format_number_list(
+    values: float | int | Sequence[float | int] | np.ndarray, precision: int | None = None
+) -> list[str]:
+    """
+    Format numbers as text.
+
+    Arrays are converted to Python numbers in one call and formatted with a single
+    mapped format function, instead of formatting the NumPy scalars one by one.
+
+    Parameters
+    ----------
+    values : float | int | Sequence[float | int] | np.ndarray
+        Number or numbers to format.
+    precision : int | None
+        Number of significant digits of the floats. If None, the shortest text that
+        parses back to the same float is used, which is the output of ``str``.
+        Integers are always written in full.
+
+    Returns
+    -------
+    list[str]
+        The formatted numbers.
+    """
+    if isinstance(values, np.ndarray):
+        values = values.ravel().tolist()
+    elif isinstance(values, (str, bytes)) or not hasattr(values, "__iter__"):
+        values = [values]
+    else:
+        values = [value.item() if isinstance(value, np.generic) else value for value in values]
+    if precision is None:
+        return list(map(str, values))
+    float_format = f"%.{precision}g".__mod__
+    return [float_format(value) if isinstance(value, float) else str(value) for value in values]
+
+
+def format_numbers(
+    values: float | int | Sequence[float | int] | np.ndarray,
+    precision: int | None = None,
+    separator: str = ", ",
+) -> str:
+    """
+    Format numbers as delimited text.
+
+    Parameters
+    ----------
+    values : float | int | Sequence[float | int] | np.ndarray
+        Number or numbers to format.
+    precision : int | None
+        Number of significant digits of the floats. If None, the shortest text that
+        parses back to the same float is used.
+    separator : str
+        Separator between the numbers.
+
+    Returns
+    -------
+    str
+        The formatted numbers.
+    """
+    return separator.join(format_number_list(values, precision))
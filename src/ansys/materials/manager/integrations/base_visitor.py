@@ -93,6 +93,9 @@ class BaseVisitor(MaterialModelWriterVisitor):
         """Initialize the base visitor."""
         self._materials: list[Material] = materials
         self._material_repr: dict = {material.name: [] for material in materials}
+        self._materials_by_name: dict[str, Material] = {}
+        for material in materials:
+            self._materials_by_name.setdefault(material.name, material)
         self._model_map: dict[type, ModelInfo] = model_map if model_map is not None else {}
 
     def get_material_id(self, material_name) -> int:
@@ -109,9 +112,7 @@ class BaseVisitor(MaterialModelWriterVisitor):
         int
             Material id.
         """
-        return [material.mat_id for material in self._materials if material.name == material_name][
-            0
-        ]
+        return self._materials_by_name[material_name].mat_id
 
     def is_supported(self, material_model: MaterialModel) -> bool:
         """
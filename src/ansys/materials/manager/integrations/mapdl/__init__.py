@@ -20,5 +20,6 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from ._mapdl_command_cache import MapdlCommandCache
 from .mapdl_reader import read_mapdl
 from .mapdl_writer import MapdlWriter
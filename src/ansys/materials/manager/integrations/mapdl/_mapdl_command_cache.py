@@ -0,0 +1,142 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides an in-memory cache of the MAPDL commands generated for material models."""
+
+from collections import OrderedDict
+import threading
+from typing import Hashable, Optional
+
+from ...models import MaterialModel
+
+DEFAULT_MAX_ENTRIES = 10000
+
+
+class MapdlCommandCache:
+    """
+    Cache the MAPDL commands generated for material models.
+
+    The commands are stored without material ID, keyed on the class and the content
+    hash of the model and on the writer options, so they can be reused for any
+    material with the same model. When the cache holds more than ``max_entries``
+    entries, the least recently used entries are dropped.
+
+    The content hash follows the assignments made to the model and to the models nested
+    in it, so a model changed after it was written gets a new key and is written again.
+    See :attr:`MaterialModel.content_hash` for the changes that are not detected.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Create a new MAPDL command cache.
+
+        Parameters
+        ----------
+        max_entries : int
+            Maximum number of cached command blocks.
+        """
+        if max_entries < 0:
+            raise ValueError(f"The maximum number of entries must be positive, got {max_entries}.")
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_entries(self) -> int:
+        """Maximum number of cached command blocks."""
+        return self._max_entries
+
+    def __len__(self) -> int:
+        """Get the number of cached command blocks."""
+        return len(self._entries)
+
+    @staticmethod
+    def get_key(model: MaterialModel, *options: Hashable) -> Hashable:
+        """
+        Get the cache key of a material model.
+
+        Parameters
+        ----------
+        model : MaterialModel
+            Material model to write.
+        *options : Hashable
+            Options of the writer changing the generated commands.
+
+        Returns
+        -------
+        Hashable
+            The cache key.
+        """
+        return (type(model), model.content_hash, options)
+
+    def get(self, key: Hashable) -> Optional[str]:
+        """
+        Get the commands cached under a key.
+
+        Parameters
+        ----------
+        key : Hashable
+            Cache key, see :meth:`get_key`.
+
+        Returns
+        -------
+        Optional[str]
+            The cached commands, or None on a cache miss.
+        """
+        with self._lock:
+            commands = self._entries.get(key, None)
+            if commands is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+        return commands
+
+    def put(self, key: Hashable, commands: str) -> None:
+        """
+        Cache the commands of a material model.
+
+        Parameters
+        ----------
+        key : Hashable
+            Cache key, see :meth:`get_key`.
+        commands : str
+            Commands generated for the model.
+        """
+        with self._lock:
+            self._entries[key] = commands
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Delete all the cached commands."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Cache shared by the writers created with ``cache=True``.
+DEFAULT_COMMAND_CACHE = MapdlCommandCache()
@@ -32,6 +32,7 @@ from ...models import (
     InterpolationOptions,
     IsotropicHardening,
 )
+from .._common import format_number_list, format_numbers
 from ._mapdl_snippets_strings import (
     CONSTANT_MP_PROPERTY,
     EXTRAPOLATION_TYPE_MAP,
@@ -80,24 +81,43 @@ TABLE_TBOPT = {
 }
 
 
-def _get_table_constants(idx, values):
-    val1 = values[idx * 6]
-    val2 = ""
-    val3 = ""
-    val4 = ""
-    val5 = ""
-    val6 = ""
-    if len(values) > idx * 6 + 1:
-        val2 = values[idx * 6 + 1]
-    if len(values) > idx * 6 + 2:
-        val3 = values[idx * 6 + 2]
-    if len(values) > idx * 6 + 3:
-        val4 = values[idx * 6 + 3]
-    if len(values) > idx * 6 + 4:
-        val5 = values[idx * 6 + 4]
-    if len(values) > idx * 6 + 5:
-        val6 = values[idx * 6 + 5]
-    return val1, val2, val3, val4, val5, val6
+def _stack_values(lines: list[list[str]], n_values: int = 0) -> np.ndarray:
+    """
+    Stack lines of formatted values into a 2D array, padding short lines with ``""``.
+
+    ``n_values`` is the number of columns of the array when there are no lines.
+    """
+    n_values = max((len(line) for line in lines), default=n_values)
+    values = np.full((len(lines), n_values), "", dtype=object)
+    for i, line in enumerate(lines):
+        values[i, : len(line)] = line
+    return values
+
+
+def _get_table_rows(values: np.ndarray, n_rows: int | None = None) -> list[list[list[str]]]:
+    """
+    Split each line of formatted values into rows of six values.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Formatted values, one line of values per row of the array.
+    n_rows : int | None
+        Number of rows of six values per line. If None, as many rows as needed to hold
+        the values of a line.
+
+    Returns
+    -------
+    list[list[list[str]]]
+        The rows of six values of each line, padded with empty strings.
+    """
+    n_lines, n_values = values.shape
+    if n_rows is None:
+        n_rows = math.ceil(n_values / 6)
+    n_values = min(n_values, n_rows * 6)
+    table = np.full((n_lines, n_rows * 6), "", dtype=object)
+    table[:, :n_values] = values[:, :n_values]
+    return table.reshape(n_lines, n_rows, 6).tolist()
 
 
 def write_constant_property(
@@ -109,6 +129,7 @@ def write_constant_property(
     c3: float | None = None,
     c4: float | None = None,
     unit: str = "",
+    precision: int | None = None,
 ):
     """
     Write constant property.
@@ -116,10 +137,7 @@ def write_constant_property(
     Example:
     MP,EX,1,1000000,	! Pa
     """
-    if isinstance(property, (int, float)):
-        c0 = str(property)
-    else:
-        c0 = str(property).strip("[]")
+    c0 = format_numbers(property, precision)
     return CONSTANT_MP_PROPERTY.format(
         lab=label,
         matid=material_id,
@@ -141,6 +159,7 @@ def write_constant_properties(
     c2: float | None = None,
     c3: float | None = None,
     c4: float | None = None,
+    precision: int | None = None,
 ):
     """
     Write constant properties.
@@ -149,22 +168,25 @@ def write_constant_properties(
     MP,EX,1,1000000,	! Pa
     MP,NUXY,1,0.3,
     """
-    property_str = ""
+    property_lines = []
     for i in range(len(labels)):
         label = labels[i]
         property = properties[i]
         unit = property_units[i]
-        property_str += write_constant_property(
-            label=label,
-            property=property,
-            material_id=material_id,
-            c1=c1,
-            c2=c2,
-            c3=c3,
-            c4=c4,
-            unit=unit,
+        property_lines.append(
+            write_constant_property(
+                label=label,
+                property=property,
+                material_id=material_id,
+                c1=c1,
+                c2=c2,
+                c3=c3,
+                c4=c4,
+                unit=unit,
+                precision=precision,
+            )
         )
-    return property_str
+    return "".join(property_lines)
 
 
 def write_interpolation_options(
@@ -182,35 +204,39 @@ def write_interpolation_options(
     TBIN,DEFA,Orientation Tensor A22,0
     TBIN,BNDS,Orientation Tensor A22,0,1
     """
-    interpolation_string = ""
+    interpolation_lines = []
     if interpolation_options.algorithm_type:
-        interpolation_string += TBIN_ALGO.format(
-            par1=INTERPOLATION_ALGORITHM_MAP[interpolation_options.algorithm_type]
+        interpolation_lines.append(
+            TBIN_ALGO.format(par1=INTERPOLATION_ALGORITHM_MAP[interpolation_options.algorithm_type])
         )
     par2 = "ON"
     if interpolation_options.normalized == False:
         par2 = "OFF"
-    interpolation_string += TBIN_NORM.format(par1="", par2=par2)
+    interpolation_lines.append(TBIN_NORM.format(par1="", par2=par2))
     par2 = "ON"
     if interpolation_options.cached == False:
         par2 = "OFF"
-    interpolation_string += TBIN_CACH.format(par1="", par2=par2)
+    interpolation_lines.append(TBIN_CACH.format(par1="", par2=par2))
     if (
         interpolation_options.extrapolation_type
         and interpolation_options.extrapolation_type != "None"
     ):
-        interpolation_string += TBIN_EXTR.format(
-            par1="", par2=EXTRAPOLATION_TYPE_MAP[interpolation_options.extrapolation_type]
+        interpolation_lines.append(
+            TBIN_EXTR.format(
+                par1="", par2=EXTRAPOLATION_TYPE_MAP[interpolation_options.extrapolation_type]
+            )
         )
     else:
-        interpolation_string += TBIN_EXTR.format(
-            par1="", par2=EXTRAPOLATION_TYPE_MAP["Projection to the Bounding Box"]
+        interpolation_lines.append(
+            TBIN_EXTR.format(par1="", par2=EXTRAPOLATION_TYPE_MAP["Projection to the Bounding Box"])
         )
     for independent_parameter in independent_parameters:
         if independent_parameter.default_value is not None:
-            interpolation_string += TBIN_DEFA.format(
-                par1=independent_parameter.name,
-                par2=independent_parameter.default_value,
+            interpolation_lines.append(
+                TBIN_DEFA.format(
+                    par1=independent_parameter.name,
+                    par2=independent_parameter.default_value,
+                )
             )
         if (
             independent_parameter.lower_limit is not None
@@ -224,12 +250,14 @@ def write_interpolation_options(
                 upper_limit = max(independent_parameter.values.value.tolist())
             else:
                 upper_limit = independent_parameter.upper_limit
-            interpolation_string += TBIN_BNDS.format(
-                par1=independent_parameter.name,
-                par2=lower_limit,
-                par3=upper_limit,
+            interpolation_lines.append(
+                TBIN_BNDS.format(
+                    par1=independent_parameter.name,
+                    par2=lower_limit,
+                    par3=upper_limit,
+                )
             )
-    return interpolation_string
+    return "".join(interpolation_lines)
 
 
 def write_temperature_table_values(
@@ -238,6 +266,7 @@ def write_temperature_table_values(
     dependent_parameters_unit: list[str],
     material_id: int,
     temperature_parameter: IndependentParameter,
+    precision: int | None = None,
 ) -> str:
     """
     Write temperature table.
@@ -249,35 +278,45 @@ def write_temperature_table_values(
     MPDATA,PRXY,3,1,0.35,0.3,,,, !
     """
     n_loops = math.ceil(len(temperature_parameter.values.value) / 6)
-    table_str = ""
-    temp_vals = temperature_parameter.values.value.tolist()
+    table_lines = []
+    temp_vals = format_number_list(temperature_parameter.values.value, precision)
+    dependent_parameters = [
+        format_number_list(dep_vals, precision) for dep_vals in dependent_parameters
+    ]
+    (temp_rows,) = _get_table_rows(_stack_values([temp_vals]), n_loops)
+    dep_rows = _get_table_rows(_stack_values(dependent_parameters), n_loops)
     for i in range(n_loops):
-        t1, t2, t3, t4, t5, t6 = _get_table_constants(i, temp_vals)
-        table_str += MP_TEMP.format(sloc=i * 6 + 1, t1=t1, t2=t2, t3=t3, t4=t4, t5=t5, t6=t6)
+        t1, t2, t3, t4, t5, t6 = temp_rows[i]
+        table_lines.append(MP_TEMP.format(sloc=i * 6 + 1, t1=t1, t2=t2, t3=t3, t4=t4, t5=t5, t6=t6))
     for i in range(n_loops):
         j = 0
         for k in range(len(dependent_parameters)):
-            dep_vals = dependent_parameters[k]
             dep_unit = dependent_parameters_unit[k]
-            c1, c2, c3, c4, c5, c6 = _get_table_constants(i, dep_vals)
-            table_str += MP_DATA.format(
-                lab=labels[j],
-                matid=material_id,
-                sloc=i * 6 + 1,
-                c1=c1,
-                c2=c2,
-                c3=c3,
-                c4=c4,
-                c5=c5,
-                c6=c6,
-                unit=dep_unit,
+            c1, c2, c3, c4, c5, c6 = dep_rows[k][i]
+            table_lines.append(
+                MP_DATA.format(
+                    lab=labels[j],
+                    matid=material_id,
+                    sloc=i * 6 + 1,
+                    c1=c1,
+                    c2=c2,
+                    c3=c3,
+                    c4=c4,
+                    c5=c5,
+                    c6=c6,
+                    unit=dep_unit,
+                )
             )
             j += 1
-    return table_str
+    return "".join(table_lines)
 
 
 def write_table_dep_values(
-    material_id: str | None, label: str, dependent_values: list[float], tb_opt: str = ""
+    material_id: str | None,
+    label: str,
+    dependent_values: list[float],
+    tb_opt: str = "",
+    precision: int | None = None,
 ) -> str:
     """
     Write table of dependent values.
@@ -292,47 +331,55 @@ def write_table_dep_values(
     table_str = TB.format(lab=label, matid=material_id, tbopt=tb_opt)
     if tb_opt == "PC":
         table_str = table_str[:-5] + table_str[-4:]
-    n_loops = math.ceil(len(dependent_values) / 6)
-    for i in range(n_loops):
-        c1, c2, c3, c4, c5, c6 = _get_table_constants(i, dependent_values)
-        table_str += TB_DATA.format(
-            stloc=i * 6 + 1,
-            c1=c1,
-            c2=c2,
-            c3=c3,
-            c4=c4,
-            c5=c5,
-            c6=c6,
+    table_lines = [table_str]
+    dependent_values = format_number_list(dependent_values, precision)
+    (rows,) = _get_table_rows(_stack_values([dependent_values]))
+    for i, row in enumerate(rows):
+        c1, c2, c3, c4, c5, c6 = row
+        table_lines.append(
+            TB_DATA.format(
+                stloc=i * 6 + 1,
+                c1=c1,
+                c2=c2,
+                c3=c3,
+                c4=c4,
+                c5=c5,
+                c6=c6,
+            )
         )
 
-    return table_str
+    return "".join(table_lines)
 
 
 def _get_field_variables(
     independent_parameters: list[IndependentParameter],
 ) -> tuple[list[list[float]], list[str], list[str], str]:
-    parameters_str = ""
+    parameters_lines = []
     idx = 1
     independent_values = []
     independent_values_names = []
     independent_values_units = []
     for independent_parameter in independent_parameters:
         if independent_parameter.name in PREDIFINED_TB_FIELDS.keys():
-            parameters_str += f"{independent_parameter.name} = '{PREDIFINED_TB_FIELDS[independent_parameter.name]}' ! {independent_parameter.name}"  # noqa_ E501
+            parameters_str = f"{independent_parameter.name} = '{PREDIFINED_TB_FIELDS[independent_parameter.name]}' ! {independent_parameter.name}"  # noqa_ E501
+            parameters_lines.append(parameters_str)
         else:
-            parameters_str += USER_DEFINED_TB_FIELDS.format(
-                name=independent_parameter.name,
-                idx=idx,
-                unit=(
-                    independent_parameter.values.unit
-                    if independent_parameter.values.unit != ""
-                    else independent_parameter.name
-                ),
+            parameters_lines.append(
+                USER_DEFINED_TB_FIELDS.format(
+                    name=independent_parameter.name,
+                    idx=idx,
+                    unit=(
+                        independent_parameter.values.unit
+                        if independent_parameter.values.unit != ""
+                        else independent_parameter.name
+                    ),
+                )
             )
             idx += 1
         independent_values.append(independent_parameter.values.value.tolist())
         independent_values_names.append(independent_parameter.name)
         independent_values_units.append(independent_parameter.values.unit)
+    parameters_str = "".join(parameters_lines)
     return independent_values, independent_values_names, independent_values_units, parameters_str
 
 
@@ -342,6 +389,7 @@ def write_table_values(
     material_id: int,
     independent_parameters: list[IndependentParameter],
     tb_opt: str | None = None,
+    precision: int | None = None,
 ) -> tuple[str, str]:
     """
     Write table variables.
@@ -369,43 +417,49 @@ def write_table_values(
     table_str = TB.format(lab=label, matid=material_id, tbopt=tb_opt or "")
     if tb_opt == "PC":
         table_str = table_str[:-5] + table_str[-4:]
-    dependent_values = list(zip(*dependent_parameters))
+    table_lines = [table_str]
+    dependent_values = _stack_values(
+        [format_number_list(dep_vals, precision) for dep_vals in dependent_parameters]
+    )
+    dependent_rows = _get_table_rows(dependent_values.T)
+    independent_values = [
+        format_number_list(ind_vals, precision) for ind_vals in independent_values
+    ]
 
     for idx_val, ind_vals in enumerate(list(zip(*independent_values))):
         idx = 0
         for ind_val in ind_vals:
-            table_str += TB_FIELD.format(
-                type=(
-                    PREDIFINED_TB_FIELDS[independent_values_names[idx]]
-                    if independent_values_names[idx] in PREDIFINED_TB_FIELDS.keys()
-                    else independent_values_names[idx]
-                ),
-                value=ind_val,
-                unit=(
-                    independent_values_units[idx]
-                    if independent_values_units[idx] != ""
-                    else independent_values_names[idx]
-                ),
+            table_lines.append(
+                TB_FIELD.format(
+                    type=(
+                        PREDIFINED_TB_FIELDS[independent_values_names[idx]]
+                        if independent_values_names[idx] in PREDIFINED_TB_FIELDS.keys()
+                        else independent_values_names[idx]
+                    ),
+                    value=ind_val,
+                    unit=(
+                        independent_values_units[idx]
+                        if independent_values_units[idx] != ""
+                        else independent_values_names[idx]
+                    ),
+                )
             )
             idx += 1
 
-        dep_vals = dependent_values[idx_val]
-        n_loops = math.ceil(len(dep_vals) / 6)
-        vals = []
-        for j in range(len(dep_vals)):
-            vals.append(dep_vals[j])
-        for i in range(n_loops):
-            c1, c2, c3, c4, c5, c6 = _get_table_constants(i, vals)
-            table_str += TB_DATA.format(
-                stloc=i * 6 + 1,
-                c1=c1,
-                c2=c2,
-                c3=c3,
-                c4=c4,
-                c5=c5,
-                c6=c6,
+        for i, row in enumerate(dependent_rows[idx_val]):
+            c1, c2, c3, c4, c5, c6 = row
+            table_lines.append(
+                TB_DATA.format(
+                    stloc=i * 6 + 1,
+                    c1=c1,
+                    c2=c2,
+                    c3=c3,
+                    c4=c4,
+                    c5=c5,
+                    c6=c6,
+                )
             )
-    return parameters_str, table_str
+    return parameters_str, "".join(table_lines)
 
 
 def write_table_value_per_temperature(
@@ -414,6 +468,7 @@ def write_table_value_per_temperature(
     dependent_parameters: list[list[float]],
     temperature_parameter: IndependentParameter,
     tb_opt: str = "",
+    precision: int | None = None,
 ) -> str:
     """
     Write table values per temperature.
@@ -426,31 +481,37 @@ def write_table_value_per_temperature(
     TBTEMP,78
     TBDATA,1,1.2,0.8,0.5,0.12,0.23,0.23
     """
-    table_str = f"{temperature_parameter.name} = '{PREDIFINED_TB_FIELDS[temperature_parameter.name]}' ! {temperature_parameter.name}\n"  # noqa_ E501
+    table_lines = [
+        f"{temperature_parameter.name} = '{PREDIFINED_TB_FIELDS[temperature_parameter.name]}' ! {temperature_parameter.name}\n"  # noqa_ E501
+    ]
     line = TB.format(lab=label, matid=material_id, tbopt=tb_opt)
     if tb_opt == "PC":
         line = line[:-5] + line[-4:]
-    table_str += line
-    n_loops = math.ceil(len(dependent_parameters) / 6)
+    table_lines.append(line)
+    temperatures = format_number_list(temperature_parameter.values.value, precision)
+    dependent_parameters = _stack_values(
+        [format_number_list(dep_vals, precision) for dep_vals in dependent_parameters],
+        n_values=len(temperatures),
+    )
+    dependent_rows = _get_table_rows(dependent_parameters.T)
     temp_idx = 0
-    for temperature in temperature_parameter.values.value:
-        table_str += TB_TEMP.format(temp=temperature)
-        vals = []
-        for dep_vals in dependent_parameters:
-            vals.append(dep_vals[temp_idx])
-        for i in range(n_loops):
-            c1, c2, c3, c4, c5, c6 = _get_table_constants(i, vals)
-            table_str += TB_DATA.format(
-                stloc=i * 6 + 1,
-                c1=c1,
-                c2=c2,
-                c3=c3,
-                c4=c4,
-                c5=c5,
-                c6=c6,
+    for temperature in temperatures:
+        table_lines.append(TB_TEMP.format(temp=temperature))
+        for i, row in enumerate(dependent_rows[temp_idx]):
+            c1, c2, c3, c4, c5, c6 = row
+            table_lines.append(
+                TB_DATA.format(
+                    stloc=i * 6 + 1,
+                    c1=c1,
+                    c2=c2,
+                    c3=c3,
+                    c4=c4,
+                    c5=c5,
+                    c6=c6,
+                )
             )
         temp_idx += 1
-    return table_str
+    return "".join(table_lines)
 
 
 def write_tb_points_for_temperature(
@@ -459,6 +520,7 @@ def write_tb_points_for_temperature(
     material_id: int,
     temperature_parameter: list[float],
     tb_opt: str,
+    precision: int | None = None,
 ) -> tuple[str, str]:
     """
     Write points table.
@@ -474,12 +536,17 @@ def write_tb_points_for_temperature(
     table_str = TB.format(lab=label, matid=material_id, tbopt=tb_opt or "")
     if label == "PLASTIC":
         table_str = table_str.replace(",,", ",", 1)
+    table_lines = [table_str]
+    x_values = format_number_list(table_parameters[0], precision)
+    y_values = format_number_list(table_parameters[1], precision)
     counts = Counter(temperature_parameter)
     for num, count in counts.items():
-        table_str += TB_FIELD.format(type="TEMP", value=num, unit="")
+        table_lines.append(
+            TB_FIELD.format(type="TEMP", value=format_numbers(num, precision), unit="")
+        )
         for i in range(count):
-            table_str += TBPT.format(oper="", x=table_parameters[0][i], y=table_parameters[1][i])
-    return table_str
+            table_lines.append(TBPT.format(oper="", x=x_values[i], y=y_values[i]))
+    return "".join(table_lines)
 
 
 def write_temperature_reference_value(material_id: int, temperature: float) -> str:
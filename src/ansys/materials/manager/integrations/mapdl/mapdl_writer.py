@@ -21,6 +21,8 @@
 # SOFTWARE.
 
 from functools import singledispatchmethod
+from itertools import islice
+from typing import Callable, Iterator, TextIO
 
 import numpy as np
 
@@ -35,6 +37,7 @@ from ...models import (
 from ...models._common import _MapdlCore
 from ..base_visitor import BaseVisitor
 from ..material_model_writer_visitor import UnsupportedMaterialModelError
+from ._mapdl_command_cache import DEFAULT_COMMAND_CACHE, MapdlCommandCache
 from ._mapdl_commands_parser import (
     TABLE_LABELS,
     TABLE_TBOPT,
@@ -51,14 +54,106 @@ from ._mapdl_commands_parser import (
 )
 from ._mapdl_model_map import MATERIAL_MODEL_MAP
 
+# Stands for the material ID in the generated commands, which are split on it once
+# into a template. The ID is bound when the commands are written.
+MATERIAL_ID_PLACEHOLDER = "\x00"
+
+
+def _join_blocks(blocks: list[str]) -> str:
+    """Join blocks of commands into one block, with each block on its own lines."""
+    return "".join(block if block.endswith("\n") else block + "\n" for block in blocks)
+
 
 class MapdlWriter(BaseVisitor):
-    """Write materials to MAPDL APDL command strings via the visitor pattern."""
+    """
+    Write materials to MAPDL APDL command strings via the visitor pattern.
+
+    In streaming mode, the materials are visited when they are written instead of on
+    construction, and the commands of each material are released once written. Use
+    :meth:`write_to_stream` to write them to a file or socket one material at a time.
+    The output is identical to the default mode.
+    """
 
-    def __init__(self, materials: list[Material]):
-        """Initialize the Mapdl visitor."""
+    def __init__(
+        self,
+        materials: list[Material],
+        precision: int | None = None,
+        cache: bool | MapdlCommandCache = False,
+        stream: bool = False,
+    ):
+        """
+        Initialize the Mapdl visitor.
+
+        Parameters
+        ----------
+        materials : list[Material]
+            Materials to write.
+        precision : int | None
+            Number of significant digits of the written floats. If None, the floats
+            are written so that they are read back unchanged.
+        cache : bool | MapdlCommandCache
+            Cache of the commands generated for the material models. If True, a cache
+            shared by all the writers is used. On a cache hit, the commands of the model
+            are not generated again.
+        stream : bool
+            If True, the materials are not visited on construction but one at a time
+            when they are written, so that the commands of one material only are held
+            in memory.
+        """
         super().__init__(materials=materials, model_map=MATERIAL_MODEL_MAP)
-        self.visit_materials()
+        self._precision = precision
+        if cache is True:
+            cache = DEFAULT_COMMAND_CACHE
+        self._cache = None if cache is False else cache
+        self._stream = stream
+        self._material_templates: dict[str, tuple[str, ...]] = {}
+        self._material_groups: dict[str, list[Material]] = {}
+        if stream:
+            for material in materials:
+                self._material_groups.setdefault(material.name, []).append(material)
+        else:
+            self.visit_materials()
+
+    def _get_model_commands(
+        self, material_model: MaterialModel, write: Callable[[MaterialModel], str]
+    ) -> str:
+        """Get the commands of a model from the cache, or generate them with ``write``."""
+        if self._cache is None:
+            return write(material_model)
+        key = self._cache.get_key(material_model, type(self), self._precision)
+        commands = self._cache.get(key)
+        if commands is None:
+            commands = write(material_model)
+            self._cache.put(key, commands)
+        return commands
+
+    def get_material_template(self, material_name: str) -> tuple[str, ...]:
+        """
+        Get the commands of a material as a template.
+
+        Parameters
+        ----------
+        material_name : str
+            Name of the material.
+
+        Returns
+        -------
+        tuple[str, ...]
+            Segments of the commands, to join with the material ID.
+        """
+        template = self._material_templates.get(material_name, None)
+        if template is not None:
+            return template
+        # Materials sharing a name are written as one material, as in ``_material_repr``.
+        for material in self._material_groups.get(material_name, []):
+            material.accept(self)
+        commands = "".join(self._material_repr[material_name])
+        template = tuple(commands.split(MATERIAL_ID_PLACEHOLDER))
+        if self._stream:
+            self._material_repr[material_name] = []
+        else:
+            self._material_templates[material_name] = template
+        return template
 
     def _write_standard(self, material_model: MaterialModel) -> str:
         """Write standard properties."""
@@ -76,7 +171,8 @@ class MapdlWriter(BaseVisitor):
                 labels=dependent_parameters_labels,
                 properties=dependent_parameters_value,
                 property_units=dependent_parameters_units,
-                material_id=None,
+                material_id=MATERIAL_ID_PLACEHOLDER,
+                precision=self._precision,
             )
             return material_string
         else:
@@ -89,7 +185,8 @@ class MapdlWriter(BaseVisitor):
                         labels=dependent_parameters_labels,
                         properties=dependent_parameters_value,
                         property_units=dependent_parameters_units,
-                        material_id=None,
+                        material_id=MATERIAL_ID_PLACEHOLDER,
+                        precision=self._precision,
                     )
                     return material_string
                 else:
@@ -97,7 +194,8 @@ class MapdlWriter(BaseVisitor):
                         labels=dependent_parameters_labels,
                         dependent_parameters=dependent_parameters_value,
                         dependent_parameters_unit=dependent_parameters_units,
-                        material_id=None,
+                        material_id=MATERIAL_ID_PLACEHOLDER,
+                        precision=self._precision,
                         temperature_parameter=aligned_model.independent_parameters[0],
                     )
                     return material_string
@@ -107,7 +205,8 @@ class MapdlWriter(BaseVisitor):
                 parameters_str, table_str = write_table_values(
                     label=table_label,
                     dependent_parameters=dependent_parameters_value,
-                    material_id=None,
+                    material_id=MATERIAL_ID_PLACEHOLDER,
+                    precision=self._precision,
                     independent_parameters=aligned_model.independent_parameters,
                     tb_opt=tb_opt,
                 )
@@ -129,7 +228,8 @@ class MapdlWriter(BaseVisitor):
         """Visit anisotropic."""
         dependent_parameters_dict = self._populate_dependent_parameters(material_model)
         material_string = write_table_dep_values(
-            material_id=None,
+            material_id=MATERIAL_ID_PLACEHOLDER,
+            precision=self._precision,
             label="ELASTIC",
             dependent_values=dependent_parameters_dict["lower_triangular"],
             tb_opt="AELS",
@@ -147,7 +247,8 @@ class MapdlWriter(BaseVisitor):
                 dep_val[0] for dep_val in dependent_values if isinstance(dep_val, np.ndarray)
             ]
             material_string = write_table_dep_values(
-                material_id=None,
+                material_id=MATERIAL_ID_PLACEHOLDER,
+                precision=self._precision,
                 label=label,
                 dependent_values=dependent_values,
                 tb_opt=tb_opt,
@@ -159,7 +260,8 @@ class MapdlWriter(BaseVisitor):
         ):
             if len(material_model.independent_parameters[0].values.value) == 1:
                 material_string = write_table_dep_values(
-                    material_id=None,
+                    material_id=MATERIAL_ID_PLACEHOLDER,
+                    precision=self._precision,
                     label=label,
                     dependent_values=dependent_values,
                     tb_opt=tb_opt,
@@ -167,7 +269,8 @@ class MapdlWriter(BaseVisitor):
             else:
                 material_string = write_table_value_per_temperature(
                     label=label,
-                    material_id=None,
+                    material_id=MATERIAL_ID_PLACEHOLDER,
+                    precision=self._precision,
                     dependent_parameters=dependent_values,
                     temperature_parameter=material_model.independent_parameters[0],
                     tb_opt=tb_opt,
@@ -177,7 +280,8 @@ class MapdlWriter(BaseVisitor):
             parameters_str, table_str = write_table_values(
                 label=label,
                 dependent_parameters=dependent_values,
-                material_id=None,
+                material_id=MATERIAL_ID_PLACEHOLDER,
+                precision=self._precision,
                 independent_parameters=material_model.independent_parameters,
                 tb_opt=tb_opt,
             )
@@ -215,7 +319,8 @@ class MapdlWriter(BaseVisitor):
             material_string = write_tb_points_for_temperature(
                 label=table_label,
                 table_parameters=table_parameters,
-                material_id=None,
+                material_id=MATERIAL_ID_PLACEHOLDER,
+                precision=self._precision,
                 temperature_parameter=temperature_parameter,
                 tb_opt=table_tbopt,
             )
@@ -224,7 +329,8 @@ class MapdlWriter(BaseVisitor):
             material_string = write_tb_points_for_temperature(
                 label=table_label,
                 table_parameters=table_parameters,
-                material_id=None,
+                material_id=MATERIAL_ID_PLACEHOLDER,
+                precision=self._precision,
                 temperature_parameter=temperature[0],
                 tb_opt=table_tbopt,
             )
@@ -250,7 +356,7 @@ class MapdlWriter(BaseVisitor):
     @visit.register(MaterialModel)
     def _visit_standard_model(self, material_model: MaterialModel, *, material_name: str) -> None:
         """Visit standard MAPDL material models."""
-        model = self.visit_standard(material_model)
+        model = self._get_model_commands(material_model, self.visit_standard)
         self._material_repr[material_name].append(model)
 
     @visit.register(ElasticityAnisotropic)
@@ -258,7 +364,7 @@ class MapdlWriter(BaseVisitor):
         self, material_model: ElasticityAnisotropic, *, material_name: str
     ) -> None:
         """Visit anisotropic elasticity."""
-        model = self.visit_anisotropic(material_model)
+        model = self._get_model_commands(material_model, self.visit_anisotropic)
         self._material_repr[material_name].append(model)
 
     @visit.register(HillYieldCriterion)
@@ -266,7 +372,7 @@ class MapdlWriter(BaseVisitor):
         self, material_model: HillYieldCriterion, *, material_name: str
     ) -> None:
         """Visit Hill yield criterion."""
-        model = self.visit_hill_yield_criterion(material_model)
+        model = self._get_model_commands(material_model, self.visit_hill_yield_criterion)
         self._material_repr[material_name].append(model)
 
     @visit.register(IsotropicHardening)
@@ -274,7 +380,7 @@ class MapdlWriter(BaseVisitor):
         self, material_model: IsotropicHardening, *, material_name: str
     ) -> None:
         """Visit isotropic hardening."""
-        model = self.visit_isotropic_harderning(material_model)
+        model = self._get_model_commands(material_model, self.visit_isotropic_harderning)
         self._material_repr[material_name].append(model)
 
     def write(
@@ -283,6 +389,7 @@ class MapdlWriter(BaseVisitor):
         material_names: list[str] | None = None,
         material_ids: list[int] | None = None,
         reference_temperatures: list[float] | None = None,
+        chunk_size: int | None = 1,
     ) -> list[str] | None:
         """
         Write the materials into MAPDL representation.
@@ -297,12 +404,76 @@ class MapdlWriter(BaseVisitor):
             List of material ids to write. If None, get the ids from the materials.
         reference_temperatures : list[float] | None
             List of reference temperatures to write. If None, use default values.
+        chunk_size : int | None
+            Number of materials sent to the client in a single input block. If None, all
+            the materials are sent in one block. Larger blocks reduce the number of round
+            trips to the client.
 
         Returns
         -------
         list[str] | None
             List of material strings if client is None, else None.
         """
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError(f"chunk_size must be a positive integer or None, got {chunk_size}.")
+        materials = self.iter_materials(material_names, material_ids, reference_temperatures)
+        if client is None:
+            return list(materials)
+        client.prep7()
+        while True:
+            chunk = list(islice(materials, chunk_size))
+            if not chunk:
+                return
+            client.input_strings(_join_blocks(chunk))
+
+    def write_to_stream(
+        self,
+        stream: TextIO,
+        material_names: list[str] | None = None,
+        material_ids: list[int] | None = None,
+        reference_temperatures: list[float] | None = None,
+    ) -> None:
+        """
+        Write the commands of the materials to a text stream, one material at a time.
+
+        Parameters
+        ----------
+        stream : TextIO
+            Text stream to write to, for example an open file or the file object of a
+            socket.
+        material_names : list[str] | None
+            List of material names to write. If None, write all materials.
+        material_ids : list[int] | None
+            List of material ids to write. If None, get the ids from the materials.
+        reference_temperatures : list[float] | None
+            List of reference temperatures to write. If None, use default values.
+        """
+        for material in self.iter_materials(material_names, material_ids, reference_temperatures):
+            stream.write(_join_blocks([material]))
+
+    def iter_materials(
+        self,
+        material_names: list[str] | None = None,
+        material_ids: list[int] | None = None,
+        reference_temperatures: list[float] | None = None,
+    ) -> Iterator[str]:
+        """
+        Yield the commands of the materials one at a time.
+
+        Parameters
+        ----------
+        material_names : list[str] | None
+            List of material names to write. If None, write all materials.
+        material_ids : list[int] | None
+            List of material ids to write. If None, get the ids from the materials.
+        reference_temperatures : list[float] | None
+            List of reference temperatures to write. If None, use default values.
+
+        Yields
+        ------
+        str
+            Commands of each material.
+        """
         if material_names is None:
             material_names = []
             for material in self._materials:
@@ -312,25 +483,11 @@ class MapdlWriter(BaseVisitor):
             for material in material_names:
                 material_ids.append(self.get_material_id(material))
 
-        materials = []
         for idx, material_name in enumerate(material_names):
-            ref_temp_string = None
+            merged_models = str(material_ids[idx]).join(self.get_material_template(material_name))
             if reference_temperatures:
                 ref_temp_string = write_temperature_reference_value(
                     material_ids[idx], reference_temperatures[idx]
                 )
-            if ref_temp_string is None:
-                models = self._material_repr[material_name]
-            else:
-                models = [ref_temp_string] + self._material_repr[material_name]
-
-            merged_models = "".join(s.replace("None", str(material_ids[idx])) for s in models)
-            materials.append(merged_models)
-
-        if client is None:
-            return materials
-        else:
-            client.prep7()
-            for material in materials:
-                client.input_strings(material)
-        return
+                merged_models = ref_temp_string + merged_models
+            yield merged_models
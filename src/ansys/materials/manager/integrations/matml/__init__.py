@@ -20,5 +20,6 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+from ._matml_cache import MatmlCache
 from .matml_reader import MatmlReader
 from .matml_writer import MatmlWriter
@@ -0,0 +1,228 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides an on-disk cache of the materials read from MatML files."""
+
+import functools
+import hashlib
+from importlib import metadata
+import logging
+import os
+from pathlib import Path
+import pickle  # nosec B403
+import sys
+import tempfile
+from typing import Optional, Sequence, Union
+
+from ...models import Material
+
+_PATH_TYPE = Union[str, os.PathLike]
+_CACHE_FILE_SUFFIX = ".pkl"
+
+DEFAULT_MAX_CACHE_SIZE = 512 * 2**20
+
+_logger = logging.getLogger(__name__)
+
+
+@functools.cache
+def _get_package_version() -> str:
+    """Return the installed version of the package."""
+    return metadata.version("ansys-materials-manager")
+
+
+def get_default_cache_directory() -> Path:
+    """
+    Return the default directory of the MatML cache.
+
+    The cache is stored in the cache directory of the user: ``%LOCALAPPDATA%`` on
+    Windows and ``$XDG_CACHE_HOME`` (or ``~/.cache``) on other platforms.
+
+    Returns
+    -------
+    Path
+        The default cache directory.
+    """
+    if sys.platform == "win32" and "LOCALAPPDATA" in os.environ:
+        root = Path(os.environ["LOCALAPPDATA"])
+    else:
+        root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return root / "ansys_materials_manager" / "matml"
+
+
+class MatmlCache:
+    """
+    Cache the materials converted from MatML files on disk.
+
+    The converted :class:`~ansys.materials.manager.models.Material` objects are pickled
+    in a binary file per MatML file. Entries are keyed on the path, the modification
+    time and the size of the MatML file and on the package version, so a modified file
+    or a package update invalidates them. When the total size of the cache exceeds
+    ``max_size``, the least recently used entries are deleted.
+    """
+
+    def __init__(
+        self, directory: Optional[_PATH_TYPE] = None, max_size: int = DEFAULT_MAX_CACHE_SIZE
+    ):
+        """
+        Create a new MatML cache.
+
+        Parameters
+        ----------
+        directory : Optional[_PATH_TYPE]
+            Directory of the cache files. If None, the cache directory of the user is used.
+        max_size : int
+            Maximum total size of the cache files in bytes.
+        """
+        if max_size < 0:
+            raise ValueError(f"The maximum cache size must be positive, got {max_size}.")
+        self._directory = (
+            Path(directory) if directory is not None else get_default_cache_directory()
+        )
+        self._max_size = max_size
+
+    @property
+    def directory(self) -> Path:
+        """Directory of the cache files."""
+        return self._directory
+
+    @property
+    def max_size(self) -> int:
+        """Maximum total size of the cache files in bytes."""
+        return self._max_size
+
+    def get_key(self, file_path: _PATH_TYPE, material_names: Optional[Sequence[str]] = None) -> str:
+        """
+        Get the cache key of a MatML file.
+
+        Parameters
+        ----------
+        file_path : _PATH_TYPE
+            Path to the MatML file.
+        material_names : Optional[Sequence[str]]
+            Names of the materials read from the file, or None if all materials are read.
+
+        Returns
+        -------
+        str
+            The cache key.
+        """
+        stat = os.stat(file_path)
+        if isinstance(material_names, str):
+            material_names = [material_names]
+        key_data = (
+            os.path.abspath(file_path),
+            stat.st_mtime_ns,
+            stat.st_size,
+            _get_package_version(),
+            None if material_names is None else sorted(set(material_names)),
+        )
+        return hashlib.sha256(repr(key_data).encode("utf-8")).hexdigest()
+
+    def _get_path(self, key: str) -> Path:
+        return self._directory / f"{key}{_CACHE_FILE_SUFFIX}"
+
+    def contains(self, key: str) -> bool:
+        """Return True if the cache has an entry for the key."""
+        return self._get_path(key).is_file()
+
+    def load(self, key: str) -> Optional[dict[str, Material]]:
+        """
+        Load the materials cached for a key.
+
+        Parameters
+        ----------
+        key : str
+            Cache key returned by :meth:`get_key`.
+
+        Returns
+        -------
+        Optional[dict[str, Material]]
+            The cached materials, or None if the cache has no valid entry for the key.
+        """
+        path = self._get_path(key)
+        try:
+            with open(path, "rb") as fp:
+                materials = pickle.load(fp)  # nosec B301
+        except FileNotFoundError:
+            return None
+        except Exception as err:
+            # A truncated file or an entry written by an incompatible package version.
+            _logger.warning("Discarding the invalid MatML cache entry %s: %s", path, err)
+            path.unlink(missing_ok=True)
+            return None
+        os.utime(path)
+        return materials
+
+    def store(self, key: str, materials: dict[str, Material]) -> None:
+        """
+        Store the materials converted from a MatML file.
+
+        Parameters
+        ----------
+        key : str
+            Cache key returned by :meth:`get_key`.
+        materials : dict[str, Material]
+            The converted materials.
+
+        Notes
+        -----
+        Storing is best effort: if the entry cannot be written or the materials cannot be
+        pickled, a warning is logged and the partial file is deleted.
+        """
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        except OSError as err:
+            _logger.warning("Could not write the MatML cache entry: %s", err)
+            return
+        try:
+            # Write to a temporary file first so that readers never see a partial entry.
+            with os.fdopen(fd, "wb") as fp:
+                pickle.dump(materials, fp, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self._get_path(key))
+        except (OSError, pickle.PicklingError, AttributeError, TypeError) as err:
+            _logger.warning("Could not write the MatML cache entry: %s", err)
+            return
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete the least recently used entries until the cache fits in ``max_size``."""
+        entries = []
+        for path in self._directory.glob(f"*{_CACHE_FILE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries, key=lambda entry: entry[0]):
+            if total_size <= self._max_size:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+    def clear(self) -> None:
+        """Delete all entries of the cache."""
+        for path in self._directory.glob(f"*{_CACHE_FILE_SUFFIX}"):
+            path.unlink(missing_ok=True)
@@ -20,6 +20,8 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import functools
+
 from ...models import (
     AdditionalPuckConstants,
     CoefficientofThermalExpansionIsotropic,
@@ -35,6 +37,7 @@ from ...models import (
     IsotropicHardeningVoceLaw,
     KinematicHardening,
     LaRc0304Constants,
+    MaterialModel,
     ModelCoefficients,
     MolecularWeight,
     PlyType,
@@ -53,6 +56,7 @@ from ...models import (
     ZeroThermalStrainReferenceTemperatureOrthotropic,
 )
 from .._common import ModelInfo
+from ._matml_parser import parse_property_set_name
 from ._matml_utils import (
     map_from_anisotropic_elasticity,
     map_from_hill_yield_criterion,
@@ -319,3 +323,30 @@ MATERIAL_MODEL_MAP = {
         attributes=["zero_thermal_strain_reference_temperature"],
     ),
 }
+
+_MATERIAL_MODEL_CLASSES = {model_class.__name__: model_class for model_class in MATERIAL_MODEL_MAP}
+
+
+@functools.cache
+def get_material_model_class(
+    property_set_name: str, behavior: str | None = None
+) -> type[MaterialModel] | None:
+    """
+    Get the material model class of a MatML property set.
+
+    Parameters
+    ----------
+    property_set_name : str
+        Property set name.
+    behavior : str | None
+        Value of the ``Behavior`` qualifier of the property set, if any.
+
+    Returns
+    -------
+    type[MaterialModel] | None
+        The supported material model class, or None if the property set is not supported.
+    """
+    class_name = parse_property_set_name(property_set_name)
+    if behavior is not None:
+        class_name += behavior.replace(" ", "")
+    return _MATERIAL_MODEL_CLASSES.get(class_name)
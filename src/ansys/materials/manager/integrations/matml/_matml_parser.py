@@ -22,18 +22,24 @@
 
 from dataclasses import dataclass
 import re
-from typing import Any, Sequence, Union
+import sys
+from typing import Any, Callable, Optional, Sequence, Union
 import uuid
+import warnings
 import xml.etree.ElementTree as ET  # nosec B405
 
-from ansys.units import Quantity
+from ansys.units import Quantity, Unit
+import numpy as np
 
 from . import _matml_strings as matml_strings
 from ... import models as _models_package
 from ...models import IndependentParameter, InterpolationOptions, ModelQualifier
+from .._common import format_numbers
 
 MODEL_NAMESPACE = f"{_models_package.__name__}."
 
+MaterialFilter = Union[Sequence[str], Callable[[str], bool], None]
+
 
 @dataclass
 class Parameter:
@@ -44,6 +50,7 @@ class Parameter:
     qualifiers: dict
     unit: str
     unit_name: str
+    quantity_unit: Optional[Unit] = None
 
 
 @dataclass
@@ -57,10 +64,22 @@ class PropertySet:
     unit_name: str
 
 
-def convert(data: str, target: str) -> Union[str, float, list[float]]:
+@dataclass(frozen=True)
+class MetadataEntry:
+    """Define the name and units of a ParameterDetails or PropertyDetails entry."""
+
+    name: str
+    unit: str
+    unit_name: str
+    quantity_unit: Optional[Unit]
+
+
+def convert(data: str, target: str) -> Union[str, float, np.ndarray]:
     """
     Convert data to the target format.
 
+    Comma-separated floats are parsed in a single pass into a float64 array.
+
     Parameters
     ----------
     data : str
@@ -70,7 +89,7 @@ def convert(data: str, target: str) -> Union[str, float, list[float]]:
 
     Returns
     -------
-    Union[str, float, list[float]]
+    Union[str, float, np.ndarray]
         The converted data.
     """
     if target == "string":
@@ -82,9 +101,15 @@ def convert(data: str, target: str) -> Union[str, float, list[float]]:
     if not data or not data.strip():
         return 0.0
 
-    if data.count(",") > 0:
-        data = data.split(",")
-        return [float(v) for v in data]
+    n_separators = data.count(",")
+    if n_separators > 0:
+        with warnings.catch_warnings():
+            # the array is truncated with a DeprecationWarning on invalid data
+            warnings.simplefilter("ignore", DeprecationWarning)
+            values = np.fromstring(data, dtype=np.float64, sep=",")
+        if values.size != n_separators + 1:
+            raise ValueError(f"could not convert string to float array: {data!r}")
+        return values
     else:
         return float(data)
 
@@ -128,9 +153,22 @@ def xml_to_unit(param: ET.Element) -> tuple[str, dict[str, str]]:
     return id, entry
 
 
-def read_metadata(metadata_node: ET.Element) -> dict:
+def _parse_quantity_unit(unit: str) -> Optional[Unit]:
+    """Parse a MatML unit string, returning None if it is not a known unit."""
+    if unit == matml_strings.UNITLESS_KEY:
+        unit = ""
+    try:
+        return Unit(unit)
+    except ValueError:
+        return None
+
+
+def read_metadata(metadata_node: ET.Element) -> dict[str, MetadataEntry]:
     """Read metadata from the given XML node.
 
+    The strings of the entries are interned and each distinct unit string is parsed
+    once, so that the entries sharing a unit also share its ``Unit`` object.
+
     Parameters
     ----------
     metadata_node : ET.Element
@@ -138,17 +176,23 @@ def read_metadata(metadata_node: ET.Element) -> dict:
 
     Returns
     -------
-    dict
-        A dictionary containing metadata entries.
+    dict[str, MetadataEntry]
+        The metadata entries keyed by their ID.
     """
     data = {}
-    for item in metadata_node.iter(matml_strings.PARAMETER_DETAILS_KEY):
-        id, entry = xml_to_unit(item)
-        data[id] = entry
-
-    for item in metadata_node.iter(matml_strings.PROPERTY_DETAILS_KEY):
-        id, entry = xml_to_unit(item)
-        data[id] = entry
+    quantity_units = {}
+    for key in (matml_strings.PARAMETER_DETAILS_KEY, matml_strings.PROPERTY_DETAILS_KEY):
+        for item in metadata_node.iter(key):
+            id, entry = xml_to_unit(item)
+            unit = sys.intern(entry[matml_strings.UNITS_KEY])
+            if unit not in quantity_units:
+                quantity_units[unit] = _parse_quantity_unit(unit)
+            data[id] = MetadataEntry(
+                name=sys.intern(entry[matml_strings.NAME_KEY.capitalize()]),
+                unit=unit,
+                unit_name=sys.intern(entry[matml_strings.UNITS_NAME_KEY]),
+                quantity_unit=quantity_units[unit],
+            )
     return data
 
 
@@ -171,7 +215,9 @@ def read_qualifiers(property_node: ET.Element) -> dict:
     return qualifiers
 
 
-def read_property_sets_and_parameters(bulkdata: ET.Element, metadata_dict: dict) -> dict:
+def read_property_sets_and_parameters(
+    bulkdata: ET.Element, metadata_dict: dict[str, MetadataEntry]
+) -> dict:
     """
     Read property sets and parameters from the given XML node.
 
@@ -179,8 +225,8 @@ def read_property_sets_and_parameters(bulkdata: ET.Element, metadata_dict: dict)
     ----------
     bulkdata : ET.Element
         The XML node containing bulk data information.
-    metadata_dict : dict
-        A dictionary containing metadata entries.
+    metadata_dict : dict[str, MetadataEntry]
+        The metadata entries keyed by their ID.
     Returns
     -------
     dict
@@ -190,44 +236,65 @@ def read_property_sets_and_parameters(bulkdata: ET.Element, metadata_dict: dict)
 
     # iterate over the property sets
     for prop_data in bulkdata.findall(matml_strings.PROPERTY_DATA_KEY):
-        property_key = prop_data.attrib[matml_strings.PROPERTY_KEY]
-        property_name = metadata_dict[property_key][matml_strings.NAME_KEY.capitalize()]
-        property_unit = metadata_dict[property_key].get(matml_strings.UNITS_KEY, "")
-        property_unit_name = metadata_dict[property_key].get(matml_strings.UNITS_NAME_KEY, "")
+        property_entry = metadata_dict[prop_data.attrib[matml_strings.PROPERTY_KEY]]
         prop_set_qualifiers = read_qualifiers(prop_data)
 
         parameters = {}
 
         # iterate over each parameter
         for parameter in prop_data.findall(matml_strings.PARAMETER_VALUE_KEY):
-            parameter_key = parameter.attrib[matml_strings.PARAMETER_KEY]
-            parameter_name = metadata_dict[parameter_key][matml_strings.NAME_KEY.capitalize()]
+            parameter_entry = metadata_dict[parameter.attrib[matml_strings.PARAMETER_KEY]]
             parameter_format = parameter.attrib[matml_strings.FORMAT_KEY]
             param_qualifiers = read_qualifiers(parameter)
-            param_units = metadata_dict[parameter_key].get(matml_strings.UNITS_KEY, "")
-            param_units_name = metadata_dict[parameter_key].get(matml_strings.UNITS_NAME_KEY, "")
             data = convert(parameter.find(matml_strings.DATA_KEY).text, parameter_format)
 
-            parameters[parameter_name] = Parameter(
-                name=parameter_name,
+            parameters[parameter_entry.name] = Parameter(
+                name=parameter_entry.name,
                 data=data,
                 qualifiers=param_qualifiers,
-                unit=param_units,
-                unit_name=param_units_name,
+                unit=parameter_entry.unit,
+                unit_name=parameter_entry.unit_name,
+                quantity_unit=parameter_entry.quantity_unit,
             )
 
-        prop_dict[property_name] = PropertySet(
-            name=property_name,
+        prop_dict[property_entry.name] = PropertySet(
+            name=property_entry.name,
             qualifiers=prop_set_qualifiers,
             parameters=parameters,
-            unit=property_unit,
-            unit_name=property_unit_name,
+            unit=property_entry.unit,
+            unit_name=property_entry.unit_name,
         )
 
     return prop_dict
 
 
-def read_transfer_ids(root: ET.Element, materials: dict[str, dict]) -> dict[str, str]:
+def get_material_filter(material_names: MaterialFilter = None) -> Callable[[str], bool]:
+    """
+    Get a predicate selecting the materials to read by name.
+
+    Parameters
+    ----------
+    material_names : MaterialFilter
+        Names of the materials to read, or a predicate called with each material name.
+        If None, all materials are read.
+
+    Returns
+    -------
+    Callable[[str], bool]
+        Predicate returning True for the names of the materials to read.
+    """
+    if material_names is None:
+        return lambda name: True
+    if callable(material_names):
+        return material_names
+    if isinstance(material_names, str):
+        material_names = [material_names]
+    return set(material_names).__contains__
+
+
+def read_transfer_ids(
+    root: ET.Element, materials: dict[str, dict], material_names: MaterialFilter = None
+) -> dict[str, str]:
     """
     Read transfer IDs from the given XML root node.
 
@@ -237,17 +304,49 @@ def read_transfer_ids(root: ET.Element, materials: dict[str, dict]) -> dict[str,
         The XML root node.
     materials : dict[str, dict]
         A dictionary containing material entries.
+    material_names : MaterialFilter
+        Names of the materials that were read, or a predicate called with each
+        material name. Transfer IDs of the other materials are skipped.
+    Returns
+    -------
+    dict[str, str]
+        A dictionary mapping material names to their transfer IDs.
+    """
+    return read_transfer_ids_from_element(
+        root.find(matml_strings.WBTRANSFER_KEY), materials, material_names
+    )
+
+
+def read_transfer_ids_from_element(
+    wb_transfer_element: ET.Element | None,
+    materials: dict[str, dict],
+    material_names: MaterialFilter = None,
+) -> dict[str, str]:
+    """
+    Read transfer IDs from the given Workbench transfer data node.
+
+    Parameters
+    ----------
+    wb_transfer_element : ET.Element | None
+        The ``ANSYSWBTransferData`` XML node, or None if the document has none.
+    materials : dict[str, dict]
+        A dictionary whose keys are the material names.
+    material_names : MaterialFilter
+        Names of the materials that were read, or a predicate called with each
+        material name. Transfer IDs of the other materials are skipped.
     Returns
     -------
     dict[str, str]
         A dictionary mapping material names to their transfer IDs.
     """
+    select = get_material_filter(material_names)
     transfer_ids = {}
-    wb_transfer_element = root.find(matml_strings.WBTRANSFER_KEY)
     if wb_transfer_element is not None:
         materials_element = wb_transfer_element.find(matml_strings.MATERIALS_ELEMENT_KEY)
         for mat in materials_element.findall(matml_strings.MATERIAL_KEY.capitalize()):
             mat_name = mat.find(matml_strings.NAME_KEY.capitalize()).text
+            if not select(mat_name):
+                continue
             transfer_id_element = mat.find(matml_strings.DATA_TRANSFER_ID_KEY)
 
             if not mat_name in materials.keys():
@@ -262,7 +361,11 @@ def read_transfer_ids(root: ET.Element, materials: dict[str, dict]) -> dict[str,
     return transfer_ids
 
 
-def read_materials(matml_doc_node: ET.Element, metadata_dict: dict) -> dict:
+def read_materials(
+    matml_doc_node: ET.Element,
+    metadata_dict: dict[str, MetadataEntry],
+    material_names: MaterialFilter = None,
+) -> dict:
     """
     Read materials from the given XML node.
 
@@ -270,17 +373,24 @@ def read_materials(matml_doc_node: ET.Element, metadata_dict: dict) -> dict:
     ----------
     matml_doc_node : ET.Element
         The XML node containing material information.
-    metadata_dict : dict
+    metadata_dict : dict[str, MetadataEntry]
         A dictionary containing metadata entries.
+    material_names : MaterialFilter
+        Names of the materials to read, or a predicate called with each material name.
+        The property sets of the other materials are not read. If None, all materials
+        are read.
     Returns
     -------
     dict
         A dictionary containing material entries.
     """
+    select = get_material_filter(material_names)
     materials = {}
     for material in matml_doc_node.findall(matml_strings.MATERIAL_KEY.capitalize()):
         bulkdata = material.find(matml_strings.BULK_DETAILS_KEY)
         name = bulkdata.find(matml_strings.NAME_KEY.capitalize()).text
+        if not select(name):
+            continue
         data = read_property_sets_and_parameters(bulkdata, metadata_dict)
         materials[name] = data
 
@@ -304,7 +414,7 @@ def parse_property_set_name(property_set_name):
     return property_set_name.replace(" ", "").replace("-", "").replace("/", "")
 
 
-def get_data_and_unit(param: dict) -> tuple[list[float | int], str]:
+def get_data_and_unit(param: dict) -> tuple[np.ndarray | Sequence, str]:
     """
     Get data and unit from parameter.
 
@@ -315,19 +425,52 @@ def get_data_and_unit(param: dict) -> tuple[list[float | int], str]:
 
     Returns
     -------
-    tuple[list[float | int], str]
-        Data and units.
+    tuple[np.ndarray | Sequence, str]
+        Data and units. Numeric data is returned as a one-dimensional float64 array.
     """
     units = param.unit
     if units == matml_strings.UNITLESS_KEY:
         units = ""
     data = param.data
-    if not isinstance(data, Sequence):
+    if isinstance(data, float):
+        data = np.array([data])
+    elif not isinstance(data, (np.ndarray, Sequence)):
         data = [data]
     return data, units
 
 
-def create_xml_string_value(values: float | int | list[float | int]) -> str:
+def get_quantity(param: Parameter, data: Any = None) -> Quantity:
+    """
+    Create a quantity from a parameter.
+
+    The units are taken from the parsed unit of the metadata entry when it is known,
+    so the unit string is not parsed again for every parameter referencing the entry.
+
+    Parameters
+    ----------
+    param : Parameter
+        Parameter to convert.
+    data : Any
+        Values of the quantity. If None, the data of the parameter is used.
+
+    Returns
+    -------
+    Quantity
+        The quantity, with the same ``unit`` string as if created from the unit string.
+    """
+    values, units = get_data_and_unit(param)
+    if data is not None:
+        values = data
+    if param.quantity_unit is None:
+        return Quantity(value=values, units=units)
+    quantity = Quantity(value=values, units=param.quantity_unit)
+    quantity.unit = units
+    return quantity
+
+
+def create_xml_string_value(
+    values: float | int | list[float | int], precision: int | None = None
+) -> str:
     """
     Extract the value for the xml.
 
@@ -335,15 +478,16 @@ def create_xml_string_value(values: float | int | list[float | int]) -> str:
     ----------
     values : float | int | list[float | int]
         Value to be parsed.
+    precision : int | None
+        Number of significant digits of the floats. If None, the floats are written
+        so that they are read back unchanged.
 
     Returns
     -------
     str
         Parsed value to add to xml data.
     """
-    if not hasattr(values, "__iter__"):
-        values = [values]
-    return ", ".join(f"{v}" for v in values)
+    return format_numbers(values, precision)
 
 
 def convert_to_float_or_keep(val: float | str | None) -> float | str | None:
@@ -426,10 +570,9 @@ def fill_independent_parameter(param_value: Parameter) -> IndependentParameter:
     IndependentParameter
         The converted IndependentParameter.
     """
-    data, units = get_data_and_unit(param_value)
     independent_param = IndependentParameter(
         name=param_value.name,
-        values=Quantity(value=data, units=units),
+        values=get_quantity(param_value),
         default_value=convert_to_float_or_keep(
             param_value.qualifiers.get(matml_strings.DEFAULT_DATA_KEY, None)
         ),
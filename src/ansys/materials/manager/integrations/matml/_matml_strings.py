@@ -25,6 +25,7 @@ ALGORITHM_TYPE_KEY = "AlgorithmType"
 BEHAVIOR_KEY = "Behavior"
 BULK_DETAILS_KEY = "BulkDetails"
 CACHED_KEY = "Cached"
+CONTENT_HASH_KEY = "contenthash"
 DASH_KEY = "-"
 DATA_KEY = "Data"
 DATA_TRANSFER_ID_KEY = "DataTransferID"
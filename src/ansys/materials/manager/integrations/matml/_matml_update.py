@@ -0,0 +1,246 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Provides helpers to update the materials of an existing MatML file in place."""
+
+from dataclasses import dataclass, field
+import hashlib
+import os
+from pathlib import Path
+import shutil
+import tempfile
+from typing import BinaryIO, Optional
+import xml.etree.ElementTree as ET  # nosec B405
+from xml.parsers import expat  # nosec B407
+
+from defusedxml import EntitiesForbidden, ExternalReferenceForbidden
+
+from . import _matml_strings as matml_strings
+from .._common import _PATH_TYPE
+
+_Span = tuple[int, int]
+_COPY_CHUNK_SIZE = 2**20
+
+
+@dataclass
+class MatmlLayout:
+    """Byte offsets of the top-level elements of a MatML file."""
+
+    materials: dict[str, _Span] = field(default_factory=dict)
+    material_hashes: dict[str, str] = field(default_factory=dict)
+    last_material_end: Optional[int] = None
+    metadata: Optional[_Span] = None
+    materials_element: Optional[_Span] = None
+    transfer_ids: Optional[_Span] = None
+
+
+def _forbid_entity_declaration(
+    name, is_parameter_entity, value, base, sysid, pubid, notation_name
+):  # pragma: no cover
+    raise EntitiesForbidden(name, value, base, sysid, pubid, notation_name)
+
+
+def _forbid_unparsed_entity_declaration(
+    name, base, sysid, pubid, notation_name
+):  # pragma: no cover
+    raise EntitiesForbidden(name, None, base, sysid, pubid, notation_name)
+
+
+def _forbid_external_references(context, base, sysid, pubid):  # pragma: no cover
+    raise ExternalReferenceForbidden(context, base, sysid, pubid)
+
+
+def scan_matml_layout(path: _PATH_TYPE) -> MatmlLayout:
+    """
+    Locate the materials, the metadata and the transfer IDs of a MatML file.
+
+    The file is scanned with expat without building a tree, so the cost is a single
+    pass over the bytes of the file.
+
+    Parameters
+    ----------
+    path : _PATH_TYPE
+        Path to the MatML file.
+
+    Returns
+    -------
+    MatmlLayout
+        The byte spans of the elements and the content hashes stored on the materials.
+        Materials are keyed by name; if several materials share a name, the first one
+        is recorded.
+    """
+    material_tag = matml_strings.MATERIAL_KEY.capitalize()
+    name_tag = matml_strings.NAME_KEY.capitalize()
+    layout = MatmlLayout()
+    # Each entry holds the tag and the byte offset of its start tag.
+    stack: list[tuple[str, int]] = []
+    # Spans whose end offset is the start of the end tag, resolved after the scan.
+    open_spans: dict[str, list] = {}
+    name_parts: Optional[list[str]] = None
+    material_names: list[str] = []
+    material_hashes: list[Optional[str]] = []
+
+    parser = expat.ParserCreate()  # nosec B314
+    parser.buffer_text = True
+    parser.EntityDeclHandler = _forbid_entity_declaration
+    parser.UnparsedEntityDeclHandler = _forbid_unparsed_entity_declaration
+    parser.ExternalEntityRefHandler = _forbid_external_references
+
+    def start_element(tag: str, attributes: dict) -> None:
+        nonlocal name_parts
+        parent = stack[-1][0] if stack else None
+        stack.append((tag, parser.CurrentByteIndex))
+        if (
+            tag == name_tag
+            and len(stack) >= 4
+            and stack[-2][0] == matml_strings.BULK_DETAILS_KEY
+            and stack[-3][0] == material_tag
+            and stack[-4][0] == matml_strings.MATML_DOC_KEY
+            and len(material_names) < len(open_spans.get(material_tag, []))
+        ):
+            name_parts = []
+        elif parent == matml_strings.MATML_DOC_KEY and tag in (
+            material_tag,
+            matml_strings.METADATA_KEY,
+        ):
+            open_spans.setdefault(tag, []).append([parser.CurrentByteIndex, None])
+            if tag == material_tag:
+                material_hashes.append(attributes.get(matml_strings.CONTENT_HASH_KEY))
+        elif len(stack) == 2 and tag in (
+            matml_strings.MATERIALS_ELEMENT_KEY,
+            matml_strings.WBTRANSFER_KEY,
+        ):
+            open_spans.setdefault(tag, []).append([parser.CurrentByteIndex, None])
+
+    def end_element(tag: str) -> None:
+        nonlocal name_parts
+        _, start = stack.pop()
+        if name_parts is not None and tag == name_tag:
+            material_names.append("".join(name_parts))
+            name_parts = None
+        elif tag in open_spans and open_spans[tag][-1][0] == start:
+            open_spans[tag][-1][1] = parser.CurrentByteIndex
+
+    def character_data(data: str) -> None:
+        if name_parts is not None:
+            name_parts.append(data)
+
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.CharacterDataHandler = character_data
+    with open(path, "rb") as fp:
+        parser.ParseFile(fp)
+
+        def resolve(span: list) -> _Span:
+            # The end offset points to the end tag, or to the start tag of an empty element.
+            fp.seek(span[1])
+            return span[0], span[1] + fp.read(_COPY_CHUNK_SIZE).index(b">") + 1
+
+        material_spans = [resolve(span) for span in open_spans.get(material_tag, [])]
+        for name, span, content_hash in zip(material_names, material_spans, material_hashes):
+            if name not in layout.materials:
+                layout.materials[name] = span
+                if content_hash is not None:
+                    layout.material_hashes[name] = content_hash
+        if material_spans:
+            layout.last_material_end = material_spans[-1][1]
+        if matml_strings.METADATA_KEY in open_spans:
+            layout.metadata = resolve(open_spans[matml_strings.METADATA_KEY][0])
+        if matml_strings.MATERIALS_ELEMENT_KEY in open_spans:
+            layout.materials_element = resolve(open_spans[matml_strings.MATERIALS_ELEMENT_KEY][0])
+        if matml_strings.WBTRANSFER_KEY in open_spans:
+            layout.transfer_ids = resolve(open_spans[matml_strings.WBTRANSFER_KEY][0])
+    return layout
+
+
+def read_span(fp: BinaryIO, span: _Span) -> bytes:
+    """Read the bytes of a span from a file opened in binary mode."""
+    fp.seek(span[0])
+    return fp.read(span[1] - span[0])
+
+
+def get_content_hash(element: ET.Element, encoding: str) -> str:
+    """
+    Get a hash of the content of an element, ignoring the indentation.
+
+    Parameters
+    ----------
+    element : ET.Element
+        The element to hash. Whitespace-only text and tails are removed in place.
+    encoding : str
+        Encoding used to serialize the element.
+
+    Returns
+    -------
+    str
+        The SHA-256 hex digest of the serialized element.
+    """
+    for child in element.iter():
+        if child.text is not None and not child.text.strip():
+            child.text = None
+        if child.tail is not None and not child.tail.strip():
+            child.tail = None
+    element.tail = None
+    return hashlib.sha256(ET.tostring(element, encoding=encoding)).hexdigest()
+
+
+def splice_file(path: _PATH_TYPE, edits: list[tuple[int, int, bytes]]) -> None:
+    """
+    Replace byte spans of a file.
+
+    The unchanged bytes are copied to a temporary file, which then replaces the file.
+
+    Parameters
+    ----------
+    path : _PATH_TYPE
+        Path to the file.
+    edits : list[tuple[int, int, bytes]]
+        Non-overlapping ``(start, end, replacement)`` edits. An empty span inserts the
+        replacement at ``start``.
+    """
+    path = Path(path)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with open(path, "rb") as source, os.fdopen(fd, "wb") as target:
+            position = 0
+            for start, end, replacement in sorted(edits, key=lambda edit: edit[:2]):
+                _copy_range(source, target, position, start)
+                target.write(replacement)
+                position = end
+            source.seek(position)
+            shutil.copyfileobj(source, target, _COPY_CHUNK_SIZE)
+        shutil.copymode(path, temp_path)
+        os.replace(temp_path, path)
+    finally:
+        Path(temp_path).unlink(missing_ok=True)
+
+
+def _copy_range(source: BinaryIO, target: BinaryIO, start: int, end: int) -> None:
+    """Copy the bytes between two offsets of the source file to the target file."""
+    source.seek(start)
+    remaining = end - start
+    while remaining > 0:
+        chunk = source.read(min(remaining, _COPY_CHUNK_SIZE))
+        if not chunk:
+            break
+        target.write(chunk)
+        remaining -= len(chunk)
@@ -24,7 +24,7 @@ from ansys.units import Quantity
 
 from ...models import ElasticityAnisotropic, HillYieldCriterion, ModelQualifier, UserParameter
 from .._common import get_creep_flag
-from ._matml_parser import get_data_and_unit
+from ._matml_parser import get_data_and_unit, get_quantity
 
 
 def map_from_anisotropic_elasticity(
@@ -149,12 +149,12 @@ def map_to_anisotropic_elasticity(property_set: dict) -> tuple[list[str], list[Q
     for j in range(6):
         label = labels[j]
         column_values = property_set.parameters.get(label)
-        values, units = get_data_and_unit(column_values)
+        values, _ = get_data_and_unit(column_values)
         for i in range(6):
             if j >= i:
                 attribute_name = f"c_{i+1}{j+1}"
                 attributes.append(attribute_name)
-                quantities.append(Quantity(value=[values[i]], units=units))
+                quantities.append(get_quantity(column_values, [values[i]]))
     return attributes, quantities
 
 
@@ -264,8 +264,7 @@ def map_to_hill_yield_criterion(property_set: dict) -> tuple[list[str], list[Qua
     for label in labels[idx].keys():
         values = property_set.parameters.get(label, None)
         if values:
-            values, units = get_data_and_unit(values)
-            quantities.append(Quantity(value=values, units=units))
+            quantities.append(get_quantity(values))
 
     return list(labels[idx].values()), quantities
 
@@ -288,8 +287,7 @@ def map_to_model_coefficients(property_set: dict) -> tuple[list[str], list[Quant
     for parameter_name, parameter_value in property_set.parameters.items():
         if "UserMat Constant" in parameter_value.qualifiers.keys():
             user_mat_constant = parameter_value.qualifiers["UserMat Constant"]
-            data, units = get_data_and_unit(parameter_value)
-            quantity = Quantity(value=data, units=units)
+            quantity = get_quantity(parameter_value)
             user_parameters.append(
                 UserParameter(
                     name=parameter_name, values=quantity, user_mat_constant=user_mat_constant
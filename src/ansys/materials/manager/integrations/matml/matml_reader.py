@@ -22,30 +22,38 @@
 
 """Provides the ``matml_parser`` module."""
 
+from concurrent.futures import ProcessPoolExecutor
 import os
-from pydoc import locate
-from typing import Optional, Union
+from typing import Iterator, Optional, Union
 import warnings
+import xml.etree.ElementTree as ET  # nosec B405
 
-from ansys.units import Quantity
-from defusedxml.ElementTree import fromstring
+from defusedxml.ElementTree import fromstring, iterparse
 
 from . import _matml_strings as matml_strings
 from ... import models as _models_package
 from ...models import Material, MaterialModel
-from ._matml_model_map import MATERIAL_MODEL_MAP
+from ._matml_cache import MatmlCache
+from ._matml_model_map import MATERIAL_MODEL_MAP, get_material_model_class
 from ._matml_parser import (
+    MaterialFilter,
     fill_independent_parameter,
     fill_interpolation_options,
-    get_data_and_unit,
+    get_material_filter,
     get_material_model_name_and_qualifiers,
+    get_quantity,
     read_materials,
     read_metadata,
+    read_property_sets_and_parameters,
     read_transfer_ids,
+    read_transfer_ids_from_element,
 )
 
 _PATH_TYPE = Union[str, os.PathLike]
 MODEL_NAMESPACE = f"{_models_package.__name__}."
+# Number of chunks submitted to each worker process, to balance the load when
+# the materials differ in size.
+_CHUNKS_PER_WORKER = 4
 
 
 class MatmlReader:
@@ -57,13 +65,24 @@ class MatmlReader:
     The conversion into a specific format/object representation is implemented separately.
 
     The data can be accessed via matml_reader.materials
+
+    For large files, create the reader with ``lazy=True`` and use
+    :meth:`iter_materials` to convert the materials one at a time without
+    holding the whole document in memory.
     """
 
     _materials: dict
     _transfer_ids = dict
     _matml_file_path: _PATH_TYPE
 
-    def __init__(self, file_path: _PATH_TYPE):
+    def __init__(
+        self,
+        file_path: _PATH_TYPE,
+        lazy: bool = False,
+        material_names: MaterialFilter = None,
+        workers: Optional[int] = None,
+        cache: Union[bool, MatmlCache] = False,
+    ):
         """
         Create a new MatML reader object.
 
@@ -71,13 +90,40 @@ class MatmlReader:
         ----------
         file_path :
             MatML (engineering data xml) file path
+        lazy : bool
+            If True, the file is not parsed on creation. The materials are read
+            incrementally from the file by :meth:`iter_materials` instead.
+        material_names : MaterialFilter
+            Names of the materials to read, or a predicate called with each material
+            name. The other materials of the file are skipped before their property
+            sets are read. If None, all materials are read.
+        workers : Optional[int]
+            Number of worker processes used by :meth:`convert_matml_materials` to convert
+            the parsed materials. If None, the materials are converted in the current
+            process. Ignored if ``lazy`` is True.
+        cache : Union[bool, MatmlCache]
+            Cache of the converted materials. If True, a :class:`MatmlCache` in the cache
+            directory of the user is used. On a cache hit, :meth:`convert_matml_materials`
+            loads the materials from the cache without parsing the file. The cache is
+            not used if ``material_names`` is a predicate.
         """
+        if workers is not None and workers < 1:
+            raise ValueError(f"The number of workers must be at least 1, got {workers}.")
         self._matml_file_path = file_path
+        self._lazy = lazy
+        self._material_names = material_names
+        self._workers = workers
         self._materials = {}
         self._transfer_ids = {}
+        self._parsed = False
         if not os.path.exists(file_path):
             raise RuntimeError(f"Cannot initialize MatmlReader {file_path}. File does not exist!")
-        self.parse_from_file()
+        self._cache = MatmlCache() if cache is True else cache or None
+        self._cache_key = None
+        if self._cache is not None and not callable(material_names):
+            self._cache_key = self._cache.get_key(file_path, material_names)
+        if not lazy and not (self._cache_key and self._cache.contains(self._cache_key)):
+            self.parse_from_file()
 
     def _parse_text(self, matml_content: str) -> dict[str, Union[str, dict]]:
         """Read MatML (engineering data XML) data from a string.
@@ -111,8 +157,8 @@ class MatmlReader:
             )
         metadata_dict = read_metadata(metadata_node)
 
-        materials = read_materials(matml_doc_node, metadata_dict)
-        transfer_ids = read_transfer_ids(root, materials)
+        materials = read_materials(matml_doc_node, metadata_dict, self._material_names)
+        transfer_ids = read_transfer_ids(root, materials, self._material_names)
         return {
             material_id: {
                 "material": materials[material_id],
@@ -143,6 +189,7 @@ class MatmlReader:
         parsed_data = self._parse_text(file_content)
         self._materials = {k: v["material"] for k, v in parsed_data.items()}
         self._transfer_ids = {k: v["transfer_id"] for k, v in parsed_data.items()}
+        self._parsed = True
 
     @property
     def materials(self) -> Optional[dict]:
@@ -241,7 +288,12 @@ class MatmlReader:
         dict
             A dictionary mapping material model attributes to their corresponding quantities.
         """
-        mapping = MATERIAL_MODEL_MAP[material_model.__class__]
+        return self._map_to_model_attributes(material_model.__class__, property_set)
+
+    @staticmethod
+    def _map_to_model_attributes(model_class: type[MaterialModel], property_set: dict) -> dict:
+        """Map MatML property set to the attributes of a material model class."""
+        mapping = MATERIAL_MODEL_MAP[model_class]
         if mapping.method_read:
             attributes, quantities = mapping.method_read(property_set)
         else:
@@ -253,9 +305,8 @@ class MatmlReader:
                     attribute = mapping.attributes[i]
                     if label in property_set.parameters.keys():
                         param = property_set.parameters[label]
-                        data, units = get_data_and_unit(param)
                         attributes.append(attribute)
-                        quantities.append(Quantity(value=data, units=units))
+                        quantities.append(get_quantity(param))
         return dict(zip(attributes, quantities))
 
     def is_supported(self, material_model: MaterialModel) -> bool:
@@ -277,60 +328,213 @@ class MatmlReader:
         else:
             return False
 
+    def _iter_document_elements(self) -> Iterator[ET.Element]:
+        """
+        Yield the top-level elements of the MatML file as they are parsed.
+
+        The materials and the metadata (children of the ``MatML_Doc`` node) and the
+        Workbench transfer data are yielded once they are complete. Each element is
+        removed from the tree when the caller requests the next one so that the
+        memory of processed subtrees is released.
+        """
+        tags = []
+        parents = []
+        for event, element in iterparse(self._matml_file_path, events=("start", "end")):
+            if event == "start":
+                tags.append(element.tag)
+                parents.append(element)
+                continue
+            tags.pop()
+            parents.pop()
+            if (tags and tags[-1] == matml_strings.MATML_DOC_KEY) or (
+                element.tag == matml_strings.WBTRANSFER_KEY
+            ):
+                yield element
+                parents[-1].remove(element)
+
+    def _read_document_header(self) -> tuple[dict, dict[str, str]]:
+        """
+        Read the metadata and the Workbench transfer IDs of the MatML file.
+
+        Both sections follow the materials in the document, so the file is scanned
+        once without converting the materials to collect them.
+
+        Returns
+        -------
+        tuple[dict, dict[str, str]]
+            The metadata dictionary and the transfer IDs keyed by material name.
+        """
+        select = get_material_filter(self._material_names)
+        metadata_dict = None
+        material_names = {}
+        wb_transfer_element = None
+        for element in self._iter_document_elements():
+            if element.tag == matml_strings.MATERIAL_KEY.capitalize():
+                bulkdata = element.find(matml_strings.BULK_DETAILS_KEY)
+                name = bulkdata.find(matml_strings.NAME_KEY.capitalize()).text
+                if select(name):
+                    material_names[name] = {}
+            elif element.tag == matml_strings.METADATA_KEY:
+                metadata_dict = read_metadata(element)
+            elif element.tag == matml_strings.WBTRANSFER_KEY:
+                wb_transfer_element = element
+        if metadata_dict is None:
+            raise RuntimeError(
+                "Metadata node not found. Please check if this is a valid MATML file."
+            )
+        return metadata_dict, read_transfer_ids_from_element(
+            wb_transfer_element, material_names, self._material_names
+        )
+
+    def iter_materials(self) -> Iterator[Material]:
+        """
+        Read the MatML file incrementally and yield its materials one at a time.
+
+        The file is parsed with ``iterparse`` in two passes: the first pass collects the
+        metadata and the Workbench transfer IDs, which follow the materials in the
+        document, and the second pass converts each material as soon as its element is
+        complete. Processed elements are discarded, so the memory usage is bounded by
+        the largest material rather than by the size of the file.
+
+        Yields
+        ------
+        Material
+            The converted materials, in the order of the file.
+        """
+        select = get_material_filter(self._material_names)
+        metadata_dict, transfer_ids = self._read_document_header()
+        global_material_index = 1
+        for element in self._iter_document_elements():
+            if element.tag == matml_strings.METADATA_KEY:
+                break
+            if element.tag != matml_strings.MATERIAL_KEY.capitalize():
+                continue
+            bulkdata = element.find(matml_strings.BULK_DETAILS_KEY)
+            name = bulkdata.find(matml_strings.NAME_KEY.capitalize()).text
+            if not select(name):
+                continue
+            material_data = read_property_sets_and_parameters(bulkdata, metadata_dict)
+            yield self._convert_material(
+                name, material_data, global_material_index, transfer_ids.get(name)
+            )
+            global_material_index += 1
+
+    @staticmethod
+    def _convert_material(
+        name: str,
+        material_data: dict,
+        material_id: int,
+        transfer_id: Optional[str] = None,
+    ) -> Material:
+        """
+        Convert the property sets of a single MatML material.
+
+        Parameters
+        ----------
+        name : str
+            Name of the material.
+        material_data : dict
+            Property sets of the material, keyed by property set name.
+        material_id : int
+            Material ID assigned to the material.
+        transfer_id : Optional[str]
+            Workbench transfer ID of the material, if any.
+
+        Returns
+        -------
+        Material
+            The converted material.
+        """
+        models = []
+        for propset_name, property_set in material_data.items():
+            cls_target, qualifiers = get_material_model_name_and_qualifiers(
+                propset_name, property_set
+            )
+            model_class = get_material_model_class(
+                propset_name, property_set.qualifiers.get(matml_strings.BEHAVIOR_KEY)
+            )
+            if model_class is None:
+                print(f"Could not find a material model for: {cls_target.split('.')[-1]}")
+                continue
+            model_fields = MatmlReader._map_to_model_attributes(model_class, property_set)
+            model_fields["model_qualifiers"] = qualifiers
+            independent_parameters = []
+            for param_value in property_set.parameters.values():
+                ind_param = param_value.qualifiers.get(matml_strings.VARIABLE_TYPE_KEY)
+                if ind_param and ind_param.split(",")[0] == matml_strings.INDEPENDENT_KEY:
+                    independent_parameters.append(fill_independent_parameter(param_value))
+            if len(independent_parameters) > 0:
+                model_fields["independent_parameters"] = independent_parameters
+            if matml_strings.OPTIONS_VARIABLE_KEY in property_set.parameters.keys():
+                variable_options = property_set.parameters[
+                    matml_strings.OPTIONS_VARIABLE_KEY
+                ].qualifiers
+                model_fields["interpolation_options"] = fill_interpolation_options(variable_options)
+            models.append(model_class(**model_fields))
+        matml_material = Material(name=name, material_id=material_id, models=models)
+        if transfer_id is not None:
+            matml_material.guid = transfer_id
+        return matml_material
+
     def convert_matml_materials(self) -> dict[str, Material]:
         """
         Convert MatML materials to the internal material representation.
 
+        If the reader was created with ``lazy=True``, the materials are read
+        incrementally from the file with :meth:`iter_materials`. If it was created
+        with ``workers``, the materials are converted in a pool of worker processes.
+        The order of the materials and their IDs do not depend on the number of
+        workers. If the reader was created with ``cache``, the materials are loaded
+        from the cache if possible and stored in it otherwise.
+
         Returns
         -------
         dict[str, Sequence[Material]]
             A dictionary mapping material names to their Material objects.
         """
+        if self._cache_key is not None:
+            materials = self._cache.load(self._cache_key)
+            if materials is not None:
+                return materials
+
+        if self._lazy:
+            materials = {material.name: material for material in self.iter_materials()}
+        else:
+            if not self._parsed:
+                self.parse_from_file()
+            materials = self._convert_parsed_materials()
+
+        if self._cache_key is not None:
+            self._cache.store(self._cache_key, materials)
+        return materials
+
+    def _convert_parsed_materials(self) -> dict[str, Material]:
+        """Convert the materials parsed from the file, in worker processes if requested."""
         # int to offset the material id (number) to avoid
         # conflicts with already existing materials
         index_offset = 0
-        global_material_index = 1 + index_offset
-        materials = {}
-        for mat_id, material_data in self._materials.items():
-            models = []
-            for propset_name, property_set in material_data.items():
-                cls_target, qualifiers = get_material_model_name_and_qualifiers(
-                    propset_name, property_set
-                )
-                class_located = locate(cls_target)
-                supported = False
-                if class_located:
-                    cls = class_located(model_qualifiers=qualifiers)
-                    if self.is_supported(cls):
-                        supported = True
-                        attributes_map = self.map_to_material_attributes(cls, property_set)
-                        for attribute, quantity in attributes_map.items():
-                            setattr(cls, attribute, quantity)
-                        independent_parameters = []
-                        for param_value in property_set.parameters.values():
-                            ind_param = param_value.qualifiers.get(matml_strings.VARIABLE_TYPE_KEY)
-                            if (
-                                ind_param
-                                and ind_param.split(",")[0] == matml_strings.INDEPENDENT_KEY
-                            ):
-                                independent_param = fill_independent_parameter(param_value)
-                                independent_parameters.append(independent_param)
-                        if len(independent_parameters) > 0:
-                            setattr(cls, "independent_parameters", independent_parameters)
-                        if matml_strings.OPTIONS_VARIABLE_KEY in property_set.parameters.keys():
-                            variable_options = property_set.parameters[
-                                matml_strings.OPTIONS_VARIABLE_KEY
-                            ].qualifiers
-                            interpolation_options = fill_interpolation_options(variable_options)
-                            setattr(cls, "interpolation_options", interpolation_options)
-
-                        models.append(cls)
-                if not supported:
-                    print(f"Could not find a material model for: {cls_target.split('.')[-1]}")
-            matml_material = Material(name=mat_id, material_id=global_material_index, models=models)
-            if mat_id in self._transfer_ids:
-                matml_material.guid = self._transfer_ids[mat_id]
-            materials[mat_id] = matml_material
-            global_material_index += 1
-
-        return materials
+        conversion_args = [
+            (mat_id, material_data, global_material_index, self._transfer_ids.get(mat_id))
+            for global_material_index, (mat_id, material_data) in enumerate(
+                self._materials.items(), start=1 + index_offset
+            )
+        ]
+        if self._workers is None or self._workers == 1 or len(conversion_args) < 2:
+            converted = _convert_materials(conversion_args)
+        else:
+            converted = []
+            chunk_size = -(-len(conversion_args) // (self._workers * _CHUNKS_PER_WORKER))
+            chunks = [
+                conversion_args[start : start + chunk_size]
+                for start in range(0, len(conversion_args), chunk_size)
+            ]
+            with ProcessPoolExecutor(max_workers=self._workers) as executor:
+                for chunk in executor.map(_convert_materials, chunks):
+                    converted.extend(chunk)
+
+        return {material.name: material for material in converted}
+
+
+def _convert_materials(conversion_args: list[tuple]) -> list[Material]:
+    """Convert a chunk of parsed MatML materials, in a worker process if needed."""
+    return [MatmlReader._convert_material(*args) for args in conversion_args]
@@ -21,10 +21,14 @@
 # SOFTWARE.
 
 from functools import singledispatchmethod
-from typing import Optional
+import hashlib
+import logging
+from typing import BinaryIO, Callable, Iterator, Optional
 import xml.etree.ElementTree as ET  # nosec B405
+from xml.sax.saxutils import quoteattr  # nosec B406
 
 from ansys.units import Quantity
+from defusedxml.ElementTree import fromstring
 
 from . import _matml_strings as _matml_strings
 from ...models import (
@@ -35,7 +39,7 @@ from ...models import (
     ModelQualifier,
     UserParameter,
 )
-from .._common import _PATH_TYPE
+from .._common import _PATH_TYPE, format_number_list
 from ..base_visitor import BaseVisitor
 from ..material_model_writer_visitor import UnsupportedMaterialModelError
 from ._matml_model_map import MATERIAL_MODEL_MAP
@@ -44,6 +48,12 @@ from ._matml_parser import (
     create_xml_string_value,
     unit_to_xml,
 )
+from ._matml_update import get_content_hash, read_span, scan_matml_layout, splice_file
+
+# Default encoding of ``ElementTree.write``
+_ENCODING = "us-ascii"
+
+_logger = logging.getLogger(__name__)
 
 
 class MatmlWriter(BaseVisitor):
@@ -52,6 +62,10 @@ class MatmlWriter(BaseVisitor):
     On construction, each supported :class:`~.MaterialModel` on the given
     materials is visited via :meth:`~.MaterialModel.accept`. Output XML
     fragments are stored in ``_material_repr`` until :meth:`write` is called.
+
+    In streaming mode, the materials are visited by :meth:`write` instead, and
+    each material is written to the file and released before the next one is
+    visited. The output is identical to the default mode.
     """
 
     _metadata_property_sets: dict
@@ -59,14 +73,33 @@ class MatmlWriter(BaseVisitor):
     _metadata_parameters_units: dict
     _metadata_property_sets_units: dict
 
-    def __init__(self, materials: list[Material]):
-        """Initialize the class."""
+    def __init__(
+        self, materials: list[Material], stream: bool = False, precision: Optional[int] = None
+    ):
+        """
+        Initialize the class.
+
+        Parameters
+        ----------
+        materials : list[Material]
+            Materials to write.
+        stream : bool
+            If True, the materials are not visited on construction but one at a time
+            when they are written, so that only one material is held in memory.
+        precision : Optional[int]
+            Number of significant digits of the written floats. If None, the floats
+            are written so that they are read back unchanged.
+        """
         super().__init__(materials=materials, model_map=MATERIAL_MODEL_MAP)
+        self._stream = stream
+        self._precision = precision
         self._metadata_parameters = {}
         self._metadata_property_sets = {}
         self._metadata_parameters_units = {}
         self._metadata_property_sets_units = {}
-        self.visit_materials()
+        self._metadata_ids = set()
+        if not stream:
+            self.visit_materials()
 
     @singledispatchmethod
     def visit(self, material_model: MaterialModel, *, material_name: str):
@@ -88,8 +121,9 @@ class MatmlWriter(BaseVisitor):
         if property_name in self._metadata_property_sets.keys():
             property_id = self._metadata_property_sets[property_name]
         else:
-            index = len(self._metadata_property_sets)
-            property_id = _matml_strings.PROPERTY_ID + str(index)
+            property_id = self._new_metadata_id(
+                _matml_strings.PROPERTY_ID, len(self._metadata_property_sets)
+            )
             self._metadata_property_sets[property_name] = property_id
         return property_id
 
@@ -98,8 +132,9 @@ class MatmlWriter(BaseVisitor):
         if parameter_name in self._metadata_parameters.keys():
             parameter_id = self._metadata_parameters[parameter_name]
         else:
-            index = len(self._metadata_parameters)
-            parameter_id = _matml_strings.PARAMETER_ID + str(index)
+            parameter_id = self._new_metadata_id(
+                _matml_strings.PARAMETER_ID, len(self._metadata_parameters)
+            )
             self._metadata_parameters[parameter_name] = parameter_id
             if unit:
                 if unit == "":
@@ -107,6 +142,15 @@ class MatmlWriter(BaseVisitor):
                 self._metadata_parameters_units[parameter_name] = unit
         return parameter_id
 
+    def _new_metadata_id(self, prefix: str, index: int) -> str:
+        """Get the first unused metadata id with the prefix, starting at the index."""
+        metadata_id = prefix + str(index)
+        while metadata_id in self._metadata_ids:
+            index += 1
+            metadata_id = prefix + str(index)
+        self._metadata_ids.add(metadata_id)
+        return metadata_id
+
     def _add_qualifier(
         self, data_element: ET.Element, qualifier_key: str, qualifier_value: str
     ) -> None:
@@ -191,11 +235,9 @@ class MatmlWriter(BaseVisitor):
                 values = independent_parameter.values
                 if isinstance(values, Quantity):
                     values = values.value
-                values = ", ".join(f"{v}" for v in values)
-                data_element.text = values
-                qualifier_value = ",".join(
-                    [_matml_strings.INDEPENDENT_KEY] * len(values.split(","))
-                )
+                values = format_number_list(values, self._precision)
+                data_element.text = ", ".join(values)
+                qualifier_value = ",".join([_matml_strings.INDEPENDENT_KEY] * len(values))
                 self._add_qualifier(
                     parameter_element, _matml_strings.VARIABLE_TYPE_KEY, qualifier_value
                 )
@@ -239,12 +281,14 @@ class MatmlWriter(BaseVisitor):
                 data_element = ET.SubElement(parameter_element, _matml_strings.DATA_KEY)
                 if isinstance(dependent_parameters[key], Quantity):
                     if hasattr(dependent_parameters[key], "value"):
-                        values = create_xml_string_value(dependent_parameters[key].value)
+                        values = create_xml_string_value(
+                            dependent_parameters[key].value, self._precision
+                        )
                 else:
                     if isinstance(dependent_parameters[key], str):
                         values = dependent_parameters[key]
                     else:
-                        values = create_xml_string_value(dependent_parameters[key])
+                        values = create_xml_string_value(dependent_parameters[key], self._precision)
                 data_element.text = values
                 qualifier_value = ",".join([_matml_strings.DEPENDENT_KEY] * len(values.split(",")))
                 self._add_qualifier(
@@ -269,7 +313,7 @@ class MatmlWriter(BaseVisitor):
                     },
                 )
                 data_element = ET.SubElement(parameter_element, _matml_strings.DATA_KEY)
-                values = create_xml_string_value(user_parameter.values.value)
+                values = create_xml_string_value(user_parameter.values.value, self._precision)
                 data_element.text = values
                 qualifier_value = ",".join([_matml_strings.DEPENDENT_KEY] * len(values.split(",")))
                 self._add_qualifier(
@@ -309,31 +353,43 @@ class MatmlWriter(BaseVisitor):
     def _add_metadata(self, metadata_element: ET.Element) -> None:
         """Add the metadata to the XML tree."""
         for key, value in self._metadata_property_sets.items():
-            prop_element = ET.SubElement(
-                metadata_element,
-                _matml_strings.PROPERTY_DETAILS_KEY,
-                {_matml_strings.ID_KEY: value},
-            )
-            ET.SubElement(prop_element, _matml_strings.UNITLESS_KEY)
-            name_element = ET.SubElement(prop_element, _matml_strings.NAME_KEY.capitalize())
-            name_element.text = key
+            metadata_element.append(self._property_details_to_etree(key, value))
         for key, value in self._metadata_parameters.items():
-            prop_element = ET.SubElement(
-                metadata_element,
-                _matml_strings.PARAMETER_DETAILS_KEY,
-                {_matml_strings.ID_KEY: value},
-            )
-            units = self._metadata_parameters_units.get(key, None)
-            if units:
-                prop_element.append(unit_to_xml(units))
-            else:
-                ET.SubElement(prop_element, _matml_strings.UNITLESS_KEY)
-            name_element = ET.SubElement(prop_element, _matml_strings.NAME_KEY.capitalize())
-            name_element.text = key
+            metadata_element.append(self._parameter_details_to_etree(key, value))
+
+    def _property_details_to_etree(self, property_name: str, property_id: str) -> ET.Element:
+        """Build the metadata element of a property set."""
+        prop_element = ET.Element(
+            _matml_strings.PROPERTY_DETAILS_KEY, {_matml_strings.ID_KEY: property_id}
+        )
+        ET.SubElement(prop_element, _matml_strings.UNITLESS_KEY)
+        name_element = ET.SubElement(prop_element, _matml_strings.NAME_KEY.capitalize())
+        name_element.text = property_name
+        return prop_element
+
+    def _parameter_details_to_etree(self, parameter_name: str, parameter_id: str) -> ET.Element:
+        """Build the metadata element of a parameter."""
+        prop_element = ET.Element(
+            _matml_strings.PARAMETER_DETAILS_KEY, {_matml_strings.ID_KEY: parameter_id}
+        )
+        units = self._metadata_parameters_units.get(parameter_name, None)
+        if units:
+            prop_element.append(unit_to_xml(units))
+        else:
+            ET.SubElement(prop_element, _matml_strings.UNITLESS_KEY)
+        name_element = ET.SubElement(prop_element, _matml_strings.NAME_KEY.capitalize())
+        name_element.text = parameter_name
+        return prop_element
 
     def _add_transfer_ids(self, root: ET.Element) -> None:
         """Add the WB transfer IDs to the XML tree."""
-        wb_transfer_element = ET.SubElement(root, _matml_strings.WBTRANSFER_KEY)
+        wb_transfer_element = self._get_transfer_ids_element()
+        if wb_transfer_element is not None:
+            root.append(wb_transfer_element)
+
+    def _get_transfer_ids_element(self) -> ET.Element | None:
+        """Get the WB transfer IDs element, or None if no material has a transfer ID."""
+        wb_transfer_element = ET.Element(_matml_strings.WBTRANSFER_KEY)
         materials_element = ET.SubElement(wb_transfer_element, _matml_strings.MATERIALS_ELEMENT_KEY)
         any_uuid = False
         for mat in self._materials:
@@ -346,8 +402,18 @@ class MatmlWriter(BaseVisitor):
                 transfer_element = ET.SubElement(mat_element, _matml_strings.DATA_TRANSFER_ID_KEY)
                 transfer_element.text = mat.guid
                 any_uuid = True
-        if not any_uuid:
-            root.remove(wb_transfer_element)
+        return wb_transfer_element if any_uuid else None
+
+    def _material_to_etree(self, material_name: str, material_models: list) -> ET.Element:
+        """Build the element of a material from its visited material models."""
+        material_element = ET.Element(_matml_strings.MATERIAL_KEY.capitalize())
+        bulkdata_element = ET.SubElement(material_element, _matml_strings.BULK_DETAILS_KEY)
+        name_element = ET.SubElement(bulkdata_element, _matml_strings.NAME_KEY.capitalize())
+        name_element.text = material_name
+        for material_model_element in material_models:
+            if material_model_element is not None:
+                bulkdata_element.append(material_model_element)
+        return material_element
 
     def _to_etree(self) -> ET.ElementTree:
         """To element tree."""
@@ -360,15 +426,7 @@ class MatmlWriter(BaseVisitor):
         materials_element = ET.SubElement(root, _matml_strings.MATERIALS_ELEMENT_KEY)
         matml_doc_element = ET.SubElement(materials_element, _matml_strings.MATML_DOC_KEY)
         for material_name, material in self._material_repr.items():
-            material_element = ET.SubElement(
-                matml_doc_element, _matml_strings.MATERIAL_KEY.capitalize()
-            )
-            bulkdata_element = ET.SubElement(material_element, _matml_strings.BULK_DETAILS_KEY)
-            name_element = ET.SubElement(bulkdata_element, _matml_strings.NAME_KEY.capitalize())
-            name_element.text = material_name
-            for material_model_element in material:
-                if material_model_element is not None:
-                    bulkdata_element.append(material_model_element)
+            matml_doc_element.append(self._material_to_etree(material_name, material))
         metadata_element = ET.SubElement(matml_doc_element, _matml_strings.METADATA_KEY)
         self._add_metadata(metadata_element)
         self._add_transfer_ids(root)
@@ -400,8 +458,265 @@ class MatmlWriter(BaseVisitor):
         xml_declaration: Optional[bool]
             Whether to add the XML declaration to the output.
         """
-        tree = self._to_etree()
         print(f"write xml to {path}")
+        if self._stream:
+            with open(path, "wb") as fp:
+                self._write_stream(fp, indent, xml_declaration)
+            return
+        tree = self._to_etree()
         if indent:
             self._indent(tree)
         tree.write(path, xml_declaration=xml_declaration)
+
+    def _group_materials(self) -> dict[str, list[Material]]:
+        """Group the materials by name, in order of first appearance."""
+        # Materials sharing a name are written as one element, as in ``_material_repr``.
+        materials_by_name = {}
+        for material in self._materials:
+            materials_by_name.setdefault(material.name, []).append(material)
+        return materials_by_name
+
+    def _get_material_element(self, material_name: str, materials: list[Material]) -> ET.Element:
+        """Visit the materials sharing a name and build their element."""
+        for material in materials:
+            material.accept(self)
+        material_models = self._material_repr[material_name]
+        self._material_repr[material_name] = []
+        return self._material_to_etree(material_name, material_models)
+
+    def _get_material_hash(self, material_name: str, materials: list[Material]) -> str:
+        """Get a hash of everything the element of the materials sharing a name depends on."""
+        digest = hashlib.sha256(repr((material_name, self._precision)).encode())
+        for material in materials:
+            for material_model in material.models:
+                digest.update(material_model.content_hash.encode())
+        return digest.hexdigest()
+
+    def _iter_material_elements(self) -> Iterator[tuple[str, ET.Element]]:
+        """Visit the materials one at a time and yield their names and elements."""
+        for material_name, materials in self._group_materials().items():
+            yield material_name, self._get_material_element(material_name, materials)
+
+    def update(self, path: _PATH_TYPE, indent: Optional[bool] = False) -> list[str]:
+        """
+        Update the materials of an existing MatML file.
+
+        Only the ``Material`` elements whose content differs from the file are
+        replaced, and the materials missing from the file are added after its last
+        material. The other bytes of the file are copied unchanged. The metadata IDs
+        of the file are reused, and IDs for new property sets and parameters are added
+        to its metadata. The Workbench transfer IDs are updated accordingly. If nothing
+        changed, the file is not rewritten.
+
+        The written ``Material`` elements store a hash of their materials in a
+        ``contenthash`` attribute. A material whose stored hash matches is skipped
+        without being visited, so the cost of an update scales with the number of
+        changed materials. Materials without a stored hash are compared with the
+        content of the file, and get a hash when the file is rewritten.
+
+        Parameters
+        ----------
+        path:
+            Path to the existing MatML file.
+        indent : Optional[bool]
+            Whether to indent the written elements. Set it to the value used to
+            write the file.
+
+        Returns
+        -------
+        list[str]
+            Names of the added or replaced materials.
+        """
+        newline, serialize = self._get_serializers(indent)
+        layout = scan_matml_layout(path)
+        if layout.metadata is None:
+            raise RuntimeError(
+                "Metadata node not found. Please check if this is a valid MATML file."
+            )
+        edits = []
+        hash_edits = []
+        updated_materials = []
+        with open(path, "rb") as fp:
+            metadata_element = fromstring(read_span(fp, layout.metadata))
+            self._seed_metadata(metadata_element)
+            property_names = set(self._metadata_property_sets)
+            parameter_names = set(self._metadata_parameters)
+
+            added_materials = []
+            for material_name, materials in self._group_materials().items():
+                content_hash = self._get_material_hash(material_name, materials)
+                span = layout.materials.get(material_name)
+                if span is not None and layout.material_hashes.get(material_name) == content_hash:
+                    continue
+                material_element = self._get_material_element(material_name, materials)
+                if span is not None and material_name not in layout.material_hashes:
+                    existing_element = fromstring(read_span(fp, span))
+                    if get_content_hash(existing_element, _ENCODING) == get_content_hash(
+                        material_element, _ENCODING
+                    ):
+                        hash_edits.append(self._get_hash_edit(span, content_hash))
+                        continue
+                material_element.set(_matml_strings.CONTENT_HASH_KEY, content_hash)
+                if span is not None:
+                    edits.append((*span, serialize(material_element, 3)))
+                elif layout.last_material_end is None:
+                    added_materials.append(serialize(material_element, 3) + newline(3))
+                else:
+                    added_materials.append(newline(3) + serialize(material_element, 3))
+                updated_materials.append(material_name)
+            if added_materials:
+                position = layout.last_material_end or layout.metadata[0]
+                edits.append((position, position, b"".join(added_materials)))
+
+            if self._add_new_metadata(metadata_element, property_names, parameter_names):
+                edits.append((*layout.metadata, serialize(metadata_element, 3)))
+
+            if layout.transfer_ids is not None:
+                wb_transfer_element = fromstring(read_span(fp, layout.transfer_ids))
+                if self._update_transfer_ids(wb_transfer_element):
+                    edits.append((*layout.transfer_ids, serialize(wb_transfer_element, 1)))
+            elif layout.materials_element is not None:
+                wb_transfer_element = self._get_transfer_ids_element()
+                if wb_transfer_element is not None:
+                    position = layout.materials_element[1]
+                    edits.append(
+                        (position, position, newline(1) + serialize(wb_transfer_element, 1))
+                    )
+
+        if edits:
+            _logger.info("Updating the materials %s of %s.", updated_materials, path)
+            splice_file(path, edits + hash_edits)
+        return updated_materials
+
+    @staticmethod
+    def _get_hash_edit(span: tuple[int, int], content_hash: str) -> tuple[int, int, bytes]:
+        """Get the edit adding a content hash to the start tag of a material."""
+        position = span[0] + len(_matml_strings.MATERIAL_KEY) + 1
+        attribute = f" {_matml_strings.CONTENT_HASH_KEY}={quoteattr(content_hash)}"
+        return position, position, attribute.encode(_ENCODING)
+
+    def _seed_metadata(self, metadata_element: ET.Element) -> None:
+        """Reuse the metadata IDs of an existing MatML file."""
+        self._metadata_property_sets = {}
+        self._metadata_parameters = {}
+        self._metadata_parameters_units = {}
+        self._metadata_ids = set()
+        for tag, metadata in (
+            (_matml_strings.PROPERTY_DETAILS_KEY, self._metadata_property_sets),
+            (_matml_strings.PARAMETER_DETAILS_KEY, self._metadata_parameters),
+        ):
+            for element in metadata_element.iter(tag):
+                metadata_id = element.attrib.get(_matml_strings.ID_KEY, "")
+                name = element.findtext(_matml_strings.NAME_KEY.capitalize(), "")
+                metadata.setdefault(name, metadata_id)
+                self._metadata_ids.add(metadata_id)
+        self._material_repr = {material.name: [] for material in self._materials}
+
+    def _add_new_metadata(
+        self, metadata_element: ET.Element, property_names: set[str], parameter_names: set[str]
+    ) -> bool:
+        """Add the metadata entries created since the metadata was seeded."""
+        new_properties = [
+            self._property_details_to_etree(name, metadata_id)
+            for name, metadata_id in self._metadata_property_sets.items()
+            if name not in property_names
+        ]
+        new_parameters = [
+            self._parameter_details_to_etree(name, metadata_id)
+            for name, metadata_id in self._metadata_parameters.items()
+            if name not in parameter_names
+        ]
+        # Keep the property details before the parameter details.
+        position = 0
+        for index, element in enumerate(metadata_element):
+            if element.tag == _matml_strings.PROPERTY_DETAILS_KEY:
+                position = index + 1
+        for offset, element in enumerate(new_properties):
+            metadata_element.insert(position + offset, element)
+        metadata_element.extend(new_parameters)
+        return bool(new_properties or new_parameters)
+
+    def _update_transfer_ids(self, wb_transfer_element: ET.Element) -> bool:
+        """Update the WB transfer IDs of the written materials."""
+        name_key = _matml_strings.NAME_KEY.capitalize()
+        materials_element = wb_transfer_element.find(_matml_strings.MATERIALS_ELEMENT_KEY)
+        if materials_element is None:
+            materials_element = ET.SubElement(
+                wb_transfer_element, _matml_strings.MATERIALS_ELEMENT_KEY
+            )
+        entries = {}
+        for entry in materials_element.findall(_matml_strings.MATERIAL_KEY.capitalize()):
+            entries.setdefault(entry.findtext(name_key), entry)
+        changed = False
+        for material in self._materials:
+            if material.guid is None:
+                continue
+            entry = entries.get(material.name)
+            if entry is None:
+                entry = ET.SubElement(materials_element, _matml_strings.MATERIAL_KEY.capitalize())
+                ET.SubElement(entry, name_key).text = material.name
+                entries[material.name] = entry
+            transfer_element = entry.find(_matml_strings.DATA_TRANSFER_ID_KEY)
+            if transfer_element is None:
+                transfer_element = ET.SubElement(entry, _matml_strings.DATA_TRANSFER_ID_KEY)
+            if transfer_element.text != material.guid:
+                transfer_element.text = material.guid
+                changed = True
+        return changed
+
+    @staticmethod
+    def _get_serializers(
+        indent: bool,
+    ) -> tuple[Callable[[int], bytes], Callable[[ET.Element, int], bytes]]:
+        """
+        Get the functions writing the bytes of a partial MatML document.
+
+        The first function returns the whitespace before an element at an indentation
+        level. The second one serializes an element at an indentation level. Both
+        reproduce the output of ``ElementTree.write``, indented or not.
+        """
+
+        def newline(level: int) -> bytes:
+            return ("\n" + "  " * level).encode(_ENCODING) if indent else b""
+
+        def serialize(element: ET.Element, level: int) -> bytes:
+            if indent:
+                ET.indent(element, level=level)
+            return ET.tostring(element, encoding=_ENCODING)
+
+        return newline, serialize
+
+    def _write_stream(self, fp: BinaryIO, indent: bool, xml_declaration: bool) -> None:
+        """
+        Write the MatML document to a binary file handle one material at a time.
+
+        Each material is visited, serialized and released before the next one. The
+        whitespace and the encoding reproduce the output of :meth:`_to_etree` written
+        with ``ElementTree.write``.
+        """
+        newline, serialize = self._get_serializers(indent)
+        if xml_declaration:
+            fp.write(f"<?xml version='1.0' encoding='{_ENCODING}'?>\n".encode(_ENCODING))
+        fp.write(
+            f"<{_matml_strings.ROOT_ELEMENT} version={quoteattr(_matml_strings.VERSION)} "
+            f"versiondate={quoteattr(_matml_strings.VERSION_DATE)}>".encode(_ENCODING)
+        )
+        fp.write(newline(1))
+        notes_element = ET.Element(_matml_strings.NOTES_KEY)
+        notes_element.text = _matml_strings.NOTES_TEXT
+        fp.write(serialize(notes_element, 1))
+        fp.write(newline(1))
+        fp.write(f"<{_matml_strings.MATERIALS_ELEMENT_KEY}>".encode(_ENCODING) + newline(2))
+        fp.write(f"<{_matml_strings.MATML_DOC_KEY}>".encode(_ENCODING) + newline(3))
+        for _, material_element in self._iter_material_elements():
+            fp.write(serialize(material_element, 3))
+            fp.write(newline(3))
+        metadata_element = ET.Element(_matml_strings.METADATA_KEY)
+        self._add_metadata(metadata_element)
+        fp.write(serialize(metadata_element, 3))
+        fp.write(newline(2) + f"</{_matml_strings.MATML_DOC_KEY}>".encode(_ENCODING))
+        fp.write(newline(1) + f"</{_matml_strings.MATERIALS_ELEMENT_KEY}>".encode(_ENCODING))
+        wb_transfer_element = self._get_transfer_ids_element()
+        if wb_transfer_element is not None:
+            fp.write(newline(1) + serialize(wb_transfer_element, 1))
+        fp.write(newline(0) + f"</{_matml_strings.ROOT_ELEMENT}>".encode(_ENCODING))
@@ -23,14 +23,25 @@
 
 """Provides the ``MaterialManager`` class."""
 
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 import logging
 from pathlib import Path
-from typing import Any, Sequence
+import threading
+import time
+from typing import Any, Callable, Iterable, Iterator, Literal, Sequence
+import weakref
 
+from ansys.units import Quantity
+import numpy as np
+
+from ._material_library import MaterialLibrary
 from .integrations import (
     FluentWriter,
     LsDynaWriter,
+    MapdlCommandCache,
     MapdlWriter,
+    MatmlCache,
     MatmlReader,
     MatmlWriter,
     read_mapdl,
@@ -38,26 +49,124 @@ from .integrations import (
 from .models import Material, MaterialModel
 from .models._common import _DynaDeck, _DynaKeywordBase, _FluentCore, _MapdlCore
 
+ConflictPolicy = Literal["error", "skip", "replace", "rename"]
+
+
+@dataclass
+class AddMaterialsSummary:
+    """Summary of a bulk addition of materials with :meth:`MaterialManager.add_materials`."""
+
+    added: list[str] = field(default_factory=list)
+    replaced: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    renamed: list[tuple[str, str]] = field(default_factory=list)
+    check_time: float = 0.0
+    insert_time: float = 0.0
+
+    @property
+    def total_time(self) -> float:
+        """Total time in seconds spent adding the materials."""
+        return self.check_time + self.insert_time
+
+    def __str__(self) -> str:
+        """Return the counts and timings of the addition."""
+        return (
+            f"{len(self.added)} added, {len(self.replaced)} replaced, "
+            f"{len(self.renamed)} renamed, {len(self.skipped)} skipped "
+            f"in {self.total_time:.3f} s"
+        )
+
+
+def _get_free_name(name: str, taken: set[str]) -> str:
+    """Get the first name of the form ``name (i)`` that is not taken."""
+    index = 1
+    while f"{name} ({index})" in taken:
+        index += 1
+    return f"{name} ({index})"
+
 
 class MaterialManager:
     """
     Manage material creation, assignment, and other management tasks.
 
     This class is the main entry point for the Pythonic material management interface.
+
+    In thread-safe mode, the library is copied on write: the methods adding, extending
+    or deleting materials modify a copy of the library under a lock and publish it once
+    complete. The published libraries are frozen snapshots, so readers never lock and
+    always see a consistent version of the library, even during a reload. Hold on to
+    the value of :attr:`materials` to run several reads against the same version.
     """
 
-    _materials: dict[str, Material]
+    _materials: MaterialLibrary
     _logger = logging.getLogger(__name__)
 
-    def __init__(self):
-        """Initialize the material manager instance."""
-        self._materials = {}
+    def __init__(self, intern_models: bool = False, thread_safe: bool = False):
+        """
+        Initialize the material manager instance.
+
+        Parameters
+        ----------
+        intern_models : bool
+            If True, the material models added to the library are deduplicated by
+            content: models with the same content hash share a single instance. A shared
+            model that is modified is modified for all the materials using it.
+        thread_safe : bool
+            If True, the library can be read and modified from several threads. Each
+            modification copies the library, and the materials must not be modified in
+            place once added: extending a material replaces it with a copy.
+        """
+        self._thread_safe = thread_safe
+        self._write_lock = threading.RLock()
+        self._materials = MaterialLibrary(observe=not thread_safe)
+        if thread_safe:
+            self._materials.freeze()
+        self._intern_models = intern_models
+        self._model_pool = weakref.WeakValueDictionary()
 
     @property
-    def materials(self) -> dict[str, Material]:
-        """The material models."""
+    def materials(self) -> MaterialLibrary:
+        """
+        The materials of the library, keyed by name.
+
+        In thread-safe mode, this is a read-only snapshot of the current version of the
+        library.
+        """
         return self._materials
 
+    @property
+    def thread_safe(self) -> bool:
+        """Whether the library can be read and modified from several threads."""
+        return self._thread_safe
+
+    @contextmanager
+    def _edit_materials(self, clear: bool = False) -> Iterator[MaterialLibrary]:
+        """
+        Yield the library to modify.
+
+        In thread-safe mode, a copy of the library is yielded under the write lock and
+        published when the block exits without error.
+
+        Parameters
+        ----------
+        clear : bool
+            If True, an empty library is yielded instead. It replaces the library when the
+            block exits without error.
+        """
+        if not self._thread_safe:
+            if not clear:
+                yield self._materials
+                return
+            materials = MaterialLibrary()
+            yield materials
+            self._materials = materials
+            return
+        with self._write_lock:
+            materials = MaterialLibrary(observe=False) if clear else self._materials.copy()
+            yield materials
+            materials.freeze()
+            self._materials = materials
+
     @property
     def client(self) -> Any:
         """The provided client."""
@@ -67,80 +176,345 @@ class MaterialManager:
     def client(self, value: Any) -> None:
         self._client = value
 
+    def _intern_model(self, model: MaterialModel) -> MaterialModel:
+        """Return the pooled model with the same content, pooling ``model`` if there is none."""
+        key = model.content_hash
+        pooled = self._model_pool.get(key, None)
+        # a pooled model modified since it was pooled is stale
+        if pooled is None or pooled.content_hash != key:
+            self._model_pool[key] = pooled = model
+        return pooled
+
+    def _intern_material(self, material: Material) -> None:
+        """Replace the models of a material by their pooled instances."""
+        if self._intern_models:
+            material.models = [self._intern_model(model) for model in material.models]
+
     def add_material(self, material: Material) -> None:
         """Add a material into the library."""
-        material_found = self.materials.get(material.name, None)
-        if material_found is None:
-            self.materials[material.name] = material
-            print(f"The material with name {material.name} was added to the library.")
-            # TODO: we might need to consider taking care of the ids and uids probably
-        else:
-            raise Exception(
-                f"The material with name {material.name} is already present in the library."
-            )
+        with self._edit_materials() as materials:
+            material_found = materials.get(material.name, None)
+            if material_found is None:
+                self._intern_material(material)
+                materials[material.name] = material
+                self._logger.info(
+                    "The material with name %s was added to the library.", material.name
+                )
+                # TODO: we might need to consider taking care of the ids and uids probably
+            else:
+                raise Exception(
+                    f"The material with name {material.name} is already present in the library."
+                )
 
     def extend_material(self, material_name: str, material_models: list[MaterialModel]) -> None:
         """Extend the models defined within a specific material."""
-        material = self.materials.get(material_name, None)
-        if material is not None:
-            material.append_models(material_models)
-        else:
-            print(f"The material with name {material_name} was not found.")
+        with self._edit_materials() as materials:
+            material = materials.get(material_name, None)
+            if material is None:
+                self._logger.warning("The material with name %s was not found.", material_name)
+                return
+            if self._intern_models:
+                if isinstance(material_models, MaterialModel):
+                    material_models = [material_models]
+                material_models = [self._intern_model(model) for model in material_models]
+            if not self._thread_safe:
+                material.append_models(material_models)
+                return
+            # the published snapshots share the material, so it is replaced by a copy
+            if isinstance(material_models, MaterialModel):
+                material_models = [material_models]
+            materials[material_name] = Material(
+                material.name,
+                material_id=material.mat_id,
+                models=[*material.models, *material_models],
+                guid=material.guid,
+            )
 
     def delete_material(self, material_name: str):
         """Delete a material from the library."""
-        material = self.materials.pop(material_name, None)
+        with self._edit_materials() as materials:
+            material = materials.pop(material_name, None)
         if material is None:
-            print(f"The material with name {material_name} was not found.")
+            self._logger.warning("The material with name %s was not found.", material_name)
 
-    def _get_materials_to_write(self, material_names: Sequence[str] | None) -> dict[str, Material]:
+    def _get_materials_to_write(self, material_names: Sequence[str] | None) -> list[Material]:
         """Return the materials to be written."""
-        if self.materials is None or len(self.materials) == 0:
+        library = self.materials
+        if library is None or len(library) == 0:
             raise Exception("No materials found in the library.")
         if not material_names:
-            materials = self.materials
+            materials = list(library.values())
         else:
-            materials = [
-                self.get_material(name)
-                for name in material_names
-                if self.get_material(name) is not None
-            ]
+            materials = []
+            for name in material_names:
+                material = library.get(name, None)
+                if material is None:
+                    self._logger.warning(
+                        "The material with name %s was not found in the library.", name
+                    )
+                else:
+                    materials.append(material)
         return materials
 
     def get_material(self, material_name) -> Material | None:
         """Return a material from the library."""
         material = self.materials.get(material_name, None)
         if material is None:
-            print(f"The material with name {material_name} was not found in the library.")
+            self._logger.warning(
+                "The material with name %s was not found in the library.", material_name
+            )
         return material
 
+    def query(
+        self,
+        mat_id: Any = None,
+        guid: str | None = None,
+        model: type[MaterialModel] | None = None,
+        ranges: (
+            dict[tuple[type[MaterialModel], str], tuple[float | Quantity | None, ...]] | None
+        ) = None,
+    ) -> list[Material]:
+        """
+        Find the materials of the library matching all the given criteria.
+
+        The criteria are resolved with the indexes of the library, see
+        :meth:`MaterialLibrary.query`.
+
+        Parameters
+        ----------
+        mat_id : Any
+            ID of the materials.
+        guid : str | None
+            GUID of the materials.
+        model : type[MaterialModel] | None
+            Class of a model of the materials. Subclasses match too.
+        ranges : dict[tuple[type[MaterialModel], str], tuple[float | Quantity | None, ...]] | None
+            Inclusive lower and upper bounds of scalar properties, keyed by model class
+            and attribute name, for example ``{(Density, "density"): (7000, 8000)}``.
+            Bounds given as floats are in SI units, and None leaves a side open.
+
+        Returns
+        -------
+        list[Material]
+            The matching materials, sorted by name.
+        """
+        return self._materials.query(mat_id=mat_id, guid=guid, model=model, ranges=ranges)
+
+    def batch_query(
+        self,
+        model_name: str,
+        values: list[float] | list[list[float]] | np.ndarray,
+        parameter: str | None = None,
+        material_names: Sequence[str] | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        """
+        Query a material model property for many materials in one call.
+
+        Parameters
+        ----------
+        model_name : str
+            Name of the material model to query, for example ``"Elasticity"``.
+        values : list[float] | list[list[float]] | np.ndarray
+            The values to query the material models with, see
+            :meth:`~ansys.materials.manager.models.MaterialModel.query`.
+        parameter : str | None
+            Name of the dependent parameter to evaluate, for example ``"youngs_modulus"``.
+            It can be omitted if the material model has a single dependent parameter.
+        material_names : Sequence[str] | None
+            Names of the materials to query. Defaults to all the materials in the library.
+        **kwargs
+            Keyword arguments forwarded to the query, for example ``dpf_server``.
+
+        Returns
+        -------
+        np.ndarray
+            The queried values with shape ``(n_materials, n_points)``. The rows of
+            materials that are not in the library or do not define the material model
+            are filled with ``NaN``.
+        """
+        library = self.materials
+        if material_names is None:
+            material_names = list(library.keys())
+        models = []
+        for material_name in material_names:
+            material = library.get(material_name, None)
+            models.append(None if material is None else material.get_model_by_name(model_name))
+        return MaterialModel.batch_query(models, values, parameter=parameter, **kwargs)
+
+    def add_materials(
+        self, materials: Iterable[Material], on_conflict: ConflictPolicy = "error"
+    ) -> AddMaterialsSummary:
+        """
+        Add many materials to the library.
+
+        The names are checked against the library in a single pass before any material is
+        added. The progress is reported through :mod:`logging` only. In thread-safe mode,
+        the materials are published to the readers all at once.
+
+        Parameters
+        ----------
+        materials : Iterable[Material]
+            Materials to add.
+        on_conflict : ConflictPolicy
+            What to do with a material whose name is already in the library, or in the
+            preceding materials to add:
+
+            * ``"error"``: raise a ``ValueError`` and add none of the materials.
+            * ``"skip"``: keep the material already in the library.
+            * ``"replace"``: replace the material already in the library.
+            * ``"rename"``: add the material as ``"<name> (<i>)"`` with the first free
+              index, and update its name.
+
+        Returns
+        -------
+        AddMaterialsSummary
+            The names of the added, replaced and skipped materials, the original and new
+            names of the renamed materials, and the time spent checking and adding them.
+        """
+        if on_conflict not in ("error", "skip", "replace", "rename"):
+            raise ValueError(
+                f"on_conflict must be 'error', 'skip', 'replace' or 'rename', got {on_conflict!r}."
+            )
+        materials = list(materials)
+        with self._edit_materials() as library:
+            summary = self._add_materials(library, materials, on_conflict)
+        self._logger.info("Added materials to the library: %s.", summary)
+        return summary
+
+    def _add_materials(
+        self, library: MaterialLibrary, materials: list[Material], on_conflict: ConflictPolicy
+    ) -> AddMaterialsSummary:
+        """Add many materials to a library, see :meth:`add_materials`."""
+        summary = AddMaterialsSummary()
+        start = time.perf_counter()
+        taken = set(library.keys())
+        new_names = set()
+        to_add = []
+        conflicts = []
+        for material in materials:
+            name = material.name
+            if name not in taken:
+                taken.add(name)
+                new_names.add(name)
+                to_add.append((name, material))
+                summary.added.append(name)
+                continue
+            conflicts.append(name)
+            if on_conflict == "skip":
+                summary.skipped.append(name)
+            elif on_conflict == "replace":
+                to_add.append((name, material))
+                if name not in new_names:
+                    summary.replaced.append(name)
+            elif on_conflict == "rename":
+                new_name = _get_free_name(name, taken)
+                taken.add(new_name)
+                new_names.add(new_name)
+                to_add.append((new_name, material))
+                summary.renamed.append((name, new_name))
+        if on_conflict == "error" and conflicts:
+            raise ValueError(
+                f"The materials were not added to the library as {conflicts} are already present."
+            )
+        summary.check_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for name, material in to_add:
+            if name != material.name:
+                self._logger.debug("Renaming the material %s to %s.", material.name, name)
+                material.name = name
+            self._intern_material(material)
+            library[name] = material
+        summary.insert_time = time.perf_counter() - start
+        return summary
+
+    def replace_materials(self, materials: Iterable[Material]) -> AddMaterialsSummary:
+        """
+        Replace all the materials of the library.
+
+        In thread-safe mode, the readers see either the previous or the new materials,
+        never a mix of both, which makes this method suitable to reload a library.
+
+        Parameters
+        ----------
+        materials : Iterable[Material]
+            Materials of the new library. Their names must be unique.
+
+        Returns
+        -------
+        AddMaterialsSummary
+            The names of the added materials, and the time spent adding them.
+        """
+        materials = list(materials)
+        with self._edit_materials(clear=True) as library:
+            summary = self._add_materials(library, materials, "error")
+        self._logger.info("Replaced the materials of the library: %s.", summary)
+        return summary
+
     def _add_library(self, material_dic: dict[str, Material]):
         """Add a material dictionary to the library."""
-        for material in material_dic.values():
-            if material.name in self.materials:
-                raise Exception(
-                    (
-                        f"The materials were not added to the library as {material.name}",
-                        "is already present.",
-                    )
-                )
-        self._materials |= material_dic
+        self.add_materials(material_dic.values(), on_conflict="error")
+
+    def write_to_matml(
+        self,
+        path: str | Path,
+        material_names: list[str] | None = None,
+        stream: bool = False,
+        update: bool = False,
+    ) -> None:
+        """Write the materials in the library to a MatML file.
 
-    def write_to_matml(self, path: str | Path, material_names: list[str] | None = None) -> None:
-        """Write the materials in the library to a MatML file."""
+        Parameters
+        ----------
+        path : str | Path
+            Path to the MatML file.
+        material_names : list[str] | None
+            Names of the materials to write. If None, all materials are written.
+        stream : bool
+            If True, the materials are converted and written to the file one at a time
+            instead of building the whole document in memory first.
+        update : bool
+            If True and the file exists, only the materials that differ from the file
+            are rewritten, and the other materials of the file are kept.
+        """
         materials = self._get_materials_to_write(material_names)
-        writer = MatmlWriter(materials)
+        if update and Path(path).exists():
+            MatmlWriter(materials, stream=True).update(path, indent=True)
+            return
+        writer = MatmlWriter(materials, stream=stream)
         writer.write(path, indent=True)
 
-    def read_from_matml(self, path: str | Path) -> None:
-        """Read materials from a MatML file and add them to the library."""
-        matml_reader = MatmlReader(path)
+    def read_from_matml(
+        self,
+        path: str | Path,
+        material_names: Sequence[str] | Callable[[str], bool] | None = None,
+        workers: int | None = None,
+        cache: bool | MatmlCache = False,
+    ) -> None:
+        """Read materials from a MatML file and add them to the library.
+
+        Parameters
+        ----------
+        path : str | Path
+            Path to the MatML file.
+        material_names : Sequence[str] | Callable[[str], bool] | None
+            Names of the materials to read, or a predicate called with each material
+            name. The other materials of the file are not converted. If None, all
+            materials are read.
+        workers : int | None
+            Number of worker processes used to convert the materials. If None, the
+            materials are converted in the current process.
+        cache : bool | MatmlCache
+            Cache of the converted materials. If True, the default cache in the cache
+            directory of the user is used. On a cache hit, the file is not parsed.
+        """
+        matml_reader = MatmlReader(
+            path, material_names=material_names, workers=workers, cache=cache
+        )
         material_dic = matml_reader.convert_matml_materials()
-        if not self.materials:
-            self._materials = material_dic
-        else:
-            self._add_library(material_dic)
-        print("The materials were correctly read from the provided xml file.")
+        self._add_library(material_dic)
+        self._logger.info("The materials were correctly read from %s.", path)
 
     def write_to_mapdl(
         self,
@@ -148,11 +522,58 @@ class MaterialManager:
         material_names: list[str] | None = None,
         material_ids: list[int] | None = None,
         reference_temperatures: list[float] | None = None,
+        chunk_size: int | None = 1,
+        cache: bool | MapdlCommandCache = False,
     ) -> list[str] | None:
-        """Write a material to the connected MAPDL session."""
+        """
+        Write a material to the connected MAPDL session.
+
+        Use ``chunk_size`` to send several materials per round trip to the session, see
+        :meth:`MapdlWriter.write`, and ``cache`` to reuse the commands generated for the
+        same material models by previous writes, see :class:`MapdlCommandCache`.
+        """
+        materials = self._get_materials_to_write(material_names)
+        writer = MapdlWriter(materials, cache=cache)
+        return writer.write(
+            mapdl_client,
+            material_names,
+            material_ids,
+            reference_temperatures,
+            chunk_size=chunk_size,
+        )
+
+    def write_to_mapdl_file(
+        self,
+        path: str | Path,
+        material_names: list[str] | None = None,
+        material_ids: list[int] | None = None,
+        reference_temperatures: list[float] | None = None,
+        cache: bool | MapdlCommandCache = False,
+    ) -> None:
+        """
+        Write the materials to an APDL input file, one material at a time.
+
+        The commands of a material are generated when it is written, so the commands of
+        the whole library are never held in memory.
+
+        Parameters
+        ----------
+        path : str | Path
+            Path to the APDL input file.
+        material_names : list[str] | None
+            List of material names to write. If None, write all materials.
+        material_ids : list[int] | None
+            List of material ids to write. If None, get the ids from the materials.
+        reference_temperatures : list[float] | None
+            List of reference temperatures to write. If None, use default values.
+        cache : bool | MapdlCommandCache
+            Cache of the commands generated for the material models, see
+            :class:`MapdlCommandCache`.
+        """
         materials = self._get_materials_to_write(material_names)
-        writer = MapdlWriter(materials)
-        return writer.write(mapdl_client, material_names, material_ids, reference_temperatures)
+        writer = MapdlWriter(materials, cache=cache, stream=True)
+        with open(path, "w") as fp:
+            writer.write_to_stream(fp, material_names, material_ids, reference_temperatures)
 
     def read_from_mapdl_session(self, mapdl_client: _MapdlCore) -> None:
         """Read material from the pyansys client session."""
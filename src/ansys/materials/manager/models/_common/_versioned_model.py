@@ -0,0 +1,94 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Base model tracking the assignments made to its fields."""
+
+import itertools
+from typing import Any
+
+from pydantic import BaseModel, PrivateAttr
+
+# Shared by all models, so that a version identifies one state of one model.
+_VERSIONS = itertools.count(1)
+# Types of the values that can hold models.
+_CONTAINERS = (BaseModel, list, tuple, dict)
+
+
+class VersionedModel(BaseModel):
+    """
+    Base model that draws a new content version whenever one of its fields is assigned.
+
+    Versions are unique across all models, so comparing the versions returned by
+    :func:`get_content_version` tells whether a model or a model nested in it was
+    assigned since, without looking at the data.
+    """
+
+    _content_version: int = PrivateAttr(default_factory=lambda: next(_VERSIONS))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Assign an attribute, drawing a new content version for fields."""
+        super().__setattr__(name, value)
+        if name in type(self).model_fields:
+            self._content_version = next(_VERSIONS)
+
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False):
+        """
+        Copy the model.
+
+        The copy keeps the content version of the model unless ``update`` changes its
+        fields, see :meth:`pydantic.BaseModel.model_copy`.
+        """
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied._content_version = next(_VERSIONS)
+        return copied
+
+
+def get_content_version(value: Any) -> Any:
+    """
+    Get the versions of the models held by a value.
+
+    Parameters
+    ----------
+    value: Any
+        Model, list, tuple or dictionary to inspect.
+
+    Returns
+    -------
+    Any
+        Hashable fingerprint that changes when a field of the model, or of any model
+        nested in it, is assigned, or when a list of models is changed. Changes made in
+        place to the arrays of quantities, or to the items of lists that hold no models,
+        are not tracked.
+    """
+    if isinstance(value, VersionedModel):
+        # read the fields and the version directly, bypassing the attribute lookups of pydantic
+        fields = value.__dict__.values()
+        return value.__pydantic_private__["_content_version"], tuple(
+            [get_content_version(item) for item in fields if isinstance(item, _CONTAINERS)]
+        )
+    if isinstance(value, (list, tuple)):
+        items = [get_content_version(item) for item in value if isinstance(item, _CONTAINERS)]
+        return len(value), tuple(items)
+    if isinstance(value, dict):
+        return tuple([(key, get_content_version(item)) for key, item in value.items()])
+    return None
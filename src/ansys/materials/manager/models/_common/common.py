@@ -31,6 +31,7 @@ class Interpolator(str, Enum):
     """Enum for interpolator types in material models."""
 
     GIL_INTERPOLATOR = "gil"
+    NUMPY_INTERPOLATOR = "numpy"
 
 
 class QualifierType(str, Enum):
@@ -62,6 +63,22 @@ MATML_TO_GIL_ALGORITHM_MAPPING = {
 }
 
 
+class NumpyInterpolationAlgorithms(str, Enum):
+    """Enum for interpolation algorithms available in the NumPy interpolator."""
+
+    NEAREST_NEIGHBOR = "nearest_neighbor"
+    LINEAR = "linear"
+    MULTILINEAR = "multilinear"
+    LINEAR_TRIANGULATION = "linear_triangulation"
+
+
+MATML_TO_NUMPY_ALGORITHM_MAPPING = {
+    "Linear Multivariate": NumpyInterpolationAlgorithms.LINEAR_TRIANGULATION,
+    "Linear Multivariate (Qhull)": NumpyInterpolationAlgorithms.LINEAR_TRIANGULATION,
+    "Nearest Neighbor": NumpyInterpolationAlgorithms.NEAREST_NEIGHBOR,
+}
+
+
 def validate_and_initialize_model_qualifiers(
     values: dict, expected_values: dict
 ) -> list[ModelQualifier]:
@@ -24,10 +24,12 @@
 from typing import Union
 
 from ansys.units import Quantity
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ._versioned_model import VersionedModel
 
-class IndependentParameter(BaseModel):
+
+class IndependentParameter(VersionedModel):
     """Class representing an independent parameter in a material model."""
 
     name: str = Field(
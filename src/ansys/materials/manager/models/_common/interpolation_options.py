@@ -21,10 +21,12 @@
 # SOFTWARE.
 
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ._versioned_model import VersionedModel
 
-class InterpolationOptions(BaseModel):
+
+class InterpolationOptions(VersionedModel):
     """Class to hold interpolation options for material models."""
 
     algorithm_type: str = Field(
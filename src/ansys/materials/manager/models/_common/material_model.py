@@ -21,37 +21,78 @@
 # SOFTWARE.
 
 import abc
+from collections import OrderedDict
+from enum import Enum
 import functools
+import hashlib
 import re
-from typing import Any
+import threading
+from typing import Any, Callable, Sequence
 
 from ansys.units import Quantity
 import numpy as np
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 from ._packages import SupportedPackage  # noqa: F401
-from .common import MATML_TO_GIL_ALGORITHM_MAPPING, Interpolator, validate_parameters
+from ._versioned_model import VersionedModel, get_content_version
+from .common import (
+    MATML_TO_GIL_ALGORITHM_MAPPING,
+    MATML_TO_NUMPY_ALGORITHM_MAPPING,
+    Interpolator,
+    NumpyInterpolationAlgorithms,
+    validate_parameters,
+)
 from .independent_parameter import IndependentParameter
 from .interpolation_options import InterpolationOptions
 from .model_qualifier import ModelQualifier
+from .numpy_interpolator import NumpyInterpolator
 from .tabular_quantity import TabularQuantity
 from .visitor_protocol import MaterialModelWriterVisitorProtocol
 
-try:
-    import ansys.dpf.core as dpf
-    from ansys.dpf.core import load_library
-    from ansys.tools.common.path import get_available_ansys_installations
+# Interpolators built by MaterialModel.batch_query, least recently used first.
+_MAX_BATCH_INTERPOLATORS = 64
+_BATCH_INTERPOLATORS: OrderedDict[tuple, NumpyInterpolator] = OrderedDict()
+_BATCH_INTERPOLATORS_LOCK = threading.Lock()
 
-    HAS_DPF = True
-    HAS_GIL = True
-    _ansys_paths = get_available_ansys_installations()
-    HAS_MINIMUM_271 = any(version >= 271 for version in _ansys_paths)
-    if HAS_MINIMUM_271:
-        load_library("Ans.Dpf.Gil")  # codespell:ignore Ans
 
-except ImportError:
-    HAS_DPF = False
-    HAS_MINIMUM_271 = False
+@functools.cache
+def _get_dpf():
+    """Import ``ansys-dpf-core`` on first use, returning ``None`` if it is not installed."""
+    try:
+        import ansys.dpf.core as dpf
+    except ImportError:
+        return None
+    return dpf
+
+
+@functools.cache
+def _has_minimum_271() -> bool:
+    """
+    Check for a local Ansys 2027 R1 (v271) or later installation.
+
+    The installations are only scanned, and the GIL library loaded, the first time
+    an interpolation query needs them. The result is memoized.
+    """
+    dpf = _get_dpf()
+    if dpf is None:
+        return False
+    try:
+        from ansys.tools.common.path import get_available_ansys_installations
+    except ImportError:
+        return False
+    if not any(version >= 271 for version in get_available_ansys_installations()):
+        return False
+    dpf.load_library("Ans.Dpf.Gil")  # codespell:ignore Ans
+    return True
+
+
+def __getattr__(name: str) -> bool:
+    """Resolve the DPF availability flags lazily."""
+    if name in ("HAS_DPF", "HAS_GIL"):
+        return _get_dpf() is not None
+    if name == "HAS_MINIMUM_271":
+        return _has_minimum_271()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def requires_dpf_271(func):
@@ -69,9 +110,10 @@ def requires_dpf_271(func):
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         dpf_server = kwargs.get("dpf_server", None)
+        dpf = _get_dpf()
         if dpf_server is not None:
             if int(re.search(r"\b(20\d{2})\b", dpf_server.version).group(1)) >= 2027:
-                load_library("Ans.Dpf.Gil", server=dpf_server)  # codespell:ignore Ans
+                dpf.load_library("Ans.Dpf.Gil", server=dpf_server)  # codespell:ignore Ans
             else:
                 raise RuntimeError(
                     f"'{func.__name__}' requires Ansys 2027 R1 (v271) or later. "
@@ -79,12 +121,12 @@ def requires_dpf_271(func):
                 )
             return func(*args, **kwargs)
 
-        if not HAS_DPF:
+        if dpf is None:
             raise ImportError(
                 f"'{func.__name__}' requires ansys-dpf-core. "
                 "Install it with: pip install ansys-dpf-core"
             )
-        if dpf_server is None and not HAS_MINIMUM_271:
+        if not _has_minimum_271():
             raise RuntimeError(
                 f"'{func.__name__}' requires Ansys 2027 R1 (v271) or later. "
                 "Please update your Ansys installation."
@@ -94,7 +136,79 @@ def requires_dpf_271(func):
     return wrapper
 
 
-class MaterialModel(BaseModel, abc.ABC):
+def _create_vector_field(values: np.ndarray | list[list[float]], server=None) -> Any:
+    """
+    Create a DPF vector field from a 2-D array in a single call.
+
+    Parameters
+    ----------
+    values: np.ndarray | list[list[float]]
+        Field data with one row per entity and one column per component.
+    server: GrpcServer | InProcessServer | LegacyGrpcServer | None, optional
+        The DPF server to create the field on. Defaults to the global server.
+
+    Returns
+    -------
+    dpf.Field
+        Field whose entity IDs are the row indices of ``values``.
+    """
+    dpf = _get_dpf()
+    values = np.ascontiguousarray(values, dtype=float)
+    field = dpf.fields_factory.create_vector_field(
+        num_entities=values.shape[0], num_comp=values.shape[1], server=server
+    )
+    field.data = values
+    field.scoping.ids = np.arange(values.shape[0])
+    return field
+
+
+def _update_content_digest(digest: Any, value: Any) -> None:
+    """
+    Feed a canonical encoding of a field value to a hash.
+
+    Quantities contribute their unit and values, arrays their shape and data, and nested
+    models the values of their fields in declaration order.
+
+    Parameters
+    ----------
+    digest: Any
+        Hash object from :mod:`hashlib` to update.
+    value: Any
+        Value to encode.
+    """
+    if isinstance(value, Quantity):
+        digest.update(f"Q{value.units.name!r}".encode())
+        _update_content_digest(digest, np.asarray(value.value))
+    elif isinstance(value, np.ndarray):
+        digest.update(f"A{value.shape}".encode())
+        if value.dtype.kind in "biuf":
+            digest.update(np.ascontiguousarray(value, dtype=np.float64).tobytes())
+        else:
+            digest.update(repr(value.tolist()).encode())
+    elif isinstance(value, BaseModel):
+        digest.update(f"M{type(value).__qualname__}(".encode())
+        for name in type(value).model_fields:
+            digest.update(f"{name}=".encode())
+            _update_content_digest(digest, getattr(value, name))
+        digest.update(b")")
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"L{len(value)}[".encode())
+        for item in value:
+            _update_content_digest(digest, item)
+        digest.update(b"]")
+    elif isinstance(value, dict):
+        digest.update(f"D{len(value)}{{".encode())
+        for key in sorted(value, key=repr):
+            digest.update(f"{key!r}:".encode())
+            _update_content_digest(digest, value[key])
+        digest.update(b"}")
+    elif isinstance(value, Enum):
+        digest.update(f"E{value.value!r};".encode())
+    else:
+        digest.update(f"{type(value).__name__}:{value!r};".encode())
+
+
+class MaterialModel(VersionedModel, abc.ABC):
     """A base class for representing a material model."""
 
     name: str = Field(default="", title="Name", description="The name of the material model.")
@@ -123,8 +237,33 @@ class MaterialModel(BaseModel, abc.ABC):
     interpolator: Interpolator = Field(
         default=Interpolator.GIL_INTERPOLATOR,
         title="Interpolator",
-        description="The interpolation method to use for this material model. Currently, only GIL is supported.",  # noqa: E501
+        description="The interpolation method to use for this material model. GIL and NumPy are supported.",  # noqa: E501
     )
+    _interpolator_cache: tuple[str, Any, Any] | None = PrivateAttr(default=None)
+    _content_hash: tuple[Any, str] | None = PrivateAttr(default=None)
+    _batch_data: tuple[str, tuple, np.ndarray, np.ndarray] | None = PrivateAttr(default=None)
+
+    @property
+    def content_hash(self) -> str:
+        """
+        Stable hash of the content of the model.
+
+        The hash covers the class of the model and all its fields, including the
+        qualifiers, the values and units of the quantities, the independent parameters
+        and the interpolation options. Models with equal hashes hold the same data.
+
+        The hash is cached until a field of the model, or of a model nested in it such
+        as an independent parameter or the interpolation options, is assigned. Changes
+        made in place to the arrays of quantities are not detected, assign the quantity
+        again to refresh the hash.
+        """
+        version = get_content_version(self)
+        cached = self.__pydantic_private__["_content_hash"]
+        if cached is None or cached[0] != version:
+            digest = hashlib.sha256()
+            _update_content_digest(digest, self)
+            cached = self._content_hash = (version, digest.hexdigest())
+        return cached[1]
 
     @classmethod
     def load(cls, value: dict | None):
@@ -313,42 +452,336 @@ class MaterialModel(BaseModel, abc.ABC):
 
         return self.model_copy(update=updates)
 
-    def query(
-        self, values: list[float] | list[list[float]], **kwargs
-    ) -> list[float] | list[list[float]]:
+    def query(self, values: list[float] | list[list[float]] | np.ndarray, **kwargs) -> np.ndarray:
         """
         Query the material model with the given values.
 
         Parameters
         ----------
-        values: list[float] | list[list[float]]
+        values: list[float] | list[list[float]] | np.ndarray
             The values to query the material model with. This can be a list of lists
-            for multiple independent parameters or a list of floats
+            (or a 2-D array) for multiple independent parameters or a list of floats
             for a single independent parameter.
 
         Returns
         -------
-        list[float] | list[list[float]]
-            The result of the query. This will be a list of floats for a single
-            independent parameter or a list of lists for multiple independent parameters.
+        np.ndarray
+            The result of the query, with one row per queried point and one column
+            per dependent parameter.
         """
         self.validate_model()
         if self.interpolator == Interpolator.GIL_INTERPOLATOR:
             dpf_server = kwargs.get("dpf_server", None)
             return self._query_with_gil(values, dpf_server=dpf_server)
+        elif self.interpolator == Interpolator.NUMPY_INTERPOLATOR:
+            return self._query_with_numpy(values)
         else:
             raise NotImplementedError(f"Interpolator {self.interpolator} is not implemented yet.")
 
+    def _get_dependent_parameter_names(self) -> list[str]:
+        """Get the names of the fields holding dependent parameters."""
+        excluded_fields = set(MaterialModel.model_fields.keys())
+        return [
+            field for field in self.__class__.model_fields.keys() if field not in excluded_fields
+        ]
+
+    def _get_interpolation_data(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Get the tabulated independent and dependent parameter values.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            The independent values with shape ``(n_entities, n_independent)`` and the
+            dependent values with shape ``(n_entities, n_dependent)``.
+        """
+        if not self.independent_parameters:
+            raise ValueError("Querying a material model with no independent parameters.")
+        if any(ip.values is None for ip in self.independent_parameters):
+            raise ValueError(
+                "Querying a material model with independent parameters that have no values."
+            )
+        dependent_parameters = self._get_dependent_parameter_names()
+        if len(dependent_parameters) == 0:
+            raise ValueError("No dependent parameters found for this material model.")
+
+        independent_values = [
+            np.atleast_1d(np.asarray(ip.values.value, dtype=float))
+            for ip in self.independent_parameters
+        ]
+        dependent_values = [
+            np.atleast_1d(np.asarray(getattr(self, name).value, dtype=float))
+            for name in dependent_parameters
+        ]
+        n_entities = {len(values) for values in independent_values + dependent_values}
+        if len(n_entities) != 1:
+            raise ValueError(
+                "Querying a material model whose parameters have different numbers of values."
+            )
+        return np.column_stack(independent_values), np.column_stack(dependent_values)
+
+    def _query_with_numpy(self, values: list[float] | list[list[float]] | np.ndarray) -> np.ndarray:
+        """
+        Query the material model using the NumPy interpolator.
+
+        Parameters
+        ----------
+        values: list[float] | list[list[float]]
+            The values to query the material model with. This can be a list of lists for multiple
+            independent parameters or a list of floats for a single independent parameter.
+
+        Returns
+        -------
+        np.ndarray
+            The interpolated dependent parameters with shape ``(n_points, n_dependent)``.
+        """
+        independent_values, dependent_values = self._get_interpolation_data()
+        algorithm, is_normalized = self._get_numpy_algorithm()
+        interpolator = self._get_cached_interpolator(
+            self._get_interpolation_key(independent_values, dependent_values),
+            lambda: NumpyInterpolator(
+                independent_values, dependent_values, algorithm=algorithm, normalized=is_normalized
+            ),
+        )
+        return interpolator.evaluate(values)
+
+    def _get_numpy_algorithm(self) -> tuple[NumpyInterpolationAlgorithms, bool]:
+        """Get the NumPy interpolation algorithm and normalization flag of the model."""
+        if not self.interpolation_options:
+            # default to linear multivariate if no interpolation options are provided
+            algorithm_type = "Linear Multivariate"
+            is_normalized = True
+        else:
+            algorithm_type = self.interpolation_options.algorithm_type
+            is_normalized = self.interpolation_options.normalized
+        if not algorithm_type:
+            raise ValueError("Querying a material model with no interpolation options algorithm.")
+        algorithm = MATML_TO_NUMPY_ALGORITHM_MAPPING.get(algorithm_type, None)
+        if algorithm is None:
+            raise ValueError(
+                f"Interpolation algorithm '{algorithm_type}' is not supported by the "
+                "NumPy interpolator."
+            )
+        return algorithm, is_normalized
+
+    def _get_dependent_parameter_index(self, parameter: str | None) -> int:
+        """Get the column of a dependent parameter in the interpolation data."""
+        names = self._get_dependent_parameter_names()
+        if parameter is None:
+            if len(names) != 1:
+                raise ValueError(
+                    f"{self.__class__.__name__} has several dependent parameters {names}, "
+                    "please select one of them."
+                )
+            return 0
+        if parameter not in names:
+            raise ValueError(
+                f"{self.__class__.__name__} has no dependent parameter '{parameter}'. "
+                f"Available parameters are {names}."
+            )
+        return names.index(parameter)
+
+    def _get_batch_data(self) -> tuple[tuple, np.ndarray, np.ndarray]:
+        """
+        Get the batch query group and the interpolation data of the model.
+
+        The model is validated and its data is extracted again only when its content
+        hash changes.
+
+        Returns
+        -------
+        tuple[tuple, np.ndarray, np.ndarray]
+            The key of the group of models sharing an interpolation grid, and the
+            independent and dependent values, see :meth:`_get_interpolation_data`.
+        """
+        content_hash = self.content_hash
+        cached = self._batch_data
+        if cached is None or cached[0] != content_hash:
+            self.validate_model()
+            independent_values, dependent_values = self._get_interpolation_data()
+            algorithm, is_normalized = self._get_numpy_algorithm()
+            key = (
+                self.__class__,
+                algorithm,
+                is_normalized,
+                independent_values.shape,
+                hashlib.sha256(np.ascontiguousarray(independent_values).tobytes()).hexdigest(),
+            )
+            cached = self._batch_data = (content_hash, key, independent_values, dependent_values)
+        return cached[1], cached[2], cached[3]
+
+    @staticmethod
+    def _get_batch_interpolator(
+        key: tuple, build: Callable[[], NumpyInterpolator]
+    ) -> NumpyInterpolator:
+        """
+        Return the batch query interpolator cached for ``key``, building it if needed.
+
+        Parameters
+        ----------
+        key: tuple
+            Group key, selected dependent parameter and content hashes of the models.
+        build: Callable[[], NumpyInterpolator]
+            Function building the interpolator on a cache miss.
+
+        Returns
+        -------
+        NumpyInterpolator
+            The cached or newly built interpolator.
+        """
+        with _BATCH_INTERPOLATORS_LOCK:
+            interpolator = _BATCH_INTERPOLATORS.get(key)
+            if interpolator is not None:
+                _BATCH_INTERPOLATORS.move_to_end(key)
+                return interpolator
+        interpolator = build()
+        with _BATCH_INTERPOLATORS_LOCK:
+            _BATCH_INTERPOLATORS[key] = interpolator
+            while len(_BATCH_INTERPOLATORS) > _MAX_BATCH_INTERPOLATORS:
+                _BATCH_INTERPOLATORS.popitem(last=False)
+        return interpolator
+
+    @staticmethod
+    def batch_query(
+        models: Sequence["MaterialModel | None"],
+        values: list[float] | list[list[float]] | np.ndarray,
+        parameter: str | None = None,
+        **kwargs,
+    ) -> np.ndarray:
+        """
+        Query the same dependent parameter of many material models at once.
+
+        Models using the NumPy interpolator are grouped by type, interpolation
+        algorithm and independent parameter values, and each group is evaluated with a
+        single interpolator. Models without independent parameters are constant over
+        all points. Other models are queried one by one with :meth:`query`.
+
+        The interpolators of the groups are cached on the content hashes of their
+        models, so repeated queries of unchanged models do not build them again. See
+        :attr:`content_hash` for the changes that are detected.
+
+        Parameters
+        ----------
+        models: Sequence[MaterialModel | None]
+            The material models to query. ``None`` entries yield rows of ``NaN``.
+        values: list[float] | list[list[float]] | np.ndarray
+            The values to query the material models with, see :meth:`query`.
+        parameter: str | None
+            Name of the dependent parameter to evaluate, for example ``"youngs_modulus"``.
+            It can be omitted if the models have a single dependent parameter.
+        **kwargs
+            Keyword arguments forwarded to :meth:`query`, for example ``dpf_server``.
+
+        Returns
+        -------
+        np.ndarray
+            The queried values with shape ``(n_models, n_points)``.
+        """
+        n_points = np.atleast_1d(np.asarray(values, dtype=float)).shape[0]
+        result = np.full((len(models), n_points), np.nan)
+        groups: dict[tuple, tuple[np.ndarray, list[int], list[np.ndarray], list[str]]] = {}
+        for row, model in enumerate(models):
+            if model is None:
+                continue
+            column = model._get_dependent_parameter_index(parameter)
+            if not model.independent_parameters:
+                model.validate_model()
+                name = model._get_dependent_parameter_names()[column]
+                result[row] = np.atleast_1d(np.asarray(getattr(model, name).value, float))[0]
+            elif model.interpolator != Interpolator.NUMPY_INTERPOLATOR:
+                queried = np.asarray(model.query(values, **kwargs)).reshape(n_points, -1)
+                result[row] = queried[:, column]
+            else:
+                key, independent_values, dependent_values = model._get_batch_data()
+                group = groups.setdefault(key, (independent_values, [], [], []))
+                group[1].append(row)
+                group[2].append(dependent_values[:, column])
+                group[3].append(model.content_hash)
+
+        for key, (independent_values, rows, columns, content_hashes) in groups.items():
+            _, algorithm, is_normalized, _, _ = key
+            interpolator = MaterialModel._get_batch_interpolator(
+                (key, parameter, tuple(content_hashes)),
+                lambda: NumpyInterpolator(
+                    independent_values,
+                    np.column_stack(columns),
+                    algorithm=algorithm,
+                    normalized=is_normalized,
+                ),
+            )
+            result[rows] = interpolator.evaluate(values).T
+        return result
+
+    def _get_interpolation_key(
+        self, independent_values: np.ndarray, dependent_values: np.ndarray
+    ) -> str:
+        """
+        Compute a content hash of everything an interpolator is built from.
+
+        Parameters
+        ----------
+        independent_values: np.ndarray
+            The tabulated independent parameter values.
+        dependent_values: np.ndarray
+            The tabulated dependent parameter values.
+
+        Returns
+        -------
+        str
+            Hexadecimal digest identifying the interpolator.
+        """
+        digest = hashlib.sha256(self.interpolator.value.encode())
+        for array in (independent_values, dependent_values):
+            digest.update(str(array.shape).encode())
+            digest.update(np.ascontiguousarray(array).tobytes())
+        for ip in self.independent_parameters:
+            digest.update(
+                repr((ip.name, ip.default_value, ip.lower_limit, ip.upper_limit)).encode()
+            )
+        if self.interpolation_options:
+            digest.update(self.interpolation_options.model_dump_json().encode())
+        return digest.hexdigest()
+
+    def _get_cached_interpolator(
+        self, key: str, build: Callable[[], Any], dpf_server: Any = None
+    ) -> Any:
+        """
+        Return the interpolator cached for ``key``, building it if needed.
+
+        Only the interpolator for the latest key is kept, so the cache is invalidated as
+        soon as the data of the model changes.
+
+        Parameters
+        ----------
+        key: str
+            Content hash of the interpolator, see :meth:`_get_interpolation_key`.
+        build: Callable[[], Any]
+            Function building the interpolator on a cache miss.
+        dpf_server: Any
+            The DPF server holding the interpolator, if any.
+
+        Returns
+        -------
+        Any
+            The cached or newly built interpolator.
+        """
+        cache = self._interpolator_cache
+        if cache is not None and cache[0] == key and cache[1] is dpf_server:
+            return cache[2]
+        interpolator = build()
+        self._interpolator_cache = (key, dpf_server, interpolator)
+        return interpolator
+
     @requires_dpf_271
     def _query_with_gil(
-        self, values: list[float] | list[list[float]], dpf_server=None
-    ) -> list[float] | list[list[float]]:
+        self, values: list[float] | list[list[float]] | np.ndarray, dpf_server=None
+    ) -> np.ndarray:
         """
         Query the material model using GIL interpolation.
 
         Parameters
         ----------
-        values: list[float] | list[list[float]]
+        values: list[float] | list[list[float]] | np.ndarray
             The values to query the material model with. This can be a list of lists for multiple
             independent parameters or a list of floats for a single independent parameter.
 
@@ -364,90 +797,65 @@ class MaterialModel(BaseModel, abc.ABC):
 
         Returns
         -------
-        list[float] | list[list[float]]
-             The result of the query. This will be a list of floats for a single
-             independent parameter or a list of lists for multiple independent parameters.
+        np.ndarray
+             The interpolated dependent parameters with shape ``(n_points, n_dependent)``.
         """
-        if self.independent_parameters is None:
-            raise ValueError("Querying a material model with no independent parameters.")
-        indep_param_dim = len(self.independent_parameters)
-        if indep_param_dim == 0:
-            raise ValueError("Querying a material model with no independent parameters.")
-
-        if self.independent_parameters[0].values is None:
-            raise ValueError(
-                "Querying a material model with independent parameters that have no values."
-            )
-        indep_param_ent = len(self.independent_parameters[0].values.value)
-
-        excluded_fields = set(MaterialModel.model_fields.keys())
-        dependant_parameters = [
-            field for field in self.__class__.model_fields.keys() if field not in excluded_fields
-        ]
-
-        dep_param_dim = len(dependant_parameters)
-        if dep_param_dim == 0:
-            raise ValueError("No dependent parameters found for this material model.")
-        dep_param_ent = (
-            len(getattr(self, dependant_parameters[0]).value) if dep_param_dim > 0 else None
+        dpf = _get_dpf()
+        independent_values, dependent_values = self._get_interpolation_data()
+        interpolator_instance = self._get_cached_interpolator(
+            self._get_interpolation_key(independent_values, dependent_values),
+            lambda: self._build_gil_interpolator(
+                independent_values, dependent_values, dpf_server=dpf_server
+            ),
+            dpf_server,
         )
-        if dep_param_ent is None:
-            raise ValueError(
-                "Querying a material model with dependent parameters that have no values."
-            )
-
-        indep_values = [
-            self.independent_parameters[i].values.value.tolist() for i in range(indep_param_dim)
-        ]
-        indep_values = list(map(list, zip(*indep_values)))
-        indep_param_field = dpf.fields_factory.create_vector_field(
-            num_entities=indep_param_ent, num_comp=indep_param_dim
+        evaluation_points = np.asarray(values, dtype=float)
+        if evaluation_points.ndim < 2:
+            evaluation_points = evaluation_points.reshape(-1, independent_values.shape[1])
+        query = dpf.Operator("gil::query_interpolation_operator", server=dpf_server)
+        query.inputs.interpolator.connect(interpolator_instance)
+        query.inputs.evaluation_points.connect(
+            _create_vector_field(evaluation_points, server=dpf_server)
         )
-        for i in range(indep_param_ent):
-            indep_param_field.append(indep_values[i], i)
+        query.run()
+        # a one-component field returns 1-D data
+        data = np.asarray(query.outputs.evaluation.get_data().data)
+        return data.reshape(len(evaluation_points), -1)
 
-        dep_values = [
-            getattr(self, dependant_parameters[i]).value.tolist() for i in range(dep_param_dim)
-        ]
-        dep_values = list(map(list, zip(*dep_values)))
-        dep_param_field = dpf.fields_factory.create_vector_field(
-            num_entities=dep_param_ent, num_comp=dep_param_dim
-        )
-        for i in range(dep_param_ent):
-            dep_param_field.append(dep_values[i], i)
+    def _build_gil_interpolator(
+        self, independent_values: np.ndarray, dependent_values: np.ndarray, dpf_server=None
+    ) -> Any:
+        """
+        Build a GIL interpolator instance from the data of the material model.
 
+        Parameters
+        ----------
+        independent_values: np.ndarray
+            The independent values with shape ``(n_entities, n_independent)``.
+        dependent_values: np.ndarray
+            The dependent values with shape ``(n_entities, n_dependent)``.
+        dpf_server: GrpcServer | InProcessServer | LegacyGrpcServer | None, optional
+            The DPF server to build the interpolator on.
+
+        Returns
+        -------
+        Any
+            The interpolator instance produced by ``gil::interpolation_operator``.
+        """
+        dpf = _get_dpf()
         defaults = [
-            (
-                [self.independent_parameters[i].default_value]
-                if self.independent_parameters[i].default_value is not None
-                else [0.0]
-            )
-            for i in range(indep_param_dim)
+            [ip.default_value] if ip.default_value is not None else [0.0]
+            for ip in self.independent_parameters
         ]
-
         min_max = [
             (
-                [
-                    self.independent_parameters[i].lower_limit,
-                    self.independent_parameters[i].upper_limit,
-                ]
-                if self.independent_parameters[i].lower_limit is not None
-                and self.independent_parameters[i].upper_limit is not None
+                [ip.lower_limit, ip.upper_limit]
+                if ip.lower_limit is not None and ip.upper_limit is not None
                 else [0.0, 1.0]
             )
-            for i in range(indep_param_dim)
+            for ip in self.independent_parameters
         ]
 
-        ind_parameter_defaults = dpf.fields_factory.create_vector_field(
-            num_entities=indep_param_dim, num_comp=1
-        )
-        ind_parameter_ranges = dpf.fields_factory.create_vector_field(
-            num_entities=indep_param_dim, num_comp=2
-        )
-        for i in range(indep_param_dim):
-            ind_parameter_defaults.append(defaults[i], i)
-            ind_parameter_ranges.append(min_max[i], i)
-
         if not self.interpolation_options:
             # default to linear multivariate if no interpolation options are provided
             algorithm = MATML_TO_GIL_ALGORITHM_MAPPING.get("Linear Multivariate", None)
@@ -465,11 +873,19 @@ class MaterialModel(BaseModel, abc.ABC):
 
         # TODO need to adapt algorithm options
         algorithm_options = None
-        gil_interpolator = dpf.Operator("gil::interpolation_operator")
-        gil_interpolator.inputs.independent_parameters.connect(indep_param_field)
-        gil_interpolator.inputs.independent_parameters_ranges.connect(ind_parameter_ranges)
-        gil_interpolator.inputs.independent_parameters_defaults.connect(ind_parameter_defaults)
-        gil_interpolator.inputs.dependent_parameters.connect(dep_param_field)
+        gil_interpolator = dpf.Operator("gil::interpolation_operator", server=dpf_server)
+        gil_interpolator.inputs.independent_parameters.connect(
+            _create_vector_field(independent_values, server=dpf_server)
+        )
+        gil_interpolator.inputs.independent_parameters_ranges.connect(
+            _create_vector_field(min_max, server=dpf_server)
+        )
+        gil_interpolator.inputs.independent_parameters_defaults.connect(
+            _create_vector_field(defaults, server=dpf_server)
+        )
+        gil_interpolator.inputs.dependent_parameters.connect(
+            _create_vector_field(dependent_values, server=dpf_server)
+        )
         gil_interpolator.inputs.algorithm.connect(algorithm)
         gil_interpolator.inputs.is_normalized.connect(is_normalized)
         gil_interpolator.inputs.is_cached.connect(is_cached)
@@ -480,17 +896,7 @@ class MaterialModel(BaseModel, abc.ABC):
         status_info = gil_interpolator.outputs.status_info.get_data()
         status_info_dict = status_info.to_dict()
         print("GIL interpolation status info:", status_info_dict)
-        interpolator_instance = gil_interpolator.outputs.interpolator.get_data()
-        query = dpf.Operator("gil::query_interpolation_operator")
-        query.inputs.interpolator.connect(interpolator_instance)
-        evaluation_points = dpf.fields_factory.create_vector_field(
-            num_entities=len(values), num_comp=indep_param_dim
-        )
-        for value_idx, value in enumerate(values):
-            evaluation_points.append(value if isinstance(value, list) else [value], value_idx)
-        query.inputs.evaluation_points.connect(evaluation_points)
-        query.run()
-        return query.outputs.evaluation.get_data().data
+        return gil_interpolator.outputs.interpolator.get_data()
 
     def get_independent_parameter_by_name(self, name: str) -> IndependentParameter | None:
         """Get the independent parameter with a given name."""
@@ -20,10 +20,12 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ._versioned_model import VersionedModel
 
-class ModelQualifier(BaseModel):
+
+class ModelQualifier(VersionedModel):
     """Class representing a model qualifier in a material model."""
 
     name: str = Field(
@@ -0,0 +1,416 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Interpolation of tabular material data implemented with NumPy only."""
+
+import itertools
+
+import numpy as np
+
+from .common import NumpyInterpolationAlgorithms
+
+# Upper bound for the number of (evaluation point, table entry) pairs processed at once.
+_CHUNK_SIZE = 2**20
+_BARYCENTRIC_TOLERANCE = 1e-10
+_CIRCUMCIRCLE_TOLERANCE = 1e-10
+
+
+def _resize(array: np.ndarray, capacity: int) -> np.ndarray:
+    """Copy an array into new storage with room for ``capacity`` rows."""
+    resized = np.empty((capacity,) + array.shape[1:], dtype=array.dtype)
+    resized[: len(array)] = array
+    return resized
+
+
+def _circumcircles(vertices: np.ndarray, triangles: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute the circumcircles of triangles.
+
+    Parameters
+    ----------
+    vertices : np.ndarray
+        Vertex coordinates with shape ``(n_vertices, 2)``.
+    triangles : np.ndarray
+        Vertex indices of the triangles with shape ``(n_triangles, 3)``.
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Centers with shape ``(n_triangles, 2)`` and squared radii with shape
+        ``(n_triangles,)``. Degenerate triangles get an infinite radius.
+    """
+    a, b, c = (vertices[triangles[:, k]] for k in range(3))
+    (ax, ay), (bx, by), (cx, cy) = a.T, b.T, c.T
+    d = 2.0 * (ax * (by - cy) + bx * (cy - ay) + cx * (ay - by))
+    degenerate = d == 0.0
+    d[degenerate] = 1.0
+    a2, b2, c2 = ax * ax + ay * ay, bx * bx + by * by, cx * cx + cy * cy
+    centers = np.column_stack(
+        [
+            (a2 * (by - cy) + b2 * (cy - ay) + c2 * (ay - by)) / d,
+            (a2 * (cx - bx) + b2 * (ax - cx) + c2 * (bx - ax)) / d,
+        ]
+    )
+    radii = ((a - centers) ** 2).sum(axis=1)
+    centers[degenerate] = 0.0
+    radii[degenerate] = np.inf
+    return centers, radii
+
+
+def _delaunay_2d(points: np.ndarray) -> np.ndarray:
+    """
+    Triangulate a set of distinct 2-D points with the Bowyer-Watson algorithm.
+
+    Parameters
+    ----------
+    points : np.ndarray
+        Points with shape ``(n_points, 2)``.
+
+    Returns
+    -------
+    np.ndarray
+        Vertex indices of the triangles with shape ``(n_triangles, 3)``.
+
+    Notes
+    -----
+    Each insertion tests the point against the circumcircles of all triangles at once
+    with NumPy, so building is O(n²) in the number of points, without a Python loop
+    over the triangles. This targets material tables with up to a few thousand
+    scattered entries: a few hundred points triangulate in tens of milliseconds and
+    about 2000 points in roughly half a second. The interpolator is built once per
+    table and cached on the model, so queries do not pay this cost again.
+    """
+    n_points = len(points)
+    lower = points.min(axis=0)
+    upper = points.max(axis=0)
+    span = (upper - lower).max()
+    center = 0.5 * (lower + upper)
+    super_triangle = center + span * np.array([[-100.0, -100.0], [100.0, -100.0], [0.0, 100.0]])
+    vertices = np.vstack([points, super_triangle])
+
+    # Removed triangles get a negative radius so that they are never tested as bad again,
+    # and are dropped once they make up half of the storage.
+    capacity = 4 * n_points + 4
+    triangles = np.empty((capacity, 3), dtype=np.int64)
+    centers = np.empty((capacity, 2))
+    radii = np.empty(capacity)
+    triangles[0] = (n_points, n_points + 1, n_points + 2)
+    centers[:1], radii[:1] = _circumcircles(vertices, triangles[:1])
+    n_triangles = 1
+    n_alive = 1
+    n_vertices = np.int64(len(vertices))
+    for point_idx in range(n_points):
+        distances = ((centers[:n_triangles] - vertices[point_idx]) ** 2).sum(axis=1)
+        bad_idx = np.flatnonzero(distances < radii[:n_triangles] * (1.0 - _CIRCUMCIRCLE_TOLERANCE))
+        radii[bad_idx] = -1.0
+
+        # The boundary of the cavity consists of the edges that belong to one bad triangle.
+        edges = np.sort(triangles[bad_idx][:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+        edge_keys, counts = np.unique(edges[:, 0] * n_vertices + edges[:, 1], return_counts=True)
+        boundary = edge_keys[counts == 1]
+        new_triangles = np.column_stack(
+            [boundary // n_vertices, boundary % n_vertices, np.full(len(boundary), point_idx)]
+        )
+
+        n_new = len(new_triangles)
+        n_alive += n_new - len(bad_idx)
+        if n_triangles + n_new > capacity or n_triangles > 2 * n_alive:
+            keep = np.flatnonzero(radii[:n_triangles] >= 0.0)
+            capacity = max(capacity, 2 * (len(keep) + n_new))
+            triangles = _resize(triangles[keep], capacity)
+            centers = _resize(centers[keep], capacity)
+            radii = _resize(radii[keep], capacity)
+            n_triangles = len(keep)
+        new_slice = slice(n_triangles, n_triangles + n_new)
+        triangles[new_slice] = new_triangles
+        centers[new_slice], radii[new_slice] = _circumcircles(vertices, new_triangles)
+        n_triangles += n_new
+
+    simplices = triangles[:n_triangles][radii[:n_triangles] >= 0.0]
+    simplices = simplices[(simplices < n_points).all(axis=1)].astype(int)
+    if len(simplices) > 0:
+        edge_1 = points[simplices[:, 1]] - points[simplices[:, 0]]
+        edge_2 = points[simplices[:, 2]] - points[simplices[:, 0]]
+        areas = np.abs(edge_1[:, 0] * edge_2[:, 1] - edge_1[:, 1] * edge_2[:, 0])
+        simplices = simplices[areas > _BARYCENTRIC_TOLERANCE * span * span]
+    return simplices
+
+
+class NumpyInterpolator:
+    """
+    Interpolator for tabular material data that only depends on NumPy.
+
+    The interpolator is built once from the tabulated independent and dependent
+    parameter values and can then be evaluated for any number of points.
+
+    Independent parameters that take a single value over the whole table carry no
+    information and are ignored, both when building and when evaluating.
+    ``LINEAR_TRIANGULATION`` uses the ``LINEAR`` algorithm when a single independent
+    parameter remains and the ``MULTILINEAR`` algorithm when the data lies on a full
+    rectilinear grid. Otherwise, scattered data with two independent parameters is
+    triangulated and interpolated with barycentric weights. Evaluation points outside
+    of the data are projected onto its bounding box and then onto its convex hull.
+    """
+
+    def __init__(
+        self,
+        independent_values: np.ndarray,
+        dependent_values: np.ndarray,
+        algorithm: NumpyInterpolationAlgorithms = NumpyInterpolationAlgorithms.LINEAR_TRIANGULATION,
+        normalized: bool = True,
+    ):
+        """
+        Build the interpolator.
+
+        Parameters
+        ----------
+        independent_values : np.ndarray
+            Independent parameter values with shape ``(n_entities, n_independent)``.
+        dependent_values : np.ndarray
+            Dependent parameter values with shape ``(n_entities, n_dependent)``.
+        algorithm : NumpyInterpolationAlgorithms
+            Interpolation algorithm to use.
+        normalized : bool
+            Whether the independent parameters are scaled to the unit interval before
+            computing distances. This affects the ``NEAREST_NEIGHBOR`` and
+            ``LINEAR_TRIANGULATION`` algorithms.
+        """
+        independent_values = np.asarray(independent_values, dtype=float)
+        dependent_values = np.asarray(dependent_values, dtype=float)
+        if independent_values.ndim == 1:
+            independent_values = independent_values.reshape(-1, 1)
+        if dependent_values.ndim == 1:
+            dependent_values = dependent_values.reshape(-1, 1)
+        if len(independent_values) == 0:
+            raise ValueError("Cannot build an interpolator from a table with no entries.")
+        if len(independent_values) != len(dependent_values):
+            raise ValueError(
+                f"The number of independent parameter entries ({len(independent_values)}) "
+                f"and dependent parameter entries ({len(dependent_values)}) do not match."
+            )
+
+        self._n_independent = independent_values.shape[1]
+        lower = independent_values.min(axis=0)
+        upper = independent_values.max(axis=0)
+        self._active = np.flatnonzero(upper > lower)
+        self._offset = lower[self._active]
+        self._scale = (upper - lower)[self._active] if normalized else np.ones(len(self._active))
+
+        points = self._to_local(independent_values)
+        self._lower = points.min(axis=0)
+        self._upper = points.max(axis=0)
+        self._algorithm = self._resolve_algorithm(NumpyInterpolationAlgorithms(algorithm), points)
+
+        if self._algorithm is None:
+            self._constant = dependent_values[0]
+        elif self._algorithm == NumpyInterpolationAlgorithms.LINEAR:
+            order = np.argsort(points[:, 0], kind="stable")
+            self._x = points[order, 0]
+            self._values = dependent_values[order]
+        elif self._algorithm == NumpyInterpolationAlgorithms.MULTILINEAR:
+            self._build_grid(points, dependent_values)
+        elif self._algorithm == NumpyInterpolationAlgorithms.NEAREST_NEIGHBOR:
+            self._points = points
+            self._values = dependent_values
+        else:
+            self._build_triangulation(points, dependent_values)
+
+    @property
+    def algorithm(self) -> NumpyInterpolationAlgorithms | None:
+        """Algorithm used for evaluation, or ``None`` if the table is constant."""
+        return self._algorithm
+
+    def _to_local(self, points: np.ndarray) -> np.ndarray:
+        """Keep the non-constant independent parameters and apply the normalization."""
+        return (points[:, self._active] - self._offset) / self._scale
+
+    @staticmethod
+    def _is_grid(points: np.ndarray) -> bool:
+        """Check whether the points form a full rectilinear grid without duplicates."""
+        n_grid_points = np.prod([len(np.unique(points[:, k])) for k in range(points.shape[1])])
+        return n_grid_points == len(points) == len(np.unique(points, axis=0))
+
+    def _resolve_algorithm(
+        self, algorithm: NumpyInterpolationAlgorithms, points: np.ndarray
+    ) -> NumpyInterpolationAlgorithms | None:
+        """Return the algorithm that is used for the given table."""
+        n_active = points.shape[1]
+        if n_active == 0:
+            return None
+        if algorithm == NumpyInterpolationAlgorithms.LINEAR_TRIANGULATION:
+            if n_active == 1:
+                return NumpyInterpolationAlgorithms.LINEAR
+            if self._is_grid(points):
+                return NumpyInterpolationAlgorithms.MULTILINEAR
+            if n_active > 2:
+                raise NotImplementedError(
+                    "The NumPy interpolator only supports the triangulation of scattered data "
+                    f"with up to two varying independent parameters, but got {n_active}."
+                )
+        elif algorithm == NumpyInterpolationAlgorithms.LINEAR and n_active != 1:
+            raise ValueError(
+                f"Linear interpolation requires one varying independent parameter, "
+                f"but got {n_active}."
+            )
+        elif algorithm == NumpyInterpolationAlgorithms.MULTILINEAR and not self._is_grid(points):
+            raise ValueError(
+                "Multilinear interpolation requires the data to lie on a full rectilinear grid."
+            )
+        return algorithm
+
+    def _build_grid(self, points: np.ndarray, dependent_values: np.ndarray) -> None:
+        """Scatter the table onto its rectilinear grid."""
+        self._axes = [np.unique(points[:, k]) for k in range(points.shape[1])]
+        indices = tuple(np.searchsorted(axis, points[:, k]) for k, axis in enumerate(self._axes))
+        self._grid = np.empty([len(axis) for axis in self._axes] + [dependent_values.shape[1]])
+        self._grid[indices] = dependent_values
+
+    def _build_triangulation(self, points: np.ndarray, dependent_values: np.ndarray) -> None:
+        """Triangulate the table and precompute the barycentric transforms."""
+        points, unique_idx = np.unique(points, axis=0, return_index=True)
+        dependent_values = dependent_values[unique_idx]
+        simplices = _delaunay_2d(points)
+        if len(simplices) == 0:
+            raise ValueError(
+                "Cannot triangulate the independent parameter values as they are collinear."
+            )
+        self._points = points
+        self._values = dependent_values
+        self._simplices = simplices
+        self._origins = points[simplices[:, 0]]
+        edges = np.stack(
+            [points[simplices[:, 1]] - self._origins, points[simplices[:, 2]] - self._origins],
+            axis=-1,
+        )
+        self._transforms = np.linalg.inv(edges)
+
+        all_edges = np.sort(
+            np.concatenate([simplices[:, [0, 1]], simplices[:, [1, 2]], simplices[:, [2, 0]]]),
+            axis=1,
+        )
+        unique_edges, counts = np.unique(all_edges, axis=0, return_counts=True)
+        self._hull_edges = unique_edges[counts == 1]
+
+    def evaluate(self, values: float | list[float] | list[list[float]] | np.ndarray) -> np.ndarray:
+        """
+        Evaluate the interpolator.
+
+        Parameters
+        ----------
+        values : float | list[float] | list[list[float]] | np.ndarray
+            Evaluation points with shape ``(n_points, n_independent)``. A flat sequence
+            is accepted if there is a single independent parameter.
+
+        Returns
+        -------
+        np.ndarray
+            Interpolated dependent values with shape ``(n_points, n_dependent)``.
+        """
+        points = np.asarray(values, dtype=float)
+        if points.ndim < 2 and self._n_independent == 1:
+            points = points.reshape(-1, 1)
+        if points.ndim != 2 or points.shape[1] != self._n_independent:
+            raise ValueError(
+                f"Expected evaluation points with {self._n_independent} independent "
+                f"parameter value(s) each, but got an array of shape {points.shape}."
+            )
+        if self._algorithm is None:
+            return np.tile(self._constant, (len(points), 1))
+
+        points = np.clip(self._to_local(points), self._lower, self._upper)
+        if self._algorithm == NumpyInterpolationAlgorithms.LINEAR:
+            return np.column_stack(
+                [
+                    np.interp(points[:, 0], self._x, self._values[:, k])
+                    for k in range(self._values.shape[1])
+                ]
+            )
+        if self._algorithm == NumpyInterpolationAlgorithms.MULTILINEAR:
+            return self._evaluate_grid(points)
+        if self._algorithm == NumpyInterpolationAlgorithms.NEAREST_NEIGHBOR:
+            return self._evaluate_nearest(points)
+        return self._evaluate_triangulation(points)
+
+    def _evaluate_grid(self, points: np.ndarray) -> np.ndarray:
+        """Evaluate the multilinear interpolant of the grid."""
+        cells = []
+        weights = []
+        for k, axis in enumerate(self._axes):
+            cell = np.clip(np.searchsorted(axis, points[:, k], side="right") - 1, 0, len(axis) - 2)
+            cells.append(cell)
+            weights.append((points[:, k] - axis[cell]) / (axis[cell + 1] - axis[cell]))
+
+        result = np.zeros((len(points), self._grid.shape[-1]))
+        for corner in itertools.product((0, 1), repeat=len(self._axes)):
+            weight = np.ones(len(points))
+            for k, upper in enumerate(corner):
+                weight *= weights[k] if upper else 1.0 - weights[k]
+            index = tuple(cell + upper for cell, upper in zip(cells, corner))
+            result += weight[:, None] * self._grid[index]
+        return result
+
+    def _evaluate_nearest(self, points: np.ndarray) -> np.ndarray:
+        """Evaluate the nearest neighbor interpolant."""
+        chunk_size = max(1, _CHUNK_SIZE // len(self._points))
+        nearest = np.empty(len(points), dtype=int)
+        for start in range(0, len(points), chunk_size):
+            chunk = points[start : start + chunk_size]
+            distances = ((chunk[:, None, :] - self._points[None, :, :]) ** 2).sum(axis=-1)
+            nearest[start : start + chunk_size] = distances.argmin(axis=1)
+        return self._values[nearest]
+
+    def _evaluate_triangulation(self, points: np.ndarray) -> np.ndarray:
+        """Evaluate the piecewise linear interpolant of the triangulation."""
+        result = np.empty((len(points), self._values.shape[1]))
+        found = np.zeros(len(points), dtype=bool)
+        chunk_size = max(1, _CHUNK_SIZE // len(self._simplices))
+        for start in range(0, len(points), chunk_size):
+            chunk = points[start : start + chunk_size]
+            offsets = chunk[:, None, :] - self._origins[None, :, :]
+            partial = np.einsum("tij,ctj->cti", self._transforms, offsets)
+            barycentric = np.concatenate([1.0 - partial.sum(axis=-1, keepdims=True), partial], -1)
+            inside = (barycentric >= -_BARYCENTRIC_TOLERANCE).all(axis=-1)
+            chunk_found = inside.any(axis=1)
+            simplex = inside.argmax(axis=1)[chunk_found]
+            weights = barycentric[np.flatnonzero(chunk_found), simplex]
+            vertex_values = self._values[self._simplices[simplex]]
+            result[start : start + chunk_size][chunk_found] = np.einsum(
+                "ck,ckm->cm", weights, vertex_values
+            )
+            found[start : start + chunk_size] = chunk_found
+
+        if not found.all():
+            result[~found] = self._project_to_hull(points[~found])
+        return result
+
+    def _project_to_hull(self, points: np.ndarray) -> np.ndarray:
+        """Evaluate points outside the triangulation at their projection onto the hull."""
+        start_points = self._points[self._hull_edges[:, 0]]
+        directions = self._points[self._hull_edges[:, 1]] - start_points
+        offsets = points[:, None, :] - start_points[None, :, :]
+        t = np.clip((offsets * directions).sum(axis=-1) / (directions**2).sum(axis=-1), 0.0, 1.0)
+        distances = ((offsets - t[..., None] * directions) ** 2).sum(axis=-1)
+        edge = distances.argmin(axis=1)
+        t = t[np.arange(len(points)), edge][:, None]
+        start_values = self._values[self._hull_edges[edge, 0]]
+        end_values = self._values[self._hull_edges[edge, 1]]
+        return (1.0 - t) * start_values + t * end_values
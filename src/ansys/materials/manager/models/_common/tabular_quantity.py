@@ -22,12 +22,13 @@
 
 from ansys.units import Quantity
 import numpy as np
-from pydantic import BaseModel, Field, model_validator
+from pydantic import Field, model_validator
 
+from ._versioned_model import VersionedModel
 from .independent_parameter import IndependentParameter
 
 
-class TabularQuantity(BaseModel):
+class TabularQuantity(VersionedModel):
     """
     A quantity defined over one or more independent parameter grids.
 
@@ -22,10 +22,12 @@
 
 
 from ansys.units import Quantity
-from pydantic import BaseModel, Field
+from pydantic import Field
 
+from ._versioned_model import VersionedModel
 
-class UserParameter(BaseModel):
+
+class UserParameter(VersionedModel):
     """Class representing an user parameter in a material model."""
 
     name: str = Field(default="", title="Name", description="The name of the user parameter.")
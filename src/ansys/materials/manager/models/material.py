@@ -21,13 +21,54 @@
 # SOFTWARE.
 
 from collections import Counter
-from typing import List
+from collections.abc import Iterator, Sequence
+import hashlib
+from typing import Callable, List
 import uuid
+import weakref
 
 from ._common import MaterialModel
 from ._common.visitor_protocol import MaterialModelWriterVisitorProtocol
 
 
+class ModelsView(Sequence):
+    """
+    Provides a read-only view of the models of a material.
+
+    The view does not copy the models and reflects later changes to the material.
+    """
+
+    __slots__ = ("_models",)
+
+    def __init__(self, models: list[MaterialModel]) -> None:
+        """Create a view of a list of models."""
+        self._models = models
+
+    def __getitem__(self, index):
+        """Get a model, or a list of models for a slice."""
+        return self._models[index]
+
+    def __len__(self) -> int:
+        """Get the number of models."""
+        return len(self._models)
+
+    def __iter__(self) -> Iterator[MaterialModel]:
+        """Iterate over the models."""
+        return iter(self._models)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the models with another view, list or tuple of models."""
+        if isinstance(other, (ModelsView, list, tuple)):
+            return self._models == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """Return the representation of the list of models."""
+        return repr(self._models)
+
+
 class Material:
     """
     Provides a wrapper class for managing a material.
@@ -69,9 +110,47 @@ class Material:
             self._guid = guid
         else:
             self._guid = str(uuid.uuid4())  # Generate a new UUID if not provided
+        self._observers = []
         self._models = []
-        self._models.extend(models)
-        self._check_unique_models()
+        self._model_names = set()
+        self._model_index = {}
+        self._add_models(models)
+
+    def __getstate__(self) -> dict:
+        """Get the state for pickling, without the model indexes and observers."""
+        state = self.__dict__.copy()
+        del state["_model_names"]
+        del state["_model_index"]
+        del state["_observers"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        """Restore the state from pickling, rebuilding the model indexes."""
+        self.__dict__.update(state)
+        self._observers = []
+        self._rebuild_model_index()
+
+    def _add_observer(self, callback: Callable[["Material"], None]) -> None:
+        """Call a method with this material when its ID, GUID or models change."""
+        reference = weakref.WeakMethod(callback)
+        self._observers = [observer for observer in self._observers if observer() is not None]
+        if reference not in self._observers:
+            self._observers.append(reference)
+
+    def _remove_observer(self, callback: Callable[["Material"], None]) -> None:
+        """Stop calling a method registered with :meth:`_add_observer`."""
+        self._observers = [
+            reference
+            for reference in self._observers
+            if reference() is not None and reference() != callback
+        ]
+
+    def _notify_changed(self) -> None:
+        """Call the observers of the material."""
+        for reference in self._observers:
+            callback = reference()
+            if callback is not None:
+                callback(self)
 
     @property
     def guid(self) -> str:
@@ -81,6 +160,7 @@ class Material:
     @guid.setter
     def guid(self, value: str) -> None:
         self._guid = value
+        self._notify_changed()
 
     @property
     def mat_id(self) -> int:
@@ -90,48 +170,90 @@ class Material:
     @mat_id.setter
     def mat_id(self, value: int) -> None:
         self._mat_id = value
+        self._notify_changed()
 
     @property
-    def models(self) -> list[MaterialModel]:
-        """Currently assigned material models."""
-        # returns a copy to block mutation operations
-        return self._models.copy()
+    def models(self) -> ModelsView:
+        """
+        Currently assigned material models, as a read-only view.
+
+        The view is live: it reflects the models appended, removed or assigned later.
+        Changing the models of the material while iterating over the view behaves like
+        changing a list while iterating over it, so iterate over a copy such as
+        ``list(material.models)`` instead.
+
+        The models can be assigned from any sequence of material models, including
+        the view of another material. The sequence is copied.
+        """
+        return ModelsView(self._models)
 
     @models.setter
-    def models(self, value: list[MaterialModel]) -> None:
+    def models(self, value: Sequence[MaterialModel]) -> None:
         """Set the material models."""
-        if not isinstance(value, list):
-            raise TypeError("models must be a list of MaterialModel instances.")
-        self._models = value
-        self._check_unique_models()
-
-    def _check_unique_models(self) -> None:
-        material_names = Counter([model.name for model in self.models])
-        repeated_models = [item for item, count in material_names.items() if count > 1]
+        if not isinstance(value, Sequence) or isinstance(value, (str, bytes)):
+            raise TypeError("models must be a sequence of MaterialModel instances.")
+        models = list(value)
+        self._models.clear()
+        self._model_names = set()
+        self._model_index = {}
+        try:
+            self._add_models(models)
+        finally:
+            self._notify_changed()
+
+    @property
+    def content_hash(self) -> str:
+        """
+        Stable hash of the material models.
+
+        The hash combines the content hashes of the models independently of their order.
+        It does not depend on the name, ID or GUID of the material, so that materials
+        holding the same models under different names have equal hashes. It is derived
+        from the hashes of the models, see :attr:`MaterialModel.content_hash`.
+        """
+        digest = hashlib.sha256()
+        for model_hash in sorted(model.content_hash for model in self._models):
+            digest.update(model_hash.encode())
+        return digest.hexdigest()
+
+    def _add_models(self, models: list[MaterialModel]) -> None:
+        """Add models, checking that their names are unique against the added ones only."""
+        model_names = [model.name for model in models]
+        repeated_models = [
+            name
+            for name, count in Counter(model_names).items()
+            if count > 1 or name in self._model_names
+        ]
         if len(repeated_models) > 0:
             raise ValueError(f"The following material models are repeated: {repeated_models}")
-        return
+        self._models.extend(models)
+        self._model_names.update(model_names)
+        for model in models:
+            self._model_index[model.name.lower()] = model
+
+    def _rebuild_model_index(self) -> None:
+        """Rebuild the name indexes from the models."""
+        self._model_names = {model.name for model in self._models}
+        self._model_index = {model.name.lower(): model for model in self._models}
 
     def append_models(self, value: list[MaterialModel] | MaterialModel) -> None:
         """Append one or more material models to the current material models."""
         if isinstance(value, MaterialModel):
             value = [value]
-        self._models.extend(value)
-        self._check_unique_models()
+        self._add_models(value)
+        self._notify_changed()
 
     def get_model_by_name(self, model_name: str) -> MaterialModel | None:
-        """Get the material model with a given model name."""
-        model = None
-        for mat_model in self._models:
-            if model_name.lower() == mat_model.name.lower():
-                model = mat_model
-        return model
+        """Get the material model with a given model name, ignoring the case."""
+        return self._model_index.get(model_name.lower(), None)
 
     def remove_model_by_name(self, model_name: str) -> None:
         """Remove a material model from the current material models by name."""
         model = self.get_model_by_name(model_name)
         if model is not None:
-            self._models.remove(model)
+            self._models[:] = [mat_model for mat_model in self._models if mat_model is not model]
+            self._rebuild_model_index()
+            self._notify_changed()
 
     def accept(self, visitor: MaterialModelWriterVisitorProtocol) -> None:
         """Visit every model on this material with a writer visitor.
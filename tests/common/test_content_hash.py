@@ -0,0 +1,147 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import patch
+
+from ansys.units import Quantity
+import pytest
+
+from ansys.materials.manager.models import (
+    Density,
+    IndependentParameter,
+    InterpolationOptions,
+    Material,
+    TabularQuantity,
+)
+from ansys.materials.manager.models._common import material_model
+
+
+@pytest.fixture
+def tabulated_density(density_model):
+    """Factory fixture for a density model tabulated over two temperatures."""
+
+    def _factory(values=(1.0, 2.0), units="kg m^-3", temperatures=(20.0, 40.0)) -> Density:
+        return density_model(values, units, temperatures)
+
+    return _factory
+
+
+def test_equal_models_have_equal_hashes(tabulated_density):
+    assert tabulated_density().content_hash == tabulated_density().content_hash
+    assert (
+        tabulated_density().content_hash == tabulated_density().model_copy(deep=True).content_hash
+    )
+
+
+def test_hash_covers_values_units_and_parameters(tabulated_density):
+    reference = tabulated_density().content_hash
+    assert tabulated_density(values=(1.0, 3.0)).content_hash != reference
+    assert tabulated_density(units="g cm^-3").content_hash != reference
+    assert tabulated_density(temperatures=(20.0, 50.0)).content_hash != reference
+
+
+def test_hash_covers_interpolation_options(tabulated_density):
+    model = tabulated_density()
+    with_options = tabulated_density()
+    with_options.interpolation_options = InterpolationOptions(algorithm_type="Linear")
+    assert with_options.content_hash != model.content_hash
+
+
+def test_hash_follows_assignment(tabulated_density):
+    model = tabulated_density()
+    reference = model.content_hash
+    model.density = Quantity(value=[5.0, 6.0], units="kg m^-3")
+    assert model.content_hash != reference
+    model.density = Quantity(value=[1.0, 2.0], units="kg m^-3")
+    assert model.content_hash == reference
+
+
+def test_hash_follows_copy_with_update(tabulated_density):
+    model = tabulated_density()
+    copied = model.model_copy(update={"density": Quantity(value=[9.0, 9.0], units="kg m^-3")})
+    assert copied.content_hash != model.content_hash
+
+
+def test_hash_is_cached_until_assignment(tabulated_density):
+    model = tabulated_density()
+    reference = model.content_hash
+    with patch.object(material_model, "_update_content_digest") as update_digest:
+        assert model.content_hash == reference
+        update_digest.assert_not_called()
+        model.independent_parameters[0].lower_limit = 0.0
+        assert model.content_hash != reference
+        update_digest.assert_called_once()
+
+
+def test_hash_follows_reassignment_after_in_place_change(tabulated_density):
+    model = tabulated_density()
+    reference = model.content_hash
+    model.density.value[0] = 10.0
+    model.density = model.density
+    assert model.content_hash != reference
+
+
+def test_hash_follows_nested_changes(tabulated_density):
+    model = tabulated_density()
+    model.interpolation_options = InterpolationOptions(algorithm_type="Linear")
+    reference = model.content_hash
+    model.interpolation_options.normalized = False
+    assert model.content_hash != reference
+    reference = model.content_hash
+    model.independent_parameters[0].values = Quantity(value=[20.0, 500.0], units="C")
+    assert model.content_hash != reference
+    reference = model.content_hash
+    model.independent_parameters.append(
+        IndependentParameter(name="Pressure", values=Quantity(value=[1.0, 2.0], units="Pa"))
+    )
+    assert model.content_hash != reference
+    reference = model.content_hash
+    model.independent_parameters[1] = IndependentParameter(
+        name="Pressure", values=Quantity(value=[1.0, 3.0], units="Pa")
+    )
+    assert model.content_hash != reference
+
+
+def test_hash_follows_tabular_quantity_changes():
+    model = Density(
+        density=TabularQuantity(
+            values=Quantity(value=[1.0, 2.0], units="kg m^-3"),
+            independent_parameters=[
+                IndependentParameter(name="Temperature", values=Quantity([20.0, 40.0], "C"))
+            ],
+        )
+    )
+    reference = model.content_hash
+    model.density.independent_parameters[0].values = Quantity([20.0, 80.0], "C")
+    assert model.content_hash != reference
+    reference = model.content_hash
+    model.density.values = Quantity(value=[1.0, 5.0], units="kg m^-3")
+    assert model.content_hash != reference
+
+
+def test_material_hash_ignores_name_and_model_order(tabulated_density, elasticity_model):
+    elasticity = elasticity_model()
+    first = Material(name="Steel", material_id=1, models=[tabulated_density(), elasticity])
+    second = Material(name="Steel variant", material_id=2, models=[elasticity, tabulated_density()])
+    third = Material(name="Steel", material_id=1, models=[tabulated_density()])
+    assert first.content_hash == second.content_hash
+    assert first.content_hash != third.content_hash
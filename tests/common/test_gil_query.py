@@ -0,0 +1,61 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from ansys.materials.manager.models import Density
+from ansys.materials.manager.models._common import material_model
+
+
+@pytest.fixture
+def dpf():
+    dpf = MagicMock()
+    with (
+        patch.object(material_model, "_get_dpf", return_value=dpf),
+        patch.object(material_model, "_has_minimum_271", return_value=True),
+    ):
+        yield dpf
+
+
+def test_create_vector_field(dpf):
+    field = material_model._create_vector_field([[1, 2], [3, 4], [5, 6]], server="server")
+    dpf.fields_factory.create_vector_field.assert_called_once_with(
+        num_entities=3, num_comp=2, server="server"
+    )
+    assert field is dpf.fields_factory.create_vector_field.return_value
+    assert field.data.dtype == np.float64
+    assert field.data.flags["C_CONTIGUOUS"]
+    np.testing.assert_array_equal(field.data, [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+    np.testing.assert_array_equal(field.scoping.ids, [0, 1, 2])
+
+
+def test_query_with_gil_single_component(dpf, density_model):
+    evaluation = dpf.Operator.return_value.outputs.evaluation.get_data.return_value
+    evaluation.data = np.array([7850.0, 7825.0, 7800.0])
+    model = density_model((7850.0, 7800.0), temperatures=(20.0, 100.0))
+    with patch.object(Density, "_build_gil_interpolator"):
+        result = model.query([20.0, 60.0, 100.0])
+    assert result.shape == (3, 1)
+    np.testing.assert_array_equal(result[:, 0], [7850.0, 7825.0, 7800.0])
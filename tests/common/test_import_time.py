@@ -0,0 +1,56 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import subprocess
+import sys
+
+import pytest
+
+# Budget for the time spent executing the modules of this package on import, excluding
+# the time spent importing third party packages.
+IMPORT_TIME_BUDGET_S = 1.0
+
+
+@pytest.fixture(scope="module")
+def import_result() -> subprocess.CompletedProcess:
+    code = "import ansys.materials.manager; import sys; print('ansys.dpf.core' in sys.modules)"
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_import_does_not_load_dpf(import_result):
+    assert import_result.stdout.strip() == "False"
+
+
+def test_import_time_budget(import_result):
+    self_time_us = 0
+    for line in import_result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_time, _, module = line[len("import time:") :].split("|")
+        if module.strip().startswith("ansys.materials.manager"):
+            self_time_us += int(self_time)
+    assert self_time_us / 1e6 < IMPORT_TIME_BUDGET_S
@@ -0,0 +1,96 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pickle
+
+import pytest
+
+from ansys.materials.manager.models import Material
+from ansys.materials.manager.models.material import ModelsView
+
+
+def test_models_view_is_read_only_and_live(density_model, elasticity_model):
+    density = density_model()
+    material = Material(name="Steel", models=[density])
+    models = material.models
+    assert isinstance(models, ModelsView)
+    assert models == [density]
+    assert not hasattr(models, "append")
+    elasticity = elasticity_model()
+    material.append_models(elasticity)
+    assert list(models) == [density, elasticity]
+    assert models[-1] is elasticity
+    assert len(models) == 2
+
+
+def test_get_model_by_name_ignores_case(density_model, elasticity_model):
+    material = Material(name="Steel", models=[density_model(), elasticity_model()])
+    assert material.get_model_by_name("density") is material.models[0]
+    assert material.get_model_by_name("ELASTICITY") is material.models[1]
+    assert material.get_model_by_name("Viscosity") is None
+
+
+def test_append_repeated_model_is_rejected_without_change(density_model, elasticity_model):
+    material = Material(name="Steel", models=[density_model()])
+    with pytest.raises(ValueError, match="repeated: \\['Density'\\]"):
+        material.append_models([elasticity_model(), density_model()])
+    assert len(material.models) == 1
+    with pytest.raises(ValueError, match="repeated"):
+        Material(name="Steel", models=[elasticity_model(), elasticity_model()])
+
+
+def test_remove_model_by_name_updates_index(density_model, elasticity_model):
+    material = Material(name="Steel", models=[density_model(), elasticity_model()])
+    material.remove_model_by_name("density")
+    assert material.get_model_by_name("Density") is None
+    material.append_models(density_model())
+    assert material.get_model_by_name("Density") is material.models[-1]
+
+
+def test_models_setter_and_pickle(density_model, elasticity_model):
+    material = Material(name="Steel", models=[density_model()])
+    material.models = [elasticity_model()]
+    assert material.get_model_by_name("Density") is None
+    restored = pickle.loads(pickle.dumps(material))
+    assert restored.get_model_by_name("elasticity") is restored.models[0]
+    restored.append_models(density_model())
+    assert len(restored.models) == 2
+
+
+def test_models_assigned_from_another_material(density_model, elasticity_model):
+    source = Material(name="Steel", models=[density_model(), elasticity_model()])
+    material = Material(name="Copy", models=[density_model()])
+    models = material.models
+    material.models = source.models
+    assert material.models == source.models
+    assert models == source.models
+    source_models = source.models
+    source.remove_model_by_name("density")
+    assert len(source_models) == 1
+    assert len(material.models) == 2
+    assert material.get_model_by_name("Density") is not None
+    material.models = material.models
+    assert len(material.models) == 2
+    material.models = (material.models[1],)
+    assert material.get_model_by_name("Density") is None
+    with pytest.raises(TypeError, match="must be a sequence"):
+        material.models = density_model()
@@ -0,0 +1,182 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from ansys.units import Quantity
+import numpy as np
+import pytest
+
+from ansys.materials.manager.models import (
+    ElasticityIsotropic,
+    IndependentParameter,
+    InterpolationOptions,
+)
+from ansys.materials.manager.models._common.common import (
+    Interpolator,
+    NumpyInterpolationAlgorithms,
+)
+from ansys.materials.manager.models._common.numpy_interpolator import (
+    NumpyInterpolator,
+    _circumcircles,
+    _delaunay_2d,
+)
+
+
+@pytest.fixture
+def volume_fraction_elasticity(elasticity_model):
+    """Factory fixture for an elasticity model tabulated over the volume fraction."""
+
+    def _factory(**kwargs) -> ElasticityIsotropic:
+        kwargs.setdefault(
+            "independent_parameters",
+            [IndependentParameter(name="Volume Fraction", values=Quantity([0.2, 0.3, 0.5], ""))],
+        )
+        return elasticity_model(
+            (1.0e9, 2.0e9, 4.0e9),
+            (0.3, 0.28, 0.25),
+            interpolator=Interpolator.NUMPY_INTERPOLATOR,
+            **kwargs,
+        )
+
+    return _factory
+
+
+def test_numpy_query_linear_elastic(volume_fraction_elasticity):
+    elasticity = volume_fraction_elasticity(
+        interpolation_options=InterpolationOptions(
+            algorithm_type="Linear Multivariate", normalized=False, cached=True
+        )
+    )
+    results = elasticity.query([0.25, 0.28, 0.4, 0.5])
+    expected_results = [
+        [1.50e09, 2.90e-01],
+        [1.80e09, 2.84e-01],
+        [3.00e09, 2.65e-01],
+        [4.00e09, 2.50e-01],
+    ]
+    assert np.allclose(results, expected_results)
+
+
+def test_numpy_query_clamps_to_bounding_box(volume_fraction_elasticity):
+    elasticity = volume_fraction_elasticity()
+    results = elasticity.query([0.0, 1.0])
+    assert np.allclose(results, [[1.0e09, 0.3], [4.0e09, 0.25]])
+
+
+def test_numpy_query_nearest_neighbor(volume_fraction_elasticity):
+    elasticity = volume_fraction_elasticity(
+        interpolation_options=InterpolationOptions(algorithm_type="Nearest Neighbor")
+    )
+    results = elasticity.query([0.26, 0.1, 0.9])
+    assert np.allclose(results, [[2.0e09, 0.28], [1.0e09, 0.3], [4.0e09, 0.25]])
+
+
+def test_numpy_query_ignores_constant_independent_parameter(volume_fraction_elasticity):
+    elasticity = volume_fraction_elasticity(
+        independent_parameters=[
+            IndependentParameter(name="Volume Fraction", values=Quantity([0.2, 0.3, 0.5], "")),
+            IndependentParameter(name="Temperature", values=Quantity([22.0, 22.0, 22.0], "C")),
+        ]
+    )
+    results = elasticity.query([[0.25, 22.0], [0.4, 50.0]])
+    assert np.allclose(results, [[1.5e09, 0.29], [3.0e09, 0.265]])
+
+
+def test_numpy_query_unsupported_algorithm(volume_fraction_elasticity):
+    elasticity = volume_fraction_elasticity(
+        interpolation_options=InterpolationOptions(algorithm_type="Radial Basis")
+    )
+    with pytest.raises(ValueError, match="'Radial Basis' is not supported"):
+        elasticity.query([0.25])
+
+
+def test_numpy_query_no_interpolation_options_algorithm(volume_fraction_elasticity):
+    elasticity = volume_fraction_elasticity(interpolation_options=InterpolationOptions())
+    with pytest.raises(
+        ValueError, match="Querying a material model with no interpolation options algorithm."
+    ):
+        elasticity.query([0.25])
+
+
+def test_multilinear_on_rectilinear_grid():
+    x, y = np.meshgrid([0.0, 1.0, 3.0], [10.0, 20.0], indexing="ij")
+    values = 2.0 * x + 0.5 * y + x * y
+    interpolator = NumpyInterpolator(np.column_stack([x.ravel(), y.ravel()]), values.ravel())
+    assert interpolator.algorithm == NumpyInterpolationAlgorithms.MULTILINEAR
+    points = np.array([[0.5, 15.0], [2.0, 12.0], [3.0, 20.0]])
+    expected = 2.0 * points[:, 0] + 0.5 * points[:, 1] + points[:, 0] * points[:, 1]
+    assert np.allclose(interpolator.evaluate(points)[:, 0], expected)
+
+
+def test_linear_triangulation_of_scattered_data():
+    rng = np.random.default_rng(0)
+    points = rng.random((50, 2))
+    values = np.column_stack([3.0 * points[:, 0] - points[:, 1], points[:, 1] + 1.0])
+    interpolator = NumpyInterpolator(points, values)
+    assert interpolator.algorithm == NumpyInterpolationAlgorithms.LINEAR_TRIANGULATION
+
+    # linear functions are reproduced exactly inside the convex hull
+    queries = points[:10] * 0.5 + points[10:20] * 0.5
+    expected = np.column_stack([3.0 * queries[:, 0] - queries[:, 1], queries[:, 1] + 1.0])
+    assert np.allclose(interpolator.evaluate(queries), expected)
+
+    # points outside the data are projected back onto it
+    outside = interpolator.evaluate([[5.0, 5.0], [-5.0, 0.5]])
+    assert np.all(np.isfinite(outside))
+    assert np.all(outside.min(axis=0) >= values.min(axis=0) - 1e-12)
+    assert np.all(outside.max(axis=0) <= values.max(axis=0) + 1e-12)
+
+
+def test_delaunay_2d_empty_circumcircles():
+    rng = np.random.default_rng(1)
+    points = rng.random((500, 2))
+    simplices = _delaunay_2d(points)
+    assert np.array_equal(np.unique(simplices), np.arange(len(points)))
+
+    # no point lies strictly inside the circumcircle of a triangle
+    centers, radii = _circumcircles(points, simplices)
+    distances = ((points[None, :, :] - centers[:, None, :]) ** 2).sum(axis=-1)
+    assert np.all(distances >= radii[:, None] * (1.0 - 1e-9))
+
+
+def test_wrong_number_of_evaluation_values():
+    interpolator = NumpyInterpolator([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0]], [1.0, 2.0, 3.0])
+    with pytest.raises(ValueError, match="Expected evaluation points with 2"):
+        interpolator.evaluate([0.5, 0.5, 0.5])
+
+
+def test_numpy_query_reuses_cached_interpolator(volume_fraction_elasticity):
+    elasticity = volume_fraction_elasticity()
+    elasticity.query([0.25])
+    interpolator = elasticity._interpolator_cache[2]
+    elasticity.query([0.4, 0.5])
+    assert elasticity._interpolator_cache[2] is interpolator
+
+
+def test_numpy_query_cache_invalidated_on_change(volume_fraction_elasticity):
+    elasticity = volume_fraction_elasticity()
+    assert np.allclose(elasticity.query([0.25]), [[1.5e09, 0.29]])
+    interpolator = elasticity._interpolator_cache[2]
+    elasticity.youngs_modulus = Quantity(value=[2.0e09, 4.0e09, 8.0e09], units="Pa")
+    assert np.allclose(elasticity.query([0.25]), [[3.0e09, 0.29]])
+    assert elasticity._interpolator_cache[2] is not interpolator
+    elasticity.interpolation_options = InterpolationOptions(algorithm_type="Nearest Neighbor")
+    assert np.allclose(elasticity.query([0.26]), [[4.0e09, 0.28]])
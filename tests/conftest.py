@@ -0,0 +1,97 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Shared factory fixtures for building material models and materials."""
+
+from typing import Sequence
+
+from ansys.units import Quantity
+import pytest
+
+from ansys.materials.manager.models import (
+    Density,
+    ElasticityIsotropic,
+    IndependentParameter,
+    Material,
+)
+
+
+@pytest.fixture
+def temperature_parameters():
+    """Factory fixture for a temperature independent parameter in degrees Celsius."""
+
+    def _factory(values: Sequence[float]) -> list[IndependentParameter]:
+        return [
+            IndependentParameter(name="Temperature", values=Quantity(value=list(values), units="C"))
+        ]
+
+    return _factory
+
+
+@pytest.fixture
+def density_model(temperature_parameters):
+    """Factory fixture for density models, optionally depending on temperature."""
+
+    def _factory(
+        values: Sequence[float] = (7850.0,),
+        units: str = "kg m^-3",
+        temperatures: Sequence[float] | None = None,
+        **kwargs,
+    ) -> Density:
+        if temperatures is not None:
+            kwargs["independent_parameters"] = temperature_parameters(temperatures)
+        return Density(density=Quantity(value=list(values), units=units), **kwargs)
+
+    return _factory
+
+
+@pytest.fixture
+def elasticity_model(temperature_parameters):
+    """Factory fixture for isotropic elasticity models, optionally depending on temperature."""
+
+    def _factory(
+        youngs_modulus: Sequence[float] = (2.0e11,),
+        poissons_ratio: Sequence[float] | None = None,
+        temperatures: Sequence[float] | None = None,
+        **kwargs,
+    ) -> ElasticityIsotropic:
+        if poissons_ratio is None:
+            poissons_ratio = [0.3] * len(youngs_modulus)
+        if temperatures is not None:
+            kwargs["independent_parameters"] = temperature_parameters(temperatures)
+        return ElasticityIsotropic(
+            youngs_modulus=Quantity(value=list(youngs_modulus), units="Pa"),
+            poissons_ratio=Quantity(value=list(poissons_ratio), units=""),
+            **kwargs,
+        )
+
+    return _factory
+
+
+@pytest.fixture
+def density_material(density_model):
+    """Factory fixture for a material with a single constant density model."""
+
+    def _factory(name: str, density: float = 7850.0, **kwargs) -> Material:
+        return Material(name=name, models=[density_model([density])], **kwargs)
+
+    return _factory
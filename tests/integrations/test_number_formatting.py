@@ -0,0 +1,79 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from ansys.units import Quantity
+import numpy as np
+import pytest
+
+from ansys.materials.manager.integrations import MapdlWriter, MatmlReader, MatmlWriter
+from ansys.materials.manager.integrations._common import format_number_list, format_numbers
+from ansys.materials.manager.models import Density, IndependentParameter, Material
+
+
+def test_default_format_round_trips():
+    values = np.random.default_rng(0).normal(scale=1e6, size=1000)
+    texts = format_number_list(values)
+    assert np.array_equal(np.array([float(text) for text in texts]), values)
+
+
+def test_default_format_matches_str():
+    assert format_numbers([1.0, 0.1, 1e-20, 1000000, 2]) == "1.0, 0.1, 1e-20, 1000000, 2"
+    assert format_numbers(np.array([1.5, 2.0])) == "1.5, 2.0"
+    assert format_numbers([np.float64(0.3), np.int64(4)]) == "0.3, 4"
+    assert format_numbers(7.25) == "7.25"
+
+
+def test_precision():
+    values = [3.141592653589793, 2718281.828459045, 1000000]
+    assert format_numbers(values, 3) == "3.14, 2.72e+06, 1000000"
+    assert [float(text) for text in format_number_list(values, 17)] == values
+
+
+def test_separator():
+    assert format_numbers([1.0, 2.0], separator=",") == "1.0,2.0"
+
+
+@pytest.fixture
+def material():
+    density = Density(
+        density=Quantity(value=[1.23456789, 2.3456789], units="kg m^-3"),
+        independent_parameters=[
+            IndependentParameter(
+                name="Temperature", values=Quantity(value=[20.123456, 40.0], units="C")
+            )
+        ],
+    )
+    return Material(name="Material 1", material_id=1, models=[density])
+
+
+def test_mapdl_writer_precision(material):
+    commands = MapdlWriter(materials=[material], precision=3).write()[0]
+    assert "MPTEMP,1,20.1,40,,,," in commands
+    assert "MPDATA,DENS,1,1,1.23,2.35,,,," in commands
+
+
+def test_matml_writer_precision(material, tmp_path):
+    path = tmp_path / "materials.xml"
+    MatmlWriter([material], precision=3).write(path)
+    density = MatmlReader(path).convert_matml_materials()["Material 1"].models[0]
+    assert density.density.value.tolist() == [1.23, 2.35]
+    assert density.independent_parameters[0].values.value.tolist() == [20.1, 40.0]
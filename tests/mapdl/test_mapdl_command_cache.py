@@ -0,0 +1,99 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import patch
+
+from ansys.units import Quantity
+import pytest
+
+from ansys.materials.manager import MaterialManager
+from ansys.materials.manager.integrations import MapdlCommandCache, MapdlWriter
+from ansys.materials.manager.models import InterpolationOptions, Material
+
+
+def test_cached_commands_are_reused(density_material):
+    cache = MapdlCommandCache()
+    materials = [
+        density_material("Material 1", 1.34, material_id=1),
+        density_material("Material 2", 1.34, material_id=2),
+    ]
+    expected = MapdlWriter(materials).write()
+    assert MapdlWriter(materials, cache=cache).write() == expected
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+    with patch.object(MapdlWriter, "visit_standard") as visit_standard:
+        assert MapdlWriter(materials, cache=cache).write() == expected
+    visit_standard.assert_not_called()
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_cache_key_depends_on_content_and_precision(density_material):
+    cache = MapdlCommandCache()
+    material = density_material("Material 1", 1.0 / 3.0, material_id=1)
+    MapdlWriter([material], cache=cache).write()
+    rounded = MapdlWriter([material], precision=3, cache=cache).write()
+    assert "0.333," in rounded[0]
+    material.models[0].density = Quantity(value=[2.0], units="kg m^-3")
+    assert "MP,DENS,1,2.0," in MapdlWriter([material], cache=cache).write()[0]
+    assert len(cache) == 3
+
+
+def test_cache_drops_least_recently_used_entries():
+    cache = MapdlCommandCache(max_entries=2)
+    for key in "abc":
+        cache.put(key, key)
+    assert cache.get("a") is None
+    assert cache.get("b") == "b"
+    cache.put("d", "d")
+    assert cache.get("c") is None
+    assert len(cache) == 2
+    cache.clear()
+    assert len(cache) == 0
+    with pytest.raises(ValueError, match="positive"):
+        MapdlCommandCache(max_entries=-1)
+
+
+def test_manager_write_to_mapdl_with_cache(density_material):
+    manager = MaterialManager()
+    manager.add_materials([density_material("Material 1", 1.34, material_id=1)])
+    cache = MapdlCommandCache()
+    first = manager.write_to_mapdl(cache=cache)
+    assert manager.write_to_mapdl(material_ids=[5], cache=cache) == [first[0].replace(",1,", ",5,")]
+    assert cache.hits == 1
+
+
+@pytest.mark.parametrize("cache", [True, MapdlCommandCache()])
+def test_nested_edit_is_written_again(cache, density_model):
+    density = density_model(
+        (1.34, 1.2),
+        temperatures=(20.0, 100.0),
+        interpolation_options=InterpolationOptions(algorithm_type="Linear Multivariate"),
+    )
+    material = Material(name="Material 1", material_id=1, models=[density])
+    first = MapdlWriter([material], cache=cache).write()[0]
+    assert "MPTEMP,1,20.0,100.0," in first
+    assert "TBIN,NORM,,ON" in first
+    density.independent_parameters[0].values = Quantity(value=[20.0, 500.0], units="C")
+    density.interpolation_options.normalized = False
+    rewritten = MapdlWriter([material], cache=cache).write()[0]
+    assert rewritten == MapdlWriter([material]).write()[0]
+    assert "MPTEMP,1,20.0,500.0," in rewritten
+    assert "TBIN,NORM,,OFF" in rewritten
@@ -0,0 +1,75 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from ansys.units import Quantity
+import pytest
+
+from ansys.materials.manager.integrations import MapdlWriter
+from ansys.materials.manager.models import IndependentParameter, Material
+
+
+@pytest.fixture
+def unknown_parameter_material(density_model):
+    """Factory fixture for a material whose density depends on an unknown parameter."""
+
+    def _factory(name: str, material_id: int) -> Material:
+        density = density_model(
+            (1.34, 1.5),
+            independent_parameters=[
+                IndependentParameter(
+                    name="Nonexistent", values=Quantity(value=[0.0, 1.0], units="")
+                )
+            ],
+        )
+        return Material(name=name, material_id=material_id, models=[density])
+
+    return _factory
+
+
+def test_material_id_is_bound_when_written(unknown_parameter_material):
+    writer = MapdlWriter(
+        materials=[
+            unknown_parameter_material("Material 1", 1),
+            unknown_parameter_material("Material 2", 2),
+        ]
+    )
+    first, second = writer.write()
+    assert "Nonexistent = 'UF01' ! Nonexistent" in first
+    assert "None" not in first.replace("Nonexistent", "")
+    assert "TB,DENS,1,,," in first
+    assert "TB,DENS,2,,," in second
+
+
+def test_rewrite_with_other_material_ids(unknown_parameter_material):
+    writer = MapdlWriter(
+        materials=[
+            unknown_parameter_material("Material 1", 1),
+            unknown_parameter_material("Material 2", 2),
+        ]
+    )
+    default = writer.write()
+    remapped = writer.write(material_ids=[7, 8])
+    assert remapped == [
+        default[0].replace("TB,DENS,1,", "TB,DENS,7,"),
+        default[1].replace("TB,DENS,2,", "TB,DENS,8,"),
+    ]
+    assert writer.get_material_template("Material 1") is writer.get_material_template("Material 1")
@@ -0,0 +1,78 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import io
+
+import pytest
+
+from ansys.materials.manager import MaterialManager
+from ansys.materials.manager.integrations import MapdlWriter
+from ansys.materials.manager.models import Material
+
+
+@pytest.fixture
+def constant_and_table_materials(density_material, density_model):
+    """Factory fixture for a constant and a temperature-dependent density material."""
+
+    def _factory() -> list[Material]:
+        return [
+            density_material("Constant", 1.34, material_id=1),
+            Material(
+                name="Table",
+                material_id=2,
+                models=[density_model(range(1, 14), temperatures=range(13))],
+            ),
+        ]
+
+    return _factory
+
+
+def test_streaming_write_matches_default_write(constant_and_table_materials):
+    expected = MapdlWriter(constant_and_table_materials()).write(
+        reference_temperatures=[20.0, 25.0]
+    )
+    writer = MapdlWriter(constant_and_table_materials(), stream=True)
+    assert all(models == [] for models in writer._material_repr.values())
+    materials = writer.iter_materials(reference_temperatures=[20.0, 25.0])
+    assert next(materials) == expected[0]
+    assert writer._material_repr["Table"] == []
+    assert list(materials) == expected[1:]
+    assert all(models == [] for models in writer._material_repr.values())
+
+
+def test_write_to_stream(constant_and_table_materials):
+    expected = MapdlWriter(constant_and_table_materials()).write(material_ids=[3, 4])
+    stream = io.StringIO()
+    MapdlWriter(constant_and_table_materials(), stream=True).write_to_stream(
+        stream, material_ids=[3, 4]
+    )
+    assert stream.getvalue() == "".join(expected)
+    assert "MPTEMP,7," in stream.getvalue()
+    assert "MPDATA,DENS,4,13,13,,,,, !" in stream.getvalue()
+
+
+def test_manager_write_to_mapdl_file(tmp_path, constant_and_table_materials):
+    manager = MaterialManager()
+    manager.add_materials(constant_and_table_materials())
+    path = tmp_path / "materials.inp"
+    manager.write_to_mapdl_file(path)
+    assert path.read_text() == "".join(manager.write_to_mapdl())
@@ -0,0 +1,76 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from ansys.units import Quantity
+
+from ansys.materials.manager.integrations.mapdl._mapdl_commands_parser import (
+    write_table_dep_values,
+    write_table_value_per_temperature,
+    write_temperature_table_values,
+)
+from ansys.materials.manager.models import IndependentParameter
+
+
+def test_table_dep_values_rows():
+    table = write_table_dep_values(material_id=1, label="ELASTIC", dependent_values=range(1, 9))
+    assert table == "TB,ELASTIC,1,,,\nTBDATA,1,1,2,3,4,5,6\nTBDATA,7,7,8,,,,\n"
+
+
+def test_temperature_table_rows():
+    temperature = IndependentParameter(
+        name="Temperature", values=Quantity(value=list(range(7)), units="C")
+    )
+    table = write_temperature_table_values(
+        labels=["EX", "NUXY"],
+        dependent_parameters=[list(range(10, 17)), [0.3] * 7],
+        dependent_parameters_unit=["Pa", ""],
+        material_id=2,
+        temperature_parameter=temperature,
+    )
+    assert table.splitlines() == [
+        "MPTEMP,1,0,1,2,3,4,5",
+        "MPTEMP,7,6,,,,,",
+        "MPDATA,EX,2,1,10,11,12,13,14,15 ! Pa",
+        "MPDATA,NUXY,2,1,0.3,0.3,0.3,0.3,0.3,0.3 ! ",
+        "MPDATA,EX,2,7,16,,,,, ! Pa",
+        "MPDATA,NUXY,2,7,0.3,,,,, ! ",
+    ]
+
+
+def test_table_value_per_temperature_rows():
+    temperature = IndependentParameter(
+        name="Temperature", values=Quantity(value=[20.0, 80.0], units="C")
+    )
+    table = write_table_value_per_temperature(
+        label="HILL",
+        material_id=3,
+        dependent_parameters=[[i, i + 10] for i in range(1, 8)],
+        temperature_parameter=temperature,
+    )
+    assert table.splitlines()[2:] == [
+        "TBTEMP,20.0",
+        "TBDATA,1,1,2,3,4,5,6",
+        "TBDATA,7,7,,,,,",
+        "TBTEMP,80.0",
+        "TBDATA,1,11,12,13,14,15,16",
+        "TBDATA,7,17,,,,,",
+    ]
@@ -0,0 +1,73 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from ansys.materials.manager import MaterialManager
+from ansys.materials.manager.integrations import MapdlWriter
+from ansys.materials.manager.models import Material
+
+
+@pytest.fixture
+def numbered_materials(density_material):
+    """Factory fixture for materials with increasing ids and constant densities."""
+
+    def _factory(count: int) -> list[Material]:
+        return [
+            density_material(f"Material {i}", 1000.0 + i, material_id=i)
+            for i in range(1, count + 1)
+        ]
+
+    return _factory
+
+
+@pytest.mark.parametrize("chunk_size, calls", [(1, 5), (2, 3), (5, 1), (None, 1)])
+def test_write_in_chunks(chunk_size, calls, numbered_materials):
+    materials = numbered_materials(5)
+    material_strings = MapdlWriter(materials).write()
+    client = MagicMock()
+    MapdlWriter(materials).write(client, chunk_size=chunk_size)
+    client.prep7.assert_called_once()
+    assert client.input_strings.call_count == calls
+    blocks = [call.args[0] for call in client.input_strings.call_args_list]
+    assert "".join(blocks) == "".join(material_strings)
+
+
+def test_write_without_materials():
+    client = MagicMock()
+    MapdlWriter([]).write(client, chunk_size=None)
+    client.input_strings.assert_not_called()
+
+
+def test_write_invalid_chunk_size(numbered_materials):
+    with pytest.raises(ValueError, match="chunk_size"):
+        MapdlWriter(numbered_materials(1)).write(MagicMock(), chunk_size=0)
+
+
+def test_manager_write_to_mapdl_in_one_block(numbered_materials):
+    manager = MaterialManager()
+    manager.add_materials(numbered_materials(3))
+    client = MagicMock()
+    manager.write_to_mapdl(client, chunk_size=None)
+    client.input_strings.assert_called_once_with("".join(manager.write_to_mapdl()))
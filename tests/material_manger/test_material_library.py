@@ -0,0 +1,157 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pickle
+
+from ansys.units import Quantity
+import pytest
+
+from ansys.materials.manager import MaterialManager
+from ansys.materials.manager._material_library import MaterialLibrary
+from ansys.materials.manager.integrations import MapdlWriter
+from ansys.materials.manager.models import (
+    Density,
+    ElasticityIsotropic,
+    Material,
+)
+
+
+@pytest.fixture
+def library(density_model, elasticity_model):
+    return MaterialLibrary(
+        {
+            "Steel": Material(
+                name="Steel", material_id=1, guid="guid-steel", models=[density_model([7850.0])]
+            ),
+            "Stainless": Material(
+                name="Stainless",
+                material_id=2,
+                guid="guid-stainless",
+                models=[density_model([7.9], "g cm^-3"), elasticity_model()],
+            ),
+            "Aluminum": Material(
+                name="Aluminum",
+                material_id=3,
+                guid="guid-aluminum",
+                models=[density_model([2700.0])],
+            ),
+            "Water": Material(name="Water", material_id=3, models=[density_model([1000.0])]),
+        }
+    )
+
+
+def _names(materials):
+    return [material.name for material in materials]
+
+
+def test_library_behaves_as_a_dictionary(library):
+    assert len(library) == 4
+    assert "Steel" in library
+    assert list(library) == ["Steel", "Stainless", "Aluminum", "Water"]
+    del library["Water"]
+    assert "Water" not in library
+    assert _names(library.query(mat_id=3)) == ["Aluminum"]
+
+
+def test_query_by_id_guid_and_model(library):
+    assert _names(library.query(mat_id=3)) == ["Aluminum", "Water"]
+    assert library.get_by_guid("guid-stainless") is library["Stainless"]
+    assert library.get_by_guid("unknown") is None
+    assert _names(library.query(model=ElasticityIsotropic)) == ["Stainless"]
+    assert len(library.query()) == 4
+
+
+def test_query_by_range_in_si_units(library):
+    ranges = {(Density, "density"): (7000.0, 8000.0)}
+    assert _names(library.query(ranges=ranges)) == ["Stainless", "Steel"]
+    ranges = {(Density, "density"): (Quantity(value=2.0, units="g cm^-3"), None)}
+    assert _names(library.query(ranges=ranges)) == ["Aluminum", "Stainless", "Steel"]
+    ranges = {(Density, "density"): (None, 2700.0)}
+    assert _names(library.query(mat_id=3, ranges=ranges)) == ["Aluminum", "Water"]
+
+
+def test_variable_properties_are_not_range_indexed(library, density_model):
+    library["Oil"] = Material(
+        name="Oil",
+        models=[density_model([900.0, 880.0], temperatures=[20.0, 80.0])],
+    )
+    assert _names(library.query(ranges={(Density, "density"): (0.0, None)})) == [
+        "Aluminum",
+        "Stainless",
+        "Steel",
+        "Water",
+    ]
+    assert "Oil" in _names(library.query(model=Density))
+
+
+def test_indexes_follow_material_changes(library, elasticity_model):
+    steel = library["Steel"]
+    steel.mat_id = 10
+    steel.guid = "guid-new"
+    assert _names(library.query(mat_id=10)) == ["Steel"]
+    assert library.query(mat_id=1) == []
+    assert library.get_by_guid("guid-new") is steel
+    steel.append_models(elasticity_model())
+    assert _names(library.query(model=ElasticityIsotropic)) == ["Stainless", "Steel"]
+    steel.remove_model_by_name("Density")
+    assert "Steel" not in _names(library.query(ranges={(Density, "density"): (None, None)}))
+
+
+def test_reindex_after_in_place_change(library):
+    library["Water"].models[0].density.value[0] = 7500.0
+    ranges = {(Density, "density"): (7000.0, 7600.0)}
+    assert library.query(ranges=ranges) == []
+    library.reindex()
+    assert _names(library.query(ranges=ranges)) == ["Water"]
+
+
+def test_removed_material_is_not_reindexed(library):
+    water = library.pop("Water")
+    water.mat_id = 1
+    assert _names(library.query(mat_id=1)) == ["Steel"]
+
+
+def test_pickled_material_has_no_observers(library):
+    steel = pickle.loads(pickle.dumps(library["Steel"]))
+    steel.mat_id = 20
+    assert library.query(mat_id=20) == []
+
+
+def test_material_manager_query(density_model):
+    manager = MaterialManager()
+    manager.add_material(Material(name="Steel", material_id=1, models=[density_model([7850.0])]))
+    manager.add_material(Material(name="Aluminum", material_id=2, models=[density_model([2700.0])]))
+    assert isinstance(manager.materials, MaterialLibrary)
+    assert _names(manager.query(ranges={(Density, "density"): (7000, 8000)})) == ["Steel"]
+    manager.delete_material("Steel")
+    assert manager.query(mat_id=1) == []
+
+
+def test_visitor_material_id_lookup(density_model):
+    materials = [
+        Material(name="Steel", material_id=1, models=[density_model([7850.0])]),
+        Material(name="Aluminum", material_id=2, models=[density_model([2700.0])]),
+    ]
+    writer = MapdlWriter(materials)
+    assert writer.get_material_id("Aluminum") == 2
+    materials[0].mat_id = 5
+    assert writer.get_material_id("Steel") == 5
@@ -0,0 +1,114 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import logging
+
+import pytest
+
+from ansys.materials.manager import MaterialManager
+from ansys.materials.manager.models import Density
+
+
+@pytest.fixture
+def manager(density_material):
+    manager = MaterialManager()
+    manager.add_materials([density_material("Steel"), density_material("Aluminum", 2700.0)])
+    return manager
+
+
+def test_add_materials(manager, density_material):
+    summary = manager.add_materials(
+        [density_material("Copper", 8960.0), density_material("Water", 1000.0)]
+    )
+    assert summary.added == ["Copper", "Water"]
+    assert summary.replaced == summary.skipped == summary.renamed == []
+    assert summary.total_time >= 0.0
+    assert list(manager.materials) == ["Steel", "Aluminum", "Copper", "Water"]
+
+
+def test_add_materials_error_adds_nothing(manager, density_material):
+    with pytest.raises(ValueError, match="\\['Steel'\\]"):
+        manager.add_materials([density_material("Copper"), density_material("Steel")])
+    assert "Copper" not in manager.materials
+
+
+def test_add_materials_skip(manager, density_material):
+    steel = manager.materials["Steel"]
+    summary = manager.add_materials(
+        [density_material("Steel", 8000.0), density_material("Copper")], on_conflict="skip"
+    )
+    assert summary.skipped == ["Steel"]
+    assert summary.added == ["Copper"]
+    assert manager.materials["Steel"] is steel
+
+
+def test_add_materials_replace(manager, density_material):
+    steel = density_material("Steel", 8000.0)
+    summary = manager.add_materials([steel], on_conflict="replace")
+    assert summary.replaced == ["Steel"]
+    assert manager.materials["Steel"] is steel
+    assert [
+        material.name for material in manager.query(ranges={(Density, "density"): (8000, 8000)})
+    ] == ["Steel"]
+
+
+def test_add_materials_rename(manager, density_material):
+    summary = manager.add_materials(
+        [
+            density_material("Steel"),
+            density_material("Steel"),
+            density_material("Copper"),
+            density_material("Copper"),
+        ],
+        on_conflict="rename",
+    )
+    assert summary.added == ["Copper"]
+    assert summary.renamed == [
+        ("Steel", "Steel (1)"),
+        ("Steel", "Steel (2)"),
+        ("Copper", "Copper (1)"),
+    ]
+    assert manager.materials["Steel (2)"].name == "Steel (2)"
+    assert len(manager.materials) == 6
+
+
+def test_add_materials_invalid_policy(manager, density_material):
+    with pytest.raises(ValueError, match="on_conflict"):
+        manager.add_materials([density_material("Copper")], on_conflict="merge")
+
+
+def test_add_materials_logs_without_printing(manager, capsys, caplog, density_material):
+    with caplog.at_level(logging.INFO, logger="ansys.materials.manager.material_manager"):
+        manager.add_materials([density_material("Copper")])
+    assert capsys.readouterr().out == ""
+    assert "1 added, 0 replaced, 0 renamed, 0 skipped" in caplog.text
+
+
+def test_single_material_methods_log_without_printing(manager, capsys, caplog, density_material):
+    with caplog.at_level(logging.INFO, logger="ansys.materials.manager.material_manager"):
+        manager.add_material(density_material("Copper"))
+        manager.extend_material("Unknown", [])
+        manager.delete_material("Unknown")
+        assert manager.get_material("Unknown") is None
+    assert capsys.readouterr().out == ""
+    assert "Copper was added to the library" in caplog.text
+    assert caplog.text.count("Unknown was not found") == 3
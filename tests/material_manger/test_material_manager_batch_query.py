@@ -0,0 +1,106 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import patch
+
+from ansys.units import Quantity
+import numpy as np
+import pytest
+
+from ansys.materials.manager import MaterialManager
+from ansys.materials.manager.models import Density, Material
+from ansys.materials.manager.models._common import material_model
+from ansys.materials.manager.models._common.numpy_interpolator import NumpyInterpolator
+
+
+@pytest.fixture
+def material_manager(density_model, elasticity_model):
+    def temperature_elasticity(youngs_modulus, temperatures):
+        return elasticity_model(youngs_modulus, temperatures=temperatures, interpolator="numpy")
+
+    material_manager = MaterialManager()
+    for name, elasticity in [
+        ("Steel", temperature_elasticity([2.0e11, 1.8e11], [20.0, 220.0])),
+        ("Iron", temperature_elasticity([1.0e11, 0.8e11], [20.0, 220.0])),
+        ("Alloy", temperature_elasticity([1.0e11, 0.8e11, 0.5e11], [0.0, 100.0, 300.0])),
+        ("Constant", elasticity_model([7.0e10], [0.33])),
+    ]:
+        material_manager.add_material(Material(name=name, models=[elasticity]))
+    material_manager.add_material(Material(name="Water", models=[density_model([1000.0])]))
+    return material_manager
+
+
+def test_batch_query_youngs_modulus(material_manager):
+    results = material_manager.batch_query(
+        "Elasticity", [20.0, 120.0, 220.0], parameter="youngs_modulus"
+    )
+    expected = [
+        [2.0e11, 1.9e11, 1.8e11],
+        [1.0e11, 0.9e11, 0.8e11],
+        [0.96e11, 0.77e11, 0.62e11],
+        [7.0e10, 7.0e10, 7.0e10],
+    ]
+    assert results.shape == (5, 3)
+    assert np.allclose(results[:4], expected)
+    assert np.all(np.isnan(results[4]))
+
+
+def test_batch_query_selected_materials(material_manager):
+    results = material_manager.batch_query(
+        "Elasticity", [120.0], parameter="poissons_ratio", material_names=["Iron", "Unknown"]
+    )
+    assert np.allclose(results[0], [0.3])
+    assert np.all(np.isnan(results[1]))
+
+
+def test_batch_query_requires_parameter(material_manager):
+    with pytest.raises(ValueError, match="has several dependent parameters"):
+        material_manager.batch_query("Elasticity", [120.0])
+    results = material_manager.batch_query("Density", [120.0], material_names=["Water"])
+    assert np.allclose(results, [[1000.0]])
+
+
+def test_batch_query_gil_single_dependent_parameter(density_model):
+    density = density_model([7850.0, 7800.0], temperatures=[20.0, 100.0])
+    material_manager = MaterialManager()
+    material_manager.add_material(Material(name="Steel", models=[density]))
+    # a single-component DPF field returns 1-D data
+    with patch.object(Density, "_query_with_gil", return_value=np.array([7850.0, 7800.0])) as query:
+        result = material_manager.batch_query("Density", [20.0, 100.0])
+    query.assert_called_once()
+    np.testing.assert_array_equal(result, [[7850.0, 7800.0]])
+
+
+def test_batch_query_reuses_interpolators(material_manager):
+    def query():
+        return material_manager.batch_query("Elasticity", [20.0, 120.0], parameter="youngs_modulus")
+
+    first = query()
+    with patch.object(material_model, "NumpyInterpolator", wraps=NumpyInterpolator) as build:
+        np.testing.assert_array_equal(query(), first)
+        build.assert_not_called()
+
+        steel = material_manager.materials["Steel"].get_model_by_name("Elasticity")
+        steel.youngs_modulus = Quantity(value=[3.0e11, 2.8e11], units="Pa")
+        assert np.allclose(query()[0], [3.0e11, 2.9e11])
+        # only the group of the changed model is built again
+        build.assert_called_once()
@@ -0,0 +1,61 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from ansys.units import Quantity
+
+from ansys.materials.manager import MaterialManager
+from ansys.materials.manager.models import Material
+
+
+def test_intern_models_shares_identical_models(density_model):
+    manager = MaterialManager(intern_models=True)
+    manager.add_material(Material(name="Steel A", models=[density_model([7850.0])]))
+    manager.add_material(Material(name="Steel B", models=[density_model([7850.0])]))
+    manager.add_material(Material(name="Aluminum", models=[density_model([2700.0])]))
+    steel_a = manager.materials["Steel A"].models[0]
+    assert manager.materials["Steel B"].models[0] is steel_a
+    assert manager.materials["Aluminum"].models[0] is not steel_a
+
+
+def test_intern_models_on_extend(density_model):
+    manager = MaterialManager(intern_models=True)
+    manager.add_material(Material(name="Steel A", models=[density_model([7850.0])]))
+    manager.add_material(Material(name="Steel B"))
+    manager.extend_material("Steel B", [density_model([7850.0])])
+    assert manager.materials["Steel B"].models[0] is manager.materials["Steel A"].models[0]
+
+
+def test_intern_models_skips_modified_models(density_model):
+    manager = MaterialManager(intern_models=True)
+    manager.add_material(Material(name="Steel A", models=[density_model([7850.0])]))
+    shared = manager.materials["Steel A"].models[0]
+    shared.density = Quantity(value=[8000.0], units="kg m^-3")
+    manager.add_material(Material(name="Steel B", models=[density_model([7850.0])]))
+    assert manager.materials["Steel B"].models[0] is not shared
+    assert manager.materials["Steel B"].models[0].density.value.tolist() == [7850.0]
+
+
+def test_models_are_not_interned_by_default(density_model):
+    manager = MaterialManager()
+    manager.add_material(Material(name="Steel A", models=[density_model([7850.0])]))
+    manager.add_material(Material(name="Steel B", models=[density_model([7850.0])]))
+    assert manager.materials["Steel B"].models[0] is not manager.materials["Steel A"].models[0]
@@ -0,0 +1,116 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+
+from ansys.units import Quantity
+import pytest
+
+from ansys.materials.manager import MaterialManager
+from ansys.materials.manager.models import Density, SpecificHeat
+
+
+@pytest.fixture
+def manager(density_material):
+    manager = MaterialManager(thread_safe=True)
+    manager.add_materials([density_material("Steel"), density_material("Aluminum", 2700.0)])
+    return manager
+
+
+def test_snapshots_are_read_only(manager, density_material):
+    assert manager.thread_safe
+    assert manager.materials.frozen
+    with pytest.raises(TypeError, match="read-only"):
+        manager.materials["Copper"] = density_material("Copper")
+    with pytest.raises(TypeError, match="read-only"):
+        del manager.materials["Steel"]
+
+
+def test_writes_publish_a_new_snapshot(manager, density_material):
+    snapshot = manager.materials
+    manager.add_material(density_material("Copper", 8960.0))
+    manager.delete_material("Steel")
+    assert list(snapshot) == ["Steel", "Aluminum"]
+    assert list(manager.materials) == ["Aluminum", "Copper"]
+    assert [material.name for material in manager.query(model=Density)] == ["Aluminum", "Copper"]
+    assert snapshot.query(model=Density, ranges={(Density, "density"): (8000, None)}) == []
+
+
+def test_failed_write_publishes_nothing(manager, density_material):
+    snapshot = manager.materials
+    with pytest.raises(ValueError):
+        manager.add_materials([density_material("Copper"), density_material("Steel")])
+    assert manager.materials is snapshot
+
+
+def test_extend_material_replaces_the_material(manager):
+    snapshot = manager.materials
+    steel = snapshot["Steel"]
+    manager.extend_material(
+        "Steel", [SpecificHeat(specific_heat=Quantity(value=[434.0], units="J kg^-1 K^-1"))]
+    )
+    assert len(steel.models) == 1
+    assert len(manager.materials["Steel"].models) == 2
+    assert manager.query(model=SpecificHeat) == [manager.materials["Steel"]]
+    assert snapshot.query(model=SpecificHeat) == []
+
+
+@pytest.mark.parametrize("thread_safe", [False, True])
+def test_replace_materials(thread_safe, density_material):
+    manager = MaterialManager(thread_safe=thread_safe)
+    manager.add_materials([density_material("Steel")])
+    summary = manager.replace_materials(
+        [density_material("Copper"), density_material("Water", 1000.0)]
+    )
+    assert summary.added == ["Copper", "Water"]
+    assert list(manager.materials) == ["Copper", "Water"]
+    with pytest.raises(ValueError):
+        manager.replace_materials([density_material("Gold"), density_material("Gold")])
+    assert list(manager.materials) == ["Copper", "Water"]
+
+
+def test_readers_see_consistent_versions(manager, density_material):
+    manager.replace_materials([density_material("0-0")])
+    versions = [[density_material(f"{i}-{j}", 1000.0 + j) for j in range(20)] for i in range(50)]
+    errors = []
+    done = threading.Event()
+
+    def read():
+        while not done.is_set():
+            snapshot = manager.materials
+            names = list(snapshot)
+            prefixes = {name.split("-")[0] for name in names}
+            if len(prefixes) != 1 or len(snapshot.query(model=Density)) != len(names):
+                errors.append(names)
+
+    readers = [threading.Thread(target=read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    try:
+        for materials in versions:
+            manager.replace_materials(materials)
+    finally:
+        done.set()
+        for reader in readers:
+            reader.join()
+    assert errors == []
+    assert list(manager.materials) == [f"49-{j}" for j in range(20)]
@@ -0,0 +1,132 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+from pathlib import Path
+import pickle  # nosec B403
+import shutil
+from unittest.mock import patch
+
+import pytest
+from utilities import summarize_materials
+
+from ansys.materials.manager import MaterialManager
+from ansys.materials.manager.integrations import MatmlCache, MatmlReader
+
+DIR_PATH = Path(__file__).resolve().parent
+XML_FILE_PATH = DIR_PATH.joinpath("..", "data", "steel_eglass_air.xml")
+
+
+@pytest.fixture
+def matml_file(tmp_path):
+    file_path = tmp_path / "library.xml"
+    shutil.copy(XML_FILE_PATH, file_path)
+    return file_path
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_warm_start_skips_parsing(matml_file, tmp_path, lazy):
+    cache = MatmlCache(tmp_path / "cache")
+    expected = MatmlReader(matml_file, lazy=lazy, cache=cache).convert_matml_materials()
+    assert len(list(cache.directory.iterdir())) == 1
+
+    with (
+        patch.object(MatmlReader, "parse_from_file") as parse_mock,
+        patch.object(MatmlReader, "iter_materials") as iter_mock,
+    ):
+        cached = MatmlReader(matml_file, lazy=lazy, cache=cache).convert_matml_materials()
+    parse_mock.assert_not_called()
+    iter_mock.assert_not_called()
+    assert summarize_materials(cached) == summarize_materials(expected)
+
+
+def test_modified_file_invalidates_entry(matml_file, tmp_path):
+    cache = MatmlCache(tmp_path / "cache")
+    key = cache.get_key(matml_file)
+    MatmlReader(matml_file, cache=cache).convert_matml_materials()
+    assert cache.contains(key)
+
+    stat = os.stat(matml_file)
+    os.utime(matml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert cache.get_key(matml_file) != key
+    assert cache.get_key(matml_file, ["Air"]) != cache.get_key(matml_file)
+
+
+def test_selected_materials_are_cached_separately(matml_file, tmp_path):
+    cache = MatmlCache(tmp_path / "cache")
+    MatmlReader(matml_file, cache=cache).convert_matml_materials()
+    materials = MatmlReader(
+        matml_file, material_names=["Air"], cache=cache
+    ).convert_matml_materials()
+    assert list(materials) == ["Air"]
+    assert len(list(cache.directory.iterdir())) == 2
+
+
+def test_invalid_entry_is_discarded(matml_file, tmp_path):
+    cache = MatmlCache(tmp_path / "cache")
+    key = cache.get_key(matml_file)
+    cache.directory.mkdir()
+    cache.directory.joinpath(f"{key}.pkl").write_bytes(b"not a pickle")
+    assert cache.load(key) is None
+    assert not cache.contains(key)
+
+
+@pytest.mark.parametrize(
+    "error",
+    [pickle.PicklingError("unpicklable"), AttributeError("local object"), TypeError("lock")],
+)
+def test_store_failure_is_not_fatal(matml_file, tmp_path, caplog, error):
+    cache = MatmlCache(tmp_path / "cache")
+    expected = MatmlReader(matml_file).convert_matml_materials()
+    with patch("pickle.dump", side_effect=error):
+        converted = MatmlReader(matml_file, cache=cache).convert_matml_materials()
+    assert summarize_materials(converted) == summarize_materials(expected)
+    assert "Could not write the MatML cache entry" in caplog.text
+    assert list(cache.directory.iterdir()) == []
+
+
+def test_eviction_by_total_size(tmp_path):
+    cache = MatmlCache(tmp_path / "cache", max_size=0)
+    cache.store("key", {})
+    assert not cache.contains("key")
+
+    cache = MatmlCache(tmp_path / "cache")
+    for index in range(3):
+        cache.store(f"key{index}", {})
+        os.utime(cache.directory / f"key{index}.pkl", ns=(index, index))
+    entry_size = (cache.directory / "key0.pkl").stat().st_size
+    cache._max_size = 2 * entry_size
+    cache.evict()
+    assert not cache.contains("key0")
+    assert cache.contains("key1") and cache.contains("key2")
+
+    cache.clear()
+    assert list(cache.directory.iterdir()) == []
+
+
+def test_material_manager_read_with_cache(matml_file, tmp_path):
+    cache = MatmlCache(tmp_path / "cache")
+    for _ in range(2):
+        material_manager = MaterialManager()
+        material_manager.read_from_matml(matml_file, cache=cache)
+        assert list(material_manager.materials) == ["Air", "Epoxy E-Glass UD", "Structural Steel"]
+    assert len(list(cache.directory.iterdir())) == 1
@@ -0,0 +1,110 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import xml.etree.ElementTree as ET
+
+from ansys.units import Quantity
+import numpy as np
+
+from ansys.materials.manager.integrations.matml._matml_parser import (
+    MetadataEntry,
+    Parameter,
+    get_quantity,
+    read_metadata,
+)
+
+METADATA = """
+<Metadata>
+  <ParameterDetails id="pa1">
+    <Name>Density</Name>
+    <Units name="Density"><Unit power="-3"><Name>kg m</Name></Unit></Units>
+  </ParameterDetails>
+  <ParameterDetails id="pa2">
+    <Name>Temperature</Name>
+    <Units name="Temperature"><Unit><Name>C</Name></Unit></Units>
+  </ParameterDetails>
+  <ParameterDetails id="pa3">
+    <Name>Reference Temperature</Name>
+    <Units name="Temperature"><Unit><Name>C</Name></Unit></Units>
+  </ParameterDetails>
+  <ParameterDetails id="pa4">
+    <Name>Poisson's Ratio</Name>
+    <Unitless />
+  </ParameterDetails>
+  <ParameterDetails id="pa5">
+    <Name>Custom</Name>
+    <Units name="Custom"><Unit><Name>furlong</Name></Unit></Units>
+  </ParameterDetails>
+  <PropertyDetails id="pr1">
+    <Name>Density</Name>
+    <Unitless />
+  </PropertyDetails>
+</Metadata>
+"""
+
+
+def test_read_metadata_entries():
+    metadata = read_metadata(ET.fromstring(METADATA))
+    assert set(metadata) == {"pa1", "pa2", "pa3", "pa4", "pa5", "pr1"}
+    assert metadata["pa2"] == MetadataEntry(
+        name="Temperature",
+        unit="C",
+        unit_name="Temperature",
+        quantity_unit=metadata["pa2"].quantity_unit,
+    )
+    assert metadata["pa2"].quantity_unit.name == "C"
+    assert metadata["pa4"].unit == "Unitless"
+    assert metadata["pa4"].quantity_unit.name == ""
+    assert metadata["pa5"].quantity_unit is None
+
+
+def test_read_metadata_shares_parsed_units():
+    metadata = read_metadata(ET.fromstring(METADATA))
+    assert metadata["pa2"].quantity_unit is metadata["pa3"].quantity_unit
+    assert metadata["pa4"].quantity_unit is metadata["pr1"].quantity_unit
+    assert metadata["pa2"].unit_name is metadata["pa3"].unit_name
+
+
+def test_get_quantity_matches_quantity_from_unit_string():
+    entry = read_metadata(ET.fromstring(METADATA))["pa2"]
+    parameter = Parameter(
+        name=entry.name,
+        data=np.array([-10.0, 20.0]),
+        qualifiers={},
+        unit=entry.unit,
+        unit_name=entry.unit_name,
+        quantity_unit=entry.quantity_unit,
+    )
+    quantity = get_quantity(parameter)
+    expected = Quantity(value=[-10.0, 20.0], units="C")
+    assert quantity.unit == expected.unit == "C"
+    assert quantity.units == expected.units
+    assert quantity.value.tolist() == expected.value.tolist()
+
+
+def test_get_quantity_without_parsed_unit():
+    parameter = Parameter(
+        name="Ratio", data=0.3, qualifiers={}, unit="Unitless", unit_name="", quantity_unit=None
+    )
+    quantity = get_quantity(parameter)
+    assert quantity.unit == ""
+    assert quantity.value.tolist() == [0.3]
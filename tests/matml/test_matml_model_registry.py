@@ -0,0 +1,40 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import pytest
+
+from ansys.materials.manager.integrations.matml._matml_model_map import get_material_model_class
+from ansys.materials.manager.models import Density, ElasticityIsotropic, ElasticityOrthotropic
+
+
+@pytest.mark.parametrize(
+    "property_set_name, behavior, expected",
+    [
+        ("Density", None, Density),
+        ("Elasticity", "Isotropic", ElasticityIsotropic),
+        ("Elasticity", "Orthotropic", ElasticityOrthotropic),
+        ("Elasticity", None, None),
+        ("Tensile Yield Strength", None, None),
+    ],
+)
+def test_get_material_model_class(property_set_name, behavior, expected):
+    assert get_material_model_class(property_set_name, behavior) is expected
@@ -0,0 +1,62 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import numpy as np
+import pytest
+
+from ansys.materials.manager.integrations.matml._matml_parser import (
+    Parameter,
+    convert,
+    get_data_and_unit,
+)
+
+
+def test_convert_float_list_to_array():
+    values = convert("1.5, 2e3,-4,  5.25", "float")
+    assert isinstance(values, np.ndarray)
+    assert values.dtype == np.float64
+    assert values.tolist() == [1.5, 2000.0, -4.0, 5.25]
+
+
+def test_convert_single_and_empty_values():
+    assert convert("7.5", "float") == 7.5
+    assert convert("  ", "float") == 0.0
+    assert convert("a, b", "string") == "a, b"
+
+
+@pytest.mark.parametrize("data", ["1.0, x, 3.0", "1.0, 2.0,", "1.0,,2.0"])
+def test_convert_invalid_float_list(data):
+    with pytest.raises(ValueError):
+        convert(data, "float")
+
+
+def test_get_data_and_unit_returns_array():
+    parameter = Parameter(name="Density", data=2.5, qualifiers={}, unit="kg m^-3", unit_name="")
+    data, units = get_data_and_unit(parameter)
+    assert isinstance(data, np.ndarray)
+    assert data.tolist() == [2.5]
+    assert units == "kg m^-3"
+
+    array = np.array([1.0, 2.0])
+    parameter.data = array
+    data, _ = get_data_and_unit(parameter)
+    assert data is array
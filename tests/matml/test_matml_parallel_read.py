@@ -0,0 +1,49 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from pathlib import Path
+
+import pytest
+from utilities import summarize_materials
+
+from ansys.materials.manager import MaterialManager
+from ansys.materials.manager.integrations import MatmlReader
+
+DIR_PATH = Path(__file__).resolve().parent
+XML_FILE_PATH = DIR_PATH.joinpath("..", "data", "steel_eglass_air.xml")
+
+
+def test_convert_materials_with_workers():
+    expected = MatmlReader(XML_FILE_PATH).convert_matml_materials()
+    converted = MatmlReader(XML_FILE_PATH, workers=2).convert_matml_materials()
+    assert summarize_materials(converted) == summarize_materials(expected)
+
+
+def test_material_manager_read_with_workers():
+    material_manager = MaterialManager()
+    material_manager.read_from_matml(XML_FILE_PATH, workers=2)
+    assert list(material_manager.materials) == ["Air", "Epoxy E-Glass UD", "Structural Steel"]
+
+
+def test_invalid_number_of_workers():
+    with pytest.raises(ValueError, match="The number of workers must be at least 1, got 0."):
+        MatmlReader(XML_FILE_PATH, workers=0)
@@ -0,0 +1,76 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from ansys.materials.manager import MaterialManager
+from ansys.materials.manager.integrations import MatmlReader
+from ansys.materials.manager.integrations.matml import _matml_parser
+
+DIR_PATH = Path(__file__).resolve().parent
+XML_FILE_PATH = DIR_PATH.joinpath("..", "data", "steel_eglass_air.xml")
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_read_selected_material_names(lazy):
+    materials = MatmlReader(
+        XML_FILE_PATH, lazy=lazy, material_names=["Structural Steel"]
+    ).convert_matml_materials()
+    assert list(materials) == ["Structural Steel"]
+    steel = materials["Structural Steel"]
+    assert steel.mat_id == 1
+    assert steel.guid == "636a7e55-fe81-4d04-9d98-a2cdd31e962a"
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_read_materials_selected_by_predicate(lazy):
+    materials = MatmlReader(
+        XML_FILE_PATH, lazy=lazy, material_names=lambda name: name != "Air"
+    ).convert_matml_materials()
+    assert list(materials) == ["Epoxy E-Glass UD", "Structural Steel"]
+    assert materials["Epoxy E-Glass UD"].guid == "a1f2e775-77fe-4ad6-a822-54d353e0ea0e"
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_skipped_materials_are_not_read(lazy):
+    read_property_sets = _matml_parser.read_property_sets_and_parameters
+    with (
+        patch.object(
+            _matml_parser, "read_property_sets_and_parameters", wraps=read_property_sets
+        ) as parser_mock,
+        patch(
+            "ansys.materials.manager.integrations.matml.matml_reader."
+            "read_property_sets_and_parameters",
+            parser_mock,
+        ),
+    ):
+        MatmlReader(XML_FILE_PATH, lazy=lazy, material_names=["Air"]).convert_matml_materials()
+    assert parser_mock.call_count == 1
+
+
+def test_material_manager_read_selected_materials():
+    material_manager = MaterialManager()
+    material_manager.read_from_matml(XML_FILE_PATH, material_names=["Air", "Unknown"])
+    assert list(material_manager.materials) == ["Air"]
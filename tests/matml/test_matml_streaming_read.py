@@ -0,0 +1,75 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from pathlib import Path
+
+import pytest
+from utilities import summarize_materials
+
+from ansys.materials.manager.integrations import MatmlReader
+
+DIR_PATH = Path(__file__).resolve().parent
+DATA_PATH = DIR_PATH.joinpath("..", "data")
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    [
+        "steel_eglass_air.xml",
+        "matml_unittest_density.xml",
+        "matml_unittest_multilinear_isotropic_hardening.xml",
+        "matml_unittest_usermat.xml",
+    ],
+)
+def test_iter_materials_matches_eager_conversion(file_name):
+    file_path = DATA_PATH.joinpath(file_name)
+    expected = MatmlReader(file_path).convert_matml_materials()
+    streamed = list(MatmlReader(file_path, lazy=True).iter_materials())
+    assert len(streamed) == len(expected)
+    assert summarize_materials(
+        {material.name: material for material in streamed}, guids=False
+    ) == summarize_materials(expected, guids=False)
+
+
+def test_iter_materials_is_lazy():
+    reader = MatmlReader(DATA_PATH.joinpath("steel_eglass_air.xml"), lazy=True)
+    materials = reader.iter_materials()
+    first = next(materials)
+    assert first.name == "Air"
+    assert first.mat_id == 1
+    assert first.guid == "370e7536-77c0-11ed-8eeb-6c6a77744180"
+    assert [material.name for material in materials] == ["Epoxy E-Glass UD", "Structural Steel"]
+
+
+def test_lazy_reader_convert_matml_materials():
+    file_path = DATA_PATH.joinpath("steel_eglass_air.xml")
+    materials = MatmlReader(file_path, lazy=True).convert_matml_materials()
+    assert list(materials) == ["Air", "Epoxy E-Glass UD", "Structural Steel"]
+
+
+def test_iter_materials_without_metadata(tmp_path):
+    file_path = tmp_path / "no_metadata.xml"
+    file_path.write_text(
+        "<EngineeringData><Materials><MatML_Doc></MatML_Doc></Materials></EngineeringData>"
+    )
+    with pytest.raises(RuntimeError, match="Metadata node not found"):
+        list(MatmlReader(file_path, lazy=True).iter_materials())
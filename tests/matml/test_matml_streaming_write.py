@@ -0,0 +1,74 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from pathlib import Path
+
+import pytest
+
+from ansys.materials.manager import MaterialManager
+from ansys.materials.manager.integrations import MatmlReader, MatmlWriter
+
+DIR_PATH = Path(__file__).resolve().parent
+XML_FILE_PATH = DIR_PATH.joinpath("..", "data", "steel_eglass_air.xml")
+
+
+@pytest.fixture
+def materials():
+    materials = list(MatmlReader(XML_FILE_PATH).convert_matml_materials().values())
+    materials[0].name = "Air & <gas> é"
+    return materials
+
+
+@pytest.mark.parametrize("indent", [False, True])
+@pytest.mark.parametrize("xml_declaration", [False, True])
+def test_stream_write_matches_tree_write(materials, tmp_path, indent, xml_declaration):
+    expected_path = tmp_path / "expected.xml"
+    streamed_path = tmp_path / "streamed.xml"
+    MatmlWriter(materials).write(expected_path, indent=indent, xml_declaration=xml_declaration)
+    MatmlWriter(materials, stream=True).write(
+        streamed_path, indent=indent, xml_declaration=xml_declaration
+    )
+    assert streamed_path.read_bytes() == expected_path.read_bytes()
+
+
+def test_stream_write_without_transfer_ids(materials, tmp_path):
+    for material in materials:
+        material.guid = None
+    expected_path = tmp_path / "expected.xml"
+    streamed_path = tmp_path / "streamed.xml"
+    MatmlWriter(materials).write(expected_path, indent=True)
+    MatmlWriter(materials, stream=True).write(streamed_path, indent=True)
+    assert b"ANSYSWBTransferData" not in streamed_path.read_bytes()
+    assert streamed_path.read_bytes() == expected_path.read_bytes()
+
+
+def test_stream_write_does_not_visit_on_construction(materials):
+    writer = MatmlWriter(materials, stream=True)
+    assert all(models == [] for models in writer._material_repr.values())
+
+
+def test_material_manager_stream_write(tmp_path):
+    material_manager = MaterialManager()
+    material_manager.read_from_matml(XML_FILE_PATH)
+    material_manager.write_to_matml(tmp_path / "expected.xml")
+    material_manager.write_to_matml(tmp_path / "streamed.xml", stream=True)
+    assert (tmp_path / "streamed.xml").read_bytes() == (tmp_path / "expected.xml").read_bytes()
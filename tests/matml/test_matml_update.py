@@ -0,0 +1,182 @@
+# Copyright (C) 2022 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from pathlib import Path
+import re
+import shutil
+from unittest.mock import patch
+
+from ansys.units import Quantity
+import pytest
+from utilities import summarize_materials
+
+from ansys.materials.manager import MaterialManager
+from ansys.materials.manager.integrations import MatmlReader, MatmlWriter
+from ansys.materials.manager.integrations.matml import matml_writer
+from ansys.materials.manager.integrations.matml._matml_update import scan_matml_layout
+
+DIR_PATH = Path(__file__).resolve().parent
+XML_FILE_PATH = DIR_PATH.joinpath("..", "data", "steel_eglass_air.xml")
+HILL_YIELD_XML_FILE_PATH = DIR_PATH.joinpath("..", "data", "matml_unittest_hill_yield.xml")
+
+
+@pytest.fixture
+def materials():
+    return MatmlReader(XML_FILE_PATH).convert_matml_materials()
+
+
+def _read_back(materials, path):
+    MatmlWriter(list(materials.values())).write(path, indent=True)
+    return MatmlReader(path).convert_matml_materials()
+
+
+def _set_density(material, value):
+    material.get_model_by_name("Density").density = Quantity(value=[value], units="kg m^-3")
+
+
+def _strip_hashes(content):
+    return re.sub(rb' contenthash="[0-9a-f]+"', b"", content)
+
+
+def test_update_without_changes_keeps_file(materials, tmp_path):
+    path = tmp_path / "library.xml"
+    MatmlWriter(list(materials.values())).write(path, indent=True)
+    content = path.read_bytes()
+    assert MatmlWriter(list(materials.values())).update(path, indent=True) == []
+    assert path.read_bytes() == content
+
+
+@pytest.mark.parametrize("indent", [False, True])
+def test_update_changed_material(materials, tmp_path, indent):
+    path = tmp_path / "library.xml"
+    MatmlWriter(list(materials.values())).write(path, indent=indent)
+    _set_density(materials["Structural Steel"], 7900.0)
+
+    updated = MatmlWriter(list(materials.values()), stream=True).update(path, indent=indent)
+
+    assert updated == ["Structural Steel"]
+    expected_path = tmp_path / "expected.xml"
+    MatmlWriter(list(materials.values())).write(expected_path, indent=indent)
+    assert _strip_hashes(path.read_bytes()) == expected_path.read_bytes()
+    assert list(scan_matml_layout(path).material_hashes) == list(materials)
+
+
+def test_update_visits_only_changed_materials(materials, tmp_path):
+    path = tmp_path / "library.xml"
+    MatmlWriter(list(materials.values())).write(path, indent=True)
+    _set_density(materials["Structural Steel"], 7900.0)
+    MatmlWriter(list(materials.values())).update(path, indent=True)
+    _set_density(materials["Air"], 1.2)
+
+    with (
+        patch.object(
+            MatmlWriter,
+            "_get_material_element",
+            autospec=True,
+            side_effect=MatmlWriter._get_material_element,
+        ) as build,
+        patch.object(matml_writer, "get_content_hash") as compare,
+    ):
+        assert MatmlWriter(list(materials.values())).update(path, indent=True) == ["Air"]
+    assert [call.args[1] for call in build.call_args_list] == ["Air"]
+    compare.assert_not_called()
+
+    expected_path = tmp_path / "expected.xml"
+    MatmlWriter(list(materials.values())).write(expected_path, indent=True)
+    assert _strip_hashes(path.read_bytes()) == expected_path.read_bytes()
+
+
+def test_update_subset_keeps_other_materials(materials, tmp_path):
+    path = tmp_path / "library.xml"
+    MatmlWriter(list(materials.values())).write(path, indent=True)
+    layout = scan_matml_layout(path)
+    air_start, air_end = layout.materials["Air"]
+    air = path.read_bytes()[air_start:air_end]
+    _set_density(materials["Structural Steel"], 7900.0)
+
+    assert MatmlWriter([materials["Structural Steel"]]).update(path, indent=True) == [
+        "Structural Steel"
+    ]
+
+    layout = scan_matml_layout(path)
+    air_start, air_end = layout.materials["Air"]
+    assert path.read_bytes()[air_start:air_end] == air
+    read_materials = MatmlReader(path).convert_matml_materials()
+    expected = _read_back(materials, tmp_path / "expected.xml")
+    assert summarize_materials(read_materials, ids=False, guids=False) == summarize_materials(
+        expected, ids=False, guids=False
+    )
+
+
+def test_update_adds_material_and_metadata(materials, tmp_path):
+    path = tmp_path / "library.xml"
+    MatmlWriter(list(materials.values())).write(path, indent=True)
+    new_materials = MatmlReader(HILL_YIELD_XML_FILE_PATH).convert_matml_materials()
+
+    updated = MatmlWriter(list(new_materials.values())).update(path, indent=True)
+
+    assert updated == list(new_materials)
+    read_materials = MatmlReader(path).convert_matml_materials()
+    assert list(read_materials) == list(materials) + list(new_materials)
+    expected = _read_back(materials | new_materials, tmp_path / "expected.xml")
+    assert summarize_materials(read_materials, ids=False, guids=False) == summarize_materials(
+        expected, ids=False, guids=False
+    )
+    ids = [
+        line.split('"')[1]
+        for line in path.read_text().splitlines()
+        if "<PropertyDetails" in line or "<ParameterDetails" in line
+    ]
+    assert len(ids) == len(set(ids))
+
+
+def test_update_workbench_file(materials, tmp_path):
+    path = tmp_path / "library.xml"
+    shutil.copy(XML_FILE_PATH, path)
+    original = path.read_bytes()
+    steel = materials["Structural Steel"]
+    _set_density(steel, 7900.0)
+    steel.guid = "00000000-0000-0000-0000-000000000000"
+
+    assert MatmlWriter([steel]).update(path, indent=True) == ["Structural Steel"]
+
+    read_materials = MatmlReader(path).convert_matml_materials()
+    assert read_materials["Structural Steel"].guid == steel.guid
+    assert read_materials["Structural Steel"].get_model_by_name("Density").density.value == [7900.0]
+    unchanged = ["Air", "Epoxy E-Glass UD"]
+    assert summarize_materials(
+        {name: read_materials[name] for name in unchanged}, ids=False, guids=False
+    ) == summarize_materials({name: materials[name] for name in unchanged}, ids=False, guids=False)
+    assert path.read_bytes().startswith(original[: scan_matml_layout(path).materials["Air"][1]])
+
+
+def test_material_manager_update(tmp_path):
+    path = tmp_path / "library.xml"
+    material_manager = MaterialManager()
+    material_manager.read_from_matml(XML_FILE_PATH)
+    material_manager.write_to_matml(path)
+    _set_density(material_manager.materials["Air"], 1.2)
+    material_manager.write_to_matml(path, material_names=["Air"], update=True)
+
+    expected_path = tmp_path / "expected.xml"
+    material_manager.write_to_matml(expected_path)
+    assert _strip_hashes(path.read_bytes()) == expected_path.read_bytes()
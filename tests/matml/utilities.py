@@ -35,3 +35,21 @@ def get_material_and_metadata_from_xml(tree: ET.ElementTree) -> tuple[str, str]:
     metadata_string = xml.dom.minidom.parseString(metadata_string)
     metadata_string = metadata_string.toprettyxml(indent="  ").strip()
     return material_string, metadata_string
+
+
+def summarize_materials(materials: dict, ids: bool = True, guids: bool = True) -> list[tuple]:
+    """
+    Summarize converted materials as comparable names, IDs, GUIDs and model dumps.
+
+    The IDs and GUIDs can be left out, for materials whose IDs or GUIDs are generated
+    when they are read.
+    """
+    return [
+        (
+            name,
+            material.mat_id if ids else None,
+            material.guid if guids else None,
+            [repr(model.model_dump()) for model in material.models],
+        )
+        for name, material in materials.items()
+    ]